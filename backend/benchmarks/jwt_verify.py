@@ -0,0 +1,44 @@
+import argparse
+import timeit
+from types import SimpleNamespace
+
+from src.application.services.jwt import JWTServiceImpl
+from src.config import JWT
+
+
+def make_service() -> JWTServiceImpl:
+    jwt_config: JWT = JWT(
+        JWT_SECRET_KEY='benchmark-secret',
+        REFRESH_SECRET_KEY='benchmark-refresh-secret',
+        ALGORITHM='HS256',
+        ACCESS_TOKEN_EXPIRE_MINUTES=15,
+        REFRESH_TOKEN_EXPIRE_DAYS=15,
+    )
+    return JWTServiceImpl(config=SimpleNamespace(jwt=jwt_config))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='JWT verification micro-benchmark')
+    parser.add_argument('--number', type=int, default=20_000)
+    args = parser.parse_args()
+
+    service: JWTServiceImpl = make_service()
+    access_token, _ = service.create_tokens(data={'sub': '123456789'})
+
+    uncached: float = timeit.timeit(
+        lambda: service._verify_token(
+            access_token, 'access', service.config.jwt.secret_key
+        ),
+        number=args.number,
+    )
+    cached: float = timeit.timeit(
+        lambda: service.verify_access_token(access_token), number=args.number
+    )
+
+    print(f'jose.jwt.decode:      {uncached / args.number * 1e6:8.2f} us/op')
+    print(f'verified-token cache: {cached / args.number * 1e6:8.2f} us/op')
+    print(f'speedup:              {uncached / cached:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
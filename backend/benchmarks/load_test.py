@@ -0,0 +1,423 @@
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import subprocess
+import time
+from collections import Counter
+from collections.abc import AsyncIterable, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import asyncpg
+import httpx
+import orjson
+from dishka import AsyncContainer, Provider, Scope, make_async_container, provide
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
+from prometheus_client import REGISTRY
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.application.services.jwt import JWTServiceImpl
+from src.config import Config
+from src.const import MOSCOW_TZ
+from src.domain.bot.entity import BotEntity, BotRentalEntity
+from src.domain.user.entity import Role, UserEntity
+from src.infrastructure.cache.base import BaseCacheService
+from src.infrastructure.cache.redis import InstrumentedConnectionPool, RedisCacheService
+from src.infrastructure.database.models import (  # noqa: F401
+    blocked_users,
+    payments,
+    referrals,
+    telegram_users,
+)
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.bots import Bot, BotRental
+from src.infrastructure.database.models.user import User
+from src.infrastructure.database.postgresql import new_session_maker
+from src.infrastructure.taskiq.broker import BROKERS
+from src.ioc import AppProvider
+from src.main import create_app
+from taskiq import InMemoryBroker
+from taskiq.message import BrokerMessage
+
+ADMIN_TELEGRAM_ID: int = 1
+FIRST_USER_TELEGRAM_ID: int = 1_000_000
+# balance хранится в INTEGER.
+USER_BALANCE: int = 10**9
+BOT_PRICE: int = 100
+
+
+class RecordingBroker(InMemoryBroker):
+    # Задачи только учитываются: выполнять их в бенчмарке значит слать
+    # сообщения в Telegram.
+    def __init__(self) -> None:
+        super().__init__()
+        self.kicked: Counter[str] = Counter()
+
+    async def kick(self, message: BrokerMessage) -> None:
+        self.kicked[message.task_name] += 1
+
+
+class BenchmarkProvider(Provider):
+    def __init__(self, redis_server: FakeServer) -> None:
+        super().__init__()
+        self._redis_server = redis_server
+
+    @provide(scope=Scope.APP)
+    async def get_cache_service(self) -> AsyncIterable[BaseCacheService]:
+        pool = InstrumentedConnectionPool(
+            connection_class=FakeConnection,
+            server=self._redis_server,
+            max_connections=100,
+            decode_responses=True,
+        )
+        cache_service = RedisCacheService(pool=pool)
+        yield cache_service
+        await cache_service.close()
+
+
+@dataclass
+class Fixture:
+    client: httpx.AsyncClient
+    user_tokens: list[str]
+    admin_token: str
+    bot_ids: list[int]
+
+    def user_cookie(self, i: int) -> dict[str, str]:
+        return {'Cookie': f'access_token={self.user_tokens[i % len(self.user_tokens)]}'}
+
+    def admin_cookie(self) -> dict[str, str]:
+        return {'Cookie': f'access_token={self.admin_token}'}
+
+    def bot_id(self, i: int) -> int:
+        return self.bot_ids[i % len(self.bot_ids)]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    handler: str
+    send: Callable[[Fixture, int], Awaitable[httpx.Response]]
+
+
+SCENARIOS: dict[str, Scenario] = {
+    'current_user': Scenario(
+        handler='/api/v1/users/profile',
+        send=lambda f, i: f.client.get(
+            '/api/v1/users/profile', headers=f.user_cookie(i)
+        ),
+    ),
+    'bots': Scenario(
+        handler='/api/v1/bots',
+        send=lambda f, i: f.client.get('/api/v1/bots', headers=f.user_cookie(i)),
+    ),
+    'rent': Scenario(
+        handler='/api/v1/rentals/{bot_id}',
+        send=lambda f, i: f.client.post(
+            f'/api/v1/rentals/{f.bot_id(i)}',
+            headers=f.user_cookie(i),
+            json={'token': f'{i}:benchmark', 'months': 1},
+        ),
+    ),
+    'my_rentals': Scenario(
+        handler='/api/v1/users/profile/rentals',
+        send=lambda f, i: f.client.get(
+            '/api/v1/users/profile/rentals', headers=f.user_cookie(i)
+        ),
+    ),
+    'admin_users': Scenario(
+        handler='/api/v1/users',
+        send=lambda f, i: f.client.get(
+            '/api/v1/users', params={'limit': 50}, headers=f.admin_cookie()
+        ),
+    ),
+    'admin_bots_rentals': Scenario(
+        handler='/api/v1/bots/rentals',
+        send=lambda f, i: f.client.get(
+            '/api/v1/bots/rentals', headers=f.admin_cookie()
+        ),
+    ),
+}
+
+
+async def recreate_database(config: Config, database: str) -> None:
+    # Бенчмарк работает в отдельной базе рядом с основной, чтобы не трогать
+    # данные из POSTGRES_DB.
+    connection = await asyncpg.connect(
+        host=config.postgres.host,
+        port=config.postgres.port,
+        user=config.postgres.login,
+        password=config.postgres.password,
+        database=config.postgres.database,
+    )
+    try:
+        await connection.execute(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)')
+        await connection.execute(f'CREATE DATABASE "{database}"')
+    finally:
+        await connection.close()
+
+
+async def seed(config: Config, args: argparse.Namespace) -> list[int]:
+    session_maker = new_session_maker(config.postgres)
+    engine: AsyncEngine = session_maker.kw['bind']
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    rented_until: datetime = datetime.now(tz=MOSCOW_TZ) + timedelta(days=30)
+
+    async with session_maker() as session:
+        admin: UserEntity = UserEntity.create_user(telegram_id=ADMIN_TELEGRAM_ID)
+        admin.role = Role.ADMIN
+        session.add(User.from_entity(admin))
+
+        bots: list[Bot] = [
+            Bot.from_entity(
+                BotEntity.create_bot(
+                    name=f'Benchmark bot {n}',
+                    description='Бот для нагрузочного теста',
+                    price=BOT_PRICE,
+                )
+            )
+            for n in range(args.bots)
+        ]
+        users: list[User] = []
+        for n in range(args.users):
+            user: UserEntity = UserEntity.create_user(
+                telegram_id=FIRST_USER_TELEGRAM_ID + n
+            )
+            user.deposit(amount=USER_BALANCE)
+            users.append(User.from_entity(user))
+
+        session.add_all([*bots, *users])
+        await session.flush()
+
+        for n, user in enumerate(users):
+            for k in range(args.rentals_per_user):
+                bot: Bot = bots[(n + k) % len(bots)]
+                session.add(
+                    BotRental.from_entity(
+                        BotRentalEntity.create_rental(
+                            user_id=user.id,
+                            bot_id=bot.id,
+                            token=f'{n}-{k}:seed',
+                            rented_until=rented_until,
+                            user=None,
+                            bot=None,
+                        )
+                    )
+                )
+
+        bot_ids: list[int] = [bot.id for bot in bots]
+        await session.commit()
+
+    await engine.dispose()
+    return bot_ids
+
+
+def statements_sample(handler: str) -> tuple[float, float]:
+    labels: dict[str, str] = {'handler': handler}
+    return (
+        REGISTRY.get_sample_value('db_queries_per_request_sum', labels) or 0.0,
+        REGISTRY.get_sample_value('db_queries_per_request_count', labels) or 0.0,
+    )
+
+
+def percentile(quantiles: list[float], p: int) -> float:
+    return round(quantiles[p - 1] * 1000, 3)
+
+
+async def run_scenario(
+    name: str,
+    scenario: Scenario,
+    fixture: Fixture,
+    recorder: RecordingBroker,
+    args: argparse.Namespace,
+) -> dict:
+    counter = itertools.count()
+    latencies: list[float] = []
+    statuses: Counter[int] = Counter()
+
+    async def worker(total: int, measure: bool) -> None:
+        while (i := next(counter)) < total:
+            started: float = time.perf_counter()
+            response: httpx.Response = await scenario.send(fixture, i)
+            if measure:
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] += 1
+
+    await asyncio.gather(*(worker(args.warmup, False) for _ in range(args.concurrency)))
+
+    counter = itertools.count()
+    statements_before: tuple[float, float] = statements_sample(scenario.handler)
+    kicked_before: int = sum(recorder.kicked.values())
+    started: float = time.perf_counter()
+    await asyncio.gather(
+        *(worker(args.requests, True) for _ in range(args.concurrency))
+    )
+    elapsed: float = time.perf_counter() - started
+    statements_after: tuple[float, float] = statements_sample(scenario.handler)
+
+    quantiles: list[float] = statistics.quantiles(latencies, n=100)
+    observed: float = statements_after[1] - statements_before[1]
+    errors: int = sum(
+        count for status_code, count in statuses.items() if status_code >= 400
+    )
+    result: dict = {
+        'requests': len(latencies),
+        'errors': errors,
+        'statuses': {str(code): count for code, count in sorted(statuses.items())},
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'latency_ms': {
+            'p50': percentile(quantiles, 50),
+            'p95': percentile(quantiles, 95),
+            'p99': percentile(quantiles, 99),
+            'max': round(max(latencies) * 1000, 3),
+        },
+        'sql_per_request': round(
+            (statements_after[0] - statements_before[0]) / observed, 2
+        )
+        if observed
+        else None,
+        'tasks_kicked': sum(recorder.kicked.values()) - kicked_before,
+    }
+
+    print(
+        f'{name:<20} {result["throughput_rps"]:9.1f} req/s  '
+        f'p50 {result["latency_ms"]["p50"]:8.2f}  '
+        f'p95 {result["latency_ms"]["p95"]:8.2f}  '
+        f'p99 {result["latency_ms"]["p99"]:8.2f} ms  '
+        f'sql/req {result["sql_per_request"]}  errors {errors}'
+    )
+    return result
+
+
+def current_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict, current: dict) -> None:
+    print(f'\nbaseline {baseline.get("commit")} -> current {current.get("commit")}')
+
+    for name, result in current['scenarios'].items():
+        before: dict | None = baseline['scenarios'].get(name)
+        if before is None:
+            continue
+
+        deltas: list[str] = []
+        for label, old, new in (
+            ('rps', before['throughput_rps'], result['throughput_rps']),
+            ('p50', before['latency_ms']['p50'], result['latency_ms']['p50']),
+            ('p99', before['latency_ms']['p99'], result['latency_ms']['p99']),
+            ('sql', before['sql_per_request'], result['sql_per_request']),
+        ):
+            if old and new is not None:
+                deltas.append(f'{label} {(new - old) / old * 100:+6.1f}%')
+        print(f'{name:<20} ' + '  '.join(deltas))
+
+
+async def run(args: argparse.Namespace) -> dict:
+    # Реплика в бенчмарке не участвует: все запросы идут в одну базу.
+    os.environ.pop('POSTGRES_REPLICA_DSN', None)
+    database: str = f'{Config().postgres.database}_benchmark'
+    await recreate_database(Config(), database)
+    os.environ['POSTGRES_DB'] = database
+    config: Config = Config()
+
+    bot_ids: list[int] = await seed(config, args)
+
+    recorder = RecordingBroker()
+    for item in BROKERS:
+        for task in item.get_all_tasks().values():
+            task.broker = recorder
+
+    app = create_app()
+    await app.state.dishka_container.close()
+    container: AsyncContainer = make_async_container(
+        AppProvider(), BenchmarkProvider(FakeServer()), context={Config: config}
+    )
+    app.state.dishka_container = container
+
+    jwt_service = JWTServiceImpl(config=config)
+    user_tokens: list[str] = [
+        jwt_service.create_tokens(data={'sub': str(FIRST_USER_TELEGRAM_ID + n)})[0]
+        for n in range(args.users)
+    ]
+    admin_token, _ = jwt_service.create_tokens(data={'sub': str(ADMIN_TELEGRAM_ID)})
+
+    selected: list[str] = args.scenarios or list(SCENARIOS)
+    results: dict[str, dict] = {}
+
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url='http://benchmark'
+        ) as client:
+            fixture = Fixture(
+                client=client,
+                user_tokens=user_tokens,
+                admin_token=admin_token,
+                bot_ids=bot_ids,
+            )
+            for name in selected:
+                results[name] = await run_scenario(
+                    name, SCENARIOS[name], fixture, recorder, args
+                )
+    finally:
+        await container.close()
+
+    return {
+        'commit': current_commit(),
+        'created_at': datetime.now(tz=MOSCOW_TZ).isoformat(),
+        'params': {
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'concurrency': args.concurrency,
+            'users': args.users,
+            'bots': args.bots,
+            'rentals_per_user': args.rentals_per_user,
+        },
+        'scenarios': results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='End-to-end load test of the API hot paths against '
+        'local Postgres, fakeredis and an in-memory taskiq broker'
+    )
+    parser.add_argument(
+        'scenarios', nargs='*', metavar='scenario', help=', '.join(SCENARIOS)
+    )
+    parser.add_argument('--requests', type=int, default=2_000)
+    parser.add_argument('--warmup', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--bots', type=int, default=20)
+    parser.add_argument('--rentals-per-user', type=int, default=3)
+    parser.add_argument('--output', help='save results as a JSON baseline')
+    parser.add_argument('--baseline', help='JSON baseline to compare against')
+    args = parser.parse_args()
+
+    unknown: set[str] = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(sorted(unknown))}')
+
+    result: dict = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, 'wb') as file:
+            file.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    if args.baseline:
+        with open(args.baseline, 'rb') as file:
+            compare(orjson.loads(file.read()), result)
+
+
+if __name__ == '__main__':
+    main()
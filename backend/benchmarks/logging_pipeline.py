@@ -0,0 +1,145 @@
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.config import LoggingConfig
+from src.const import MOSCOW_TZ
+from src.domain.bot.entity import BotEntity, BotRentalEntity
+from src.domain.user.entity import UserEntity
+from src.logger import setup_logger, shutdown_logger
+
+logger = logging.getLogger('src.infrastructure.repositories.benchmark')
+
+TEXT_FORMAT: str = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+class SlowStream:
+    # Вывод в stdout контейнера блокируется, когда драйвер логов не успевает
+    # забирать данные; задержка записи имитирует такой pipe.
+    def __init__(self, write_latency: float) -> None:
+        self._write_latency = write_latency
+        self.lines: int = 0
+
+    def write(self, data: str) -> int:
+        if self._write_latency:
+            time.sleep(self._write_latency)
+        self.lines += 1
+        return len(data)
+
+    def flush(self) -> None: ...
+
+
+def make_rental(history: int) -> BotRentalEntity:
+    bot: BotEntity = BotEntity.create_bot(
+        name='Benchmark bot', description='Бот для замера логирования' * 5, price=500
+    )
+    bot.id = 1
+    user: UserEntity = UserEntity.create_user(telegram_id=123456789)
+    user.id = 1
+    rented_until: datetime = datetime.now(tz=MOSCOW_TZ) + timedelta(days=30)
+
+    for _ in range(history):
+        user.add_rental(
+            BotRentalEntity.create_rental(
+                user_id=user.id,
+                bot_id=bot.id,
+                token='123456:' + 'x' * 35,
+                rented_until=rented_until,
+                user=None,
+                bot=bot,
+            )
+        )
+
+    rental = BotRentalEntity.create_rental(
+        user_id=user.id,
+        bot_id=bot.id,
+        token='123456:' + 'x' * 35,
+        rented_until=rented_until,
+        user=user,
+        bot=bot,
+    )
+    rental.id = 1
+    return rental
+
+
+async def rent(rental: BotRentalEntity) -> None:
+    # Одни и те же записи идут через оба обработчика: сравнивается только
+    # схема вывода.
+    await asyncio.sleep(0)
+    logger.info('Найден пользователь с telegram_id=%s', rental.user_id)
+    logger.info('Баланс пользователя %s изменен на %s', rental.user_id, -500)
+    await asyncio.sleep(0)
+    logger.info(
+        'Добавлена аренда: id=%s user_id=%s bot_id=%s',
+        rental.id,
+        rental.user_id,
+        rental.bot_id,
+    )
+
+
+async def measure(rental: BotRentalEntity, args: argparse.Namespace) -> list[float]:
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            started: float = time.perf_counter()
+            await rent(rental)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one() for _ in range(args.requests)))
+    return latencies
+
+
+def report(name: str, latencies: list[float], elapsed: float) -> None:
+    latencies.sort()
+    p99: float = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f'{name:<24} p50 {statistics.median(latencies) * 1e6:8.1f} us  '
+        f'p99 {p99 * 1e6:8.1f} us  {len(latencies) / elapsed:9.0f} req/s'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Logging overhead on the rent path: sync handler vs queue'
+    )
+    parser.add_argument('--requests', type=int, default=5_000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--history', type=int, default=20)
+    parser.add_argument('--write-latency', type=float, default=0.0002)
+    args = parser.parse_args()
+
+    rental: BotRentalEntity = make_rental(args.history)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+
+    # Прежняя схема: StreamHandler пишет прямо из event loop.
+    stream = SlowStream(args.write_latency)
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    root.addHandler(handler)
+    started: float = time.perf_counter()
+    latencies: list[float] = asyncio.run(measure(rental, args))
+    report('sync handler', latencies, time.perf_counter() - started)
+    root.removeHandler(handler)
+
+    # Новая схема: запись уходит в очередь, вывод в отдельном потоке.
+    stdout, sys.stdout = sys.stdout, SlowStream(args.write_latency)
+    try:
+        setup_logger(LoggingConfig(LOG_FORMAT='text'))
+        started = time.perf_counter()
+        latencies = asyncio.run(measure(rental, args))
+        elapsed: float = time.perf_counter() - started
+        shutdown_logger()
+    finally:
+        sys.stdout = stdout
+    report('queue handler', latencies, elapsed)
+
+
+if __name__ == '__main__':
+    main()
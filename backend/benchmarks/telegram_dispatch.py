@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import time
+
+from aiohttp import web
+from redis.asyncio import Redis
+from src.config import TelegramConfig
+from src.infrastructure.cache.token_bucket import RedisTokenBucket
+from src.infrastructure.telegram.bot import new_telegram_bot
+from src.infrastructure.telegram.dispatcher import TelegramSendDispatcher
+
+TOKEN: str = '123456:benchmark'
+
+
+def make_fake_telegram_app(latency: float) -> web.Application:
+    async def send_message(request: web.Request) -> web.Response:
+        data = await request.post()
+        await asyncio.sleep(latency)
+        return web.json_response(
+            {
+                'ok': True,
+                'result': {
+                    'message_id': 1,
+                    'date': int(time.time()),
+                    'chat': {'id': int(data['chat_id']), 'type': 'private'},
+                    'text': data['text'],
+                },
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post(f'/bot{TOKEN}/sendMessage', send_message)
+    return app
+
+
+async def run(args: argparse.Namespace) -> None:
+    runner = web.AppRunner(make_fake_telegram_app(args.latency))
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', args.port)
+    await site.start()
+
+    config: TelegramConfig = TelegramConfig(
+        TELEGRAM_TOKEN_BOT=TOKEN,
+        TELEGRAM_API_URL=f'http://127.0.0.1:{args.port}',
+        TELEGRAM_CONNECTION_LIMIT=args.concurrency,
+    )
+    bot = new_telegram_bot(config)
+    redis: Redis = Redis.from_url(args.redis_url)
+    rate_limiter = RedisTokenBucket(
+        _client=redis, key='benchmark:rate-limit', rate=args.rate, capacity=args.rate
+    )
+    await redis.delete(rate_limiter.key)
+    chat_ids: list[int] = list(range(1, args.messages + 1))
+
+    try:
+        started: float = time.perf_counter()
+        for chat_id in chat_ids:
+            await bot.send_message(chat_id=chat_id, text='benchmark')
+        sequential: float = time.perf_counter() - started
+
+        sender = TelegramSendDispatcher(
+            _bot=bot, _rate_limiter=rate_limiter, concurrency=args.concurrency
+        )
+        started = time.perf_counter()
+        results: list[bool] = await asyncio.gather(
+            *(
+                sender.send_message(chat_id=chat_id, text='benchmark')
+                for chat_id in chat_ids
+            )
+        )
+        dispatched: float = time.perf_counter() - started
+    finally:
+        await bot.session.close()
+        await redis.aclose()
+        await runner.cleanup()
+
+    print(f'messages:   {args.messages}, latency {args.latency * 1000:.0f} ms')
+    print(f'sequential: {args.messages / sequential:8.1f} msg/s')
+    print(
+        f'dispatcher: {args.messages / dispatched:8.1f} msg/s '
+        f'(concurrency {args.concurrency}, delivered {sum(results)})'
+    )
+    print(f'speedup:    {sequential / dispatched:8.1f}x')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Throughput of Telegram sends against a local fake Bot API'
+    )
+    parser.add_argument('--messages', type=int, default=500)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--rate', type=float, default=10_000.0)
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--redis-url', default='redis://localhost:6379/15')
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
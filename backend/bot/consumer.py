@@ -0,0 +1,51 @@
+import asyncio
+import logging
+
+import aio_pika
+from aiogram import Bot, Dispatcher
+from dishka import AsyncContainer, make_async_container
+from src.config import BotConfig, Config
+
+from .dispatcher import setup_dispatcher
+from .ioc import BotProvider
+from .update_queue import UpdateConsumer, declare_partitions, owned_partitions
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    config: Config = Config()
+    bot_config: BotConfig = config.bot
+    partitions: list[int] = owned_partitions(
+        partitions=bot_config.update_partitions,
+        worker_index=bot_config.update_worker_index,
+        workers=bot_config.update_workers,
+    )
+
+    bot_container: AsyncContainer = make_async_container(
+        BotProvider(), context={Config: config}
+    )
+    dp: Dispatcher = await bot_container.get(Dispatcher)
+    bot: Bot = await bot_container.get(Bot)
+    await setup_dispatcher(dp=dp, container=bot_container)
+
+    connection = await aio_pika.connect_robust(config.rabbitmq.url)
+    await dp.emit_startup(bot=bot)
+
+    try:
+        channel = await connection.channel()
+        await channel.set_qos(prefetch_count=1)
+        _, queues = await declare_partitions(channel, bot_config.update_partitions)
+        consumer = UpdateConsumer(_dispatcher=dp, _bot=bot)
+
+        logger.info('Воркер обновлений слушает партиции: %s', partitions)
+        await asyncio.gather(*(consumer.consume(queues[p]) for p in partitions))
+    finally:
+        await dp.emit_shutdown(bot=bot)
+        await connection.close()
+        await bot.session.close()
+        await bot_container.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+import logging
+
+from aiogram import Dispatcher
+from dishka import AsyncContainer
+from dishka.integrations.aiogram import setup_dishka
+from src.infrastructure.taskiq.broker import shutdown_brokers, startup_brokers
+from src.logger import setup_logger, shutdown_logger
+
+from .handlers.admins.handlers import router as admins_router
+from .handlers.users.handlers import router as users_router
+from .middleware import UserCheckMiddleware
+from .throttling import ThrottlingMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+async def on_startup() -> None:
+    setup_logger()
+    logger.info('Бот включен')
+    await startup_brokers()
+
+
+async def on_shutdown() -> None:
+    logger.info('Бот выключен')
+    await shutdown_brokers()
+    shutdown_logger()
+
+
+# Одна и та же настройка для polling, webhook и воркеров очереди обновлений.
+async def setup_dispatcher(dp: Dispatcher, container: AsyncContainer) -> None:
+    dp.include_router(router=admins_router)
+    dp.include_router(router=users_router)
+    # Внешний middleware на update отсекает флуд до фильтров, UserCheckMiddleware
+    # и обращений к БД.
+    dp.update.outer_middleware(await container.get(ThrottlingMiddleware))
+    dp.message.middleware(UserCheckMiddleware())
+    setup_dishka(router=dp, container=container)
+    dp.startup.register(on_startup)
+    dp.shutdown.register(on_shutdown)
@@ -1,14 +1,14 @@
-import asyncio
-
 from aiogram import Router
-from aiogram.filters import Command, StateFilter
+from aiogram.filters import Command, CommandObject, StateFilter
 from aiogram.fsm.state import default_state
 from aiogram.types import Message
 from dishka.integrations.aiogram import FromDishka as Depends
 from dishka.integrations.aiogram import inject
-from src.infrastructure.database.models.telegram_users import TelegramUser
-from src.infrastructure.repositories.telegram.base import BaseTelegramRepository
-from src.infrastructure.taskiq.tasks import send_copy_task
+from src.application.use_cases.admin.broadcast.start_broadcast import (
+    GetBroadcastStatusUseCase,
+    StartBroadcastUseCase,
+)
+from src.domain.broadcast.entity import BroadcastEntity
 
 from .filter import AdminProtect
 
@@ -17,20 +17,47 @@ router: Router = Router()
 
 @router.message(Command('notify'), StateFilter(default_state), AdminProtect())
 @inject
-async def notify_users(message: Message, repository: Depends[BaseTelegramRepository]):
+async def notify_users(
+    message: Message, use_case: Depends[StartBroadcastUseCase]
+) -> None:
     if not message.reply_to_message:
         await message.answer('Сделай реплай на сообщение, которое надо разослать.')
         return
 
-    users: list[TelegramUser] = await repository.get_all_users()
-    await asyncio.gather(
-        *[
-            send_copy_task.kiq(
-                to_chat_id=user.telegram_id,
-                from_chat_id=message.reply_to_message.chat.id,
-                from_message_id=message.reply_to_message.message_id,
-            )
-            for user in users
-        ],
+    broadcast: BroadcastEntity = await use_case.execute(
+        from_chat_id=message.reply_to_message.chat.id,
+        message_id=message.reply_to_message.message_id,
+    )
+    await message.answer(
+        f'✅ Рассылка #{broadcast.id} запущена, получателей: {broadcast.total}.\n'
+        f'Статус: /notify_status {broadcast.id}'
+    )
+
+
+@router.message(Command('notify_status'), StateFilter(default_state), AdminProtect())
+@inject
+async def notify_status(
+    message: Message,
+    command: CommandObject,
+    use_case: Depends[GetBroadcastStatusUseCase],
+) -> None:
+    if command.args and not command.args.strip().isdigit():
+        await message.answer('Использование: /notify_status [id рассылки]')
+        return
+
+    broadcast: BroadcastEntity | None = await use_case.execute(
+        broadcast_id=int(command.args) if command.args else None
+    )
+
+    if broadcast is None:
+        await message.answer('Рассылка не найдена.')
+        return
+
+    status: str = '✅ завершена' if broadcast.is_finished else '⏳ идет'
+    await message.answer(
+        f'📨 <b>Рассылка #{broadcast.id}</b>: {status}\n'
+        f'• Отправлено: {broadcast.sent}\n'
+        f'• Ошибок: {broadcast.failed}\n'
+        f'• Осталось: {broadcast.remaining}\n'
+        f'• Всего: {broadcast.total}'
     )
-    await message.answer('✅ Рассылка запущена.')
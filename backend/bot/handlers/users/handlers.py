@@ -16,7 +16,7 @@ async def start_cmd(message: Message):
         'Доступные команды:\n'
         '/id - Посмотреть свой ID'
     )
-    logger.info(f'Пользователь: {message.from_user.id}')
+    logger.info('Пользователь: %s', message.from_user.id)
 
 
 @router.message(Command('id'), StateFilter(default_state))
@@ -24,7 +24,7 @@ async def get_my_id(message: Message):
     await message.answer(
         text=f'Ваш ID: <b>{message.from_user.id}</b>\nВставьте его на сайте'
     )
-    logger.info(f'Пользователь: {message.from_user.id} проверил свой ID')
+    logger.info('Пользователь: %s проверил свой ID', message.from_user.id)
 
 
 @router.message(StateFilter(default_state))
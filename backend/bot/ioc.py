@@ -2,15 +2,28 @@ from collections.abc import AsyncIterable
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.fsm.storage.base import BaseStorage
+from aiogram.fsm.storage.redis import DefaultKeyBuilder, RedisStorage
 from dishka import Provider, Scope, from_context, provide
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.use_cases.admin.broadcast.start_broadcast import (
+    GetBroadcastStatusUseCase,
+    StartBroadcastUseCase,
+)
 from src.config import Config
+from src.infrastructure.cache.base import BaseCacheService
+from src.infrastructure.cache.redis import RedisCacheService, new_redis_pool
+from src.infrastructure.cache.token_bucket import RedisTokenBucket
 from src.infrastructure.database.postgresql import new_session_maker
+from src.infrastructure.repositories.broadcast.base import BaseBroadcastRepository
+from src.infrastructure.repositories.broadcast.redis import RedisBroadcastRepository
 from src.infrastructure.repositories.telegram.base import BaseTelegramRepository
 from src.infrastructure.repositories.telegram.sqlalchemy import (
     SQLAlchemyTelegramRepository,
 )
 
+from .throttling import THROTTLE_KEY, ThrottlingMiddleware
+
 
 class BotProvider(Provider):
     config = from_context(provides=Config, scope=Scope.APP)
@@ -33,10 +46,69 @@ class BotProvider(Provider):
         )
 
     @provide(scope=Scope.APP)
-    def get_dispatcher(self) -> Dispatcher:
-        return Dispatcher()
+    def get_fsm_storage(
+        self, config: Config, cache_service: BaseCacheService
+    ) -> BaseStorage:
+        # Состояния в Redis общие для всех процессов бота.
+        return RedisStorage(
+            redis=cache_service.client,
+            key_builder=DefaultKeyBuilder(with_bot_id=True),
+            state_ttl=config.bot.fsm_ttl_seconds,
+            data_ttl=config.bot.fsm_ttl_seconds,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_dispatcher(self, storage: BaseStorage) -> Dispatcher:
+        return Dispatcher(storage=storage)
+
+    @provide(scope=Scope.APP)
+    def get_throttling_middleware(
+        self, config: Config, cache_service: BaseCacheService
+    ) -> ThrottlingMiddleware:
+        return ThrottlingMiddleware(
+            bucket=RedisTokenBucket(
+                _client=cache_service.client,
+                key=THROTTLE_KEY,
+                rate=config.bot.throttle_rate,
+                capacity=config.bot.throttle_burst,
+            ),
+            mode=config.bot.throttle_mode,
+            max_delay=config.bot.throttle_max_delay,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_cache_service(
+        self, config: Config
+    ) -> AsyncIterable[BaseCacheService]:
+        cache_service = RedisCacheService(pool=new_redis_pool(config.redis))
+        yield cache_service
+        await cache_service.close()
 
     # repo
     @provide(scope=Scope.REQUEST)
     def get_telegram_repository(self, session: AsyncSession) -> BaseTelegramRepository:
         return SQLAlchemyTelegramRepository(_session=session)
+
+    @provide(scope=Scope.APP)
+    def get_broadcast_repository(
+        self, cache_service: BaseCacheService
+    ) -> BaseBroadcastRepository:
+        return RedisBroadcastRepository(_cache_service=cache_service)
+
+    # use cases
+    @provide(scope=Scope.REQUEST)
+    def get_start_broadcast_use_case(
+        self,
+        broadcast_repository: BaseBroadcastRepository,
+        telegram_repository: BaseTelegramRepository,
+    ) -> StartBroadcastUseCase:
+        return StartBroadcastUseCase(
+            _broadcast_repository=broadcast_repository,
+            _telegram_repository=telegram_repository,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_broadcast_status_use_case(
+        self, broadcast_repository: BaseBroadcastRepository
+    ) -> GetBroadcastStatusUseCase:
+        return GetBroadcastStatusUseCase(_broadcast_repository=broadcast_repository)
@@ -4,10 +4,23 @@ from typing import Any
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
 from dishka.async_container import AsyncContainer
+from src.infrastructure.cache.local import LocalTTLCache
 from src.infrastructure.repositories.telegram.base import BaseTelegramRepository
 
+SEEN_USERS_MAX_SIZE: int = 100_000
+SEEN_USERS_TTL_SECONDS: float = 24 * 60 * 60
+
 
 class UserCheckMiddleware(BaseMiddleware):
+    def __init__(
+        self,
+        max_size: int = SEEN_USERS_MAX_SIZE,
+        ttl_seconds: float = SEEN_USERS_TTL_SECONDS,
+    ) -> None:
+        self._seen_users: LocalTTLCache[int, bool] = LocalTTLCache(
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
@@ -16,11 +29,13 @@ class UserCheckMiddleware(BaseMiddleware):
     ) -> Any:
         user = event.from_user
 
-        if user:
+        # Уже зарегистрированных пользователей пропускаем без обращения к БД.
+        if user and self._seen_users.get(user.id) is None:
             container: AsyncContainer = data['dishka_container']
             repository: BaseTelegramRepository = await container.get(
                 BaseTelegramRepository
             )
-            await repository.add_user_if_not_exists(telegram_id=user.id)
+            if await repository.add_user_if_not_exists(telegram_id=user.id):
+                self._seen_users.set(user.id, True)
 
         return await handler(event, data)
@@ -1,30 +1,11 @@
 import asyncio
-import logging
 
 from aiogram import Bot, Dispatcher
 from dishka import AsyncContainer, make_async_container
-from dishka.integrations.aiogram import setup_dishka
 from src.config import Config
-from src.infrastructure.taskiq.broker import broker
-from src.logger import setup_logger
 
-from .handlers.admins.handlers import router as admins_router
-from .handlers.users.handlers import router as users_router
+from .dispatcher import setup_dispatcher
 from .ioc import BotProvider
-from .middleware import UserCheckMiddleware
-
-logger = logging.getLogger(__name__)
-
-
-async def on_startup():
-    setup_logger()
-    logger.info('Бот включен')
-    await broker.startup()
-
-
-async def on_shutdown():
-    logger.info('Бот выключен')
-    await broker.shutdown()
 
 
 async def main() -> None:
@@ -35,14 +16,12 @@ async def main() -> None:
     )
     dp: Dispatcher = await bot_container.get(Dispatcher)
     bot: Bot = await bot_container.get(Bot)
-    dp.include_router(router=admins_router)
-    dp.include_router(router=users_router)
-    dp.message.middleware(UserCheckMiddleware())
-    setup_dishka(router=dp, container=bot_container)
-    dp.startup.register(on_startup)
-    dp.shutdown.register(on_shutdown)
-
-    await dp.start_polling(bot)
+    await setup_dispatcher(dp=dp, container=bot_container)
+
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await bot_container.close()
 
 
 if __name__ == '__main__':
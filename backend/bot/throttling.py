@@ -0,0 +1,62 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal
+
+from aiogram import BaseMiddleware
+from aiogram.types import Chat, TelegramObject, User
+from redis.exceptions import RedisError
+from src.infrastructure.cache.token_bucket import RedisTokenBucket
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_KEY: str = 'bot:throttle'
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+    def __init__(
+        self,
+        bucket: RedisTokenBucket,
+        mode: Literal['drop', 'delay'] = 'drop',
+        max_delay: float = 2.0,
+    ) -> None:
+        self._bucket = bucket
+        self._mode = mode
+        self._max_delay = max_delay
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[object]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> object:
+        chat: Chat | None = data.get('event_chat')
+        user: User | None = data.get('event_from_user')
+        chat_id: int | None = chat.id if chat else user.id if user else None
+
+        if chat_id is not None and not await self._allow(chat_id):
+            return None
+
+        return await handler(event, data)
+
+    async def _allow(self, chat_id: int) -> bool:
+        deadline: float = time.monotonic() + (
+            self._max_delay if self._mode == 'delay' else 0.0
+        )
+
+        try:
+            wait: float = await self._bucket.try_acquire(suffix=str(chat_id))
+            # В режиме delay ждем токен, но не дольше max_delay: после этого
+            # обновление отбрасывается, как и в режиме drop.
+            while wait > 0 and time.monotonic() + wait <= deadline:
+                await asyncio.sleep(wait)
+                wait = await self._bucket.try_acquire(suffix=str(chat_id))
+        except RedisError as e:
+            logger.warning('Ограничение частоты недоступно, пропускаем: %s', e)
+            return True
+
+        if wait > 0:
+            logger.info('Обновление от чата %s отброшено ограничителем', chat_id)
+            return False
+        return True
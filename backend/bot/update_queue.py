@@ -0,0 +1,121 @@
+import logging
+from dataclasses import dataclass
+
+import aio_pika
+import orjson
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractIncomingMessage,
+    AbstractQueue,
+)
+from aiogram import Bot, Dispatcher
+from aiogram.methods import TelegramMethod
+
+logger = logging.getLogger(__name__)
+
+UPDATES_EXCHANGE: str = 'telegram_updates'
+
+
+def partition_queue_name(partition: int) -> str:
+    return f'{UPDATES_EXCHANGE}.{partition}'
+
+
+def owned_partitions(partitions: int, worker_index: int, workers: int) -> list[int]:
+    if worker_index >= workers:
+        raise ValueError(
+            f'BOT_UPDATE_WORKER_INDEX={worker_index} должен быть меньше '
+            f'BOT_UPDATE_WORKERS={workers}'
+        )
+    return [
+        partition
+        for partition in range(partitions)
+        if partition % workers == worker_index
+    ]
+
+
+def update_chat_id(update: dict) -> int:
+    # Обновления одного чата попадают в одну партицию, иначе воркеры
+    # обработают их не в том порядке, в котором их прислал Telegram.
+    for key, event in update.items():
+        if key == 'update_id' or not isinstance(event, dict):
+            continue
+
+        chat: dict | None = event.get('chat') or (event.get('message') or {}).get(
+            'chat'
+        )
+        if chat:
+            return chat['id']
+
+        user: dict | None = event.get('from') or event.get('user')
+        if user:
+            return user['id']
+
+    return update['update_id']
+
+
+async def declare_partitions(
+    channel: AbstractChannel, partitions: int
+) -> tuple[AbstractExchange, list[AbstractQueue]]:
+    exchange: AbstractExchange = await channel.declare_exchange(
+        UPDATES_EXCHANGE, aio_pika.ExchangeType.DIRECT, durable=True
+    )
+    queues: list[AbstractQueue] = []
+
+    for partition in range(partitions):
+        # Второй воркер на той же партиции остается в резерве и забирает
+        # очередь, только если первый отключился.
+        queue: AbstractQueue = await channel.declare_queue(
+            partition_queue_name(partition),
+            durable=True,
+            arguments={'x-single-active-consumer': True},
+        )
+        await queue.bind(exchange, routing_key=str(partition))
+        queues.append(queue)
+
+    return exchange, queues
+
+
+@dataclass
+class UpdatePublisher:
+    _exchange: AbstractExchange
+    partitions: int
+
+    async def publish(self, body: bytes) -> None:
+        partition: int = update_chat_id(orjson.loads(body)) % self.partitions
+        await self._exchange.publish(
+            aio_pika.Message(
+                body=body,
+                content_type='application/json',
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=str(partition),
+        )
+
+
+@dataclass
+class UpdateConsumer:
+    _dispatcher: Dispatcher
+    _bot: Bot
+
+    async def consume(self, queue: AbstractQueue) -> None:
+        # prefetch_count=1 и последовательная обработка сохраняют порядок
+        # обновлений внутри партиции.
+        async with queue.iterator() as iterator:
+            async for message in iterator:
+                await self._process(message)
+
+    async def _process(self, message: AbstractIncomingMessage) -> None:
+        try:
+            result = await self._dispatcher.feed_raw_update(
+                bot=self._bot, update=orjson.loads(message.body)
+            )
+            if isinstance(result, TelegramMethod):
+                await self._dispatcher.silent_call_request(bot=self._bot, result=result)
+        except Exception:
+            # Одно сломанное обновление не должно останавливать всю партицию.
+            logger.exception(
+                'Ошибка обработки обновления из партиции %s', message.routing_key
+            )
+
+        await message.ack()
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+
+import aio_pika
+from aio_pika.abc import AbstractRobustConnection
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+from dishka import AsyncContainer, make_async_container
+from src.config import BotConfig, Config
+
+from .dispatcher import setup_dispatcher
+from .ioc import BotProvider
+from .update_queue import UpdatePublisher, declare_partitions
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER: str = 'X-Telegram-Bot-Api-Secret-Token'
+
+
+class BoundedRequestHandler(SimpleRequestHandler):
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        *,
+        concurrency: int,
+        handle_in_background: bool = True,
+        secret_token: str | None = None,
+    ) -> None:
+        super().__init__(
+            dispatcher=dispatcher,
+            bot=bot,
+            handle_in_background=handle_in_background,
+            secret_token=secret_token,
+        )
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _handle_request_background(
+        self, bot: Bot, request: web.Request
+    ) -> web.Response:
+        update: dict = await request.json(loads=bot.session.json_loads)
+
+        # Пока пул занят, Telegram не получает ответ и не шлет новые обновления
+        # сверх max_connections, поэтому задачи не копятся в памяти.
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._background_feed_update(bot=bot, update=update))
+        self._background_feed_update_tasks.add(task)
+        task.add_done_callback(self._on_update_done)
+        return web.json_response({}, dumps=bot.session.json_dumps)
+
+    async def _handle_request(self, bot: Bot, request: web.Request) -> web.Response:
+        async with self._semaphore:
+            return await super()._handle_request(bot=bot, request=request)
+
+    def _on_update_done(self, task: asyncio.Task) -> None:
+        self._background_feed_update_tasks.discard(task)
+        self._semaphore.release()
+
+        if not task.cancelled() and task.exception():
+            logger.error('Ошибка обработки обновления', exc_info=task.exception())
+
+
+class QueueRequestHandler(SimpleRequestHandler):
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        *,
+        publisher: UpdatePublisher,
+        secret_token: str | None = None,
+    ) -> None:
+        super().__init__(dispatcher=dispatcher, bot=bot, secret_token=secret_token)
+        self._publisher = publisher
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if not self.verify_secret(request.headers.get(SECRET_HEADER, ''), self.bot):
+            return web.Response(body='Unauthorized', status=401)
+
+        # Telegram получает ответ только после подтверждения от RabbitMQ,
+        # иначе при падении брокера обновление потеряется.
+        await self._publisher.publish(await request.read())
+        return web.json_response({})
+
+
+async def create_webhook_app() -> web.Application:
+    config: Config = Config()
+    bot_config: BotConfig = config.bot
+
+    if not bot_config.webhook_url:
+        raise ValueError('Для webhook-режима нужно задать BOT_WEBHOOK_URL')
+
+    bot_container: AsyncContainer = make_async_container(
+        BotProvider(), context={Config: config}
+    )
+    dp: Dispatcher = await bot_container.get(Dispatcher)
+    bot: Bot = await bot_container.get(Bot)
+    await setup_dispatcher(dp=dp, container=bot_container)
+
+    app: web.Application = web.Application()
+    connection: AbstractRobustConnection | None = None
+
+    if bot_config.update_queue:
+        connection = await aio_pika.connect_robust(config.rabbitmq.url)
+        channel = await connection.channel()
+        exchange, _ = await declare_partitions(channel, bot_config.update_partitions)
+        handler: SimpleRequestHandler = QueueRequestHandler(
+            dispatcher=dp,
+            bot=bot,
+            secret_token=bot_config.webhook_secret,
+            publisher=UpdatePublisher(
+                _exchange=exchange, partitions=bot_config.update_partitions
+            ),
+        )
+    else:
+        handler = BoundedRequestHandler(
+            dispatcher=dp,
+            bot=bot,
+            handle_in_background=bot_config.handle_in_background,
+            secret_token=bot_config.webhook_secret,
+            concurrency=bot_config.update_concurrency,
+        )
+
+    handler.register(app, path=bot_config.webhook_path)
+    setup_application(app, dp, bot=bot)
+
+    async def set_webhook(_: web.Application) -> None:
+        await bot.set_webhook(
+            url=f'{bot_config.webhook_url.rstrip("/")}{bot_config.webhook_path}',
+            secret_token=bot_config.webhook_secret,
+            max_connections=bot_config.webhook_max_connections,
+            allowed_updates=dp.resolve_used_update_types(),
+        )
+        logger.info(
+            'Webhook установлен, очередь обновлений: %s', bot_config.update_queue
+        )
+
+    async def close(_: web.Application) -> None:
+        if connection is not None:
+            await connection.close()
+        await bot_container.close()
+
+    app.on_startup.append(set_webhook)
+    app.on_cleanup.append(close)
+    return app
+
+
+if __name__ == '__main__':
+    bot_config: BotConfig = Config().bot
+    web.run_app(
+        create_webhook_app(),
+        host=bot_config.webhook_host,
+        port=bot_config.webhook_port,
+    )
@@ -0,0 +1,47 @@
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from redis.exceptions import RedisError
+from src.domain.audit.event import AuditEvent
+from src.infrastructure.repositories.audit.base import BaseAuditEventRepository
+from src.infrastructure.taskiq.delay import delayed_kicker
+from src.infrastructure.taskiq.tasks import (
+    flush_admin_digest,
+    send_notification_for_admin,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AdminNotifier(ABC):
+    @abstractmethod
+    async def notify(self, text: str, priority: bool = False) -> None: ...
+
+
+@dataclass
+class AdminNotifierImpl(AdminNotifier):
+    _audit_repository: BaseAuditEventRepository
+    _window_seconds: float
+    _max_events: int
+
+    async def notify(self, text: str, priority: bool = False) -> None:
+        if priority:
+            await send_notification_for_admin.kiq(text=text)
+            return
+
+        try:
+            buffered: int = await self._audit_repository.push(AuditEvent(text=text))
+            window_opened: bool = await self._audit_repository.open_window(
+                ttl=self._window_seconds
+            )
+        except RedisError as e:
+            logger.warning('Буфер уведомлений недоступен, отправляем сразу: %s', e)
+            await send_notification_for_admin.kiq(text=text)
+            return
+
+        if buffered % self._max_events == 0:
+            await flush_admin_digest.kiq()
+        elif window_opened:
+            await delayed_kicker(flush_admin_digest, self._window_seconds).kiq()
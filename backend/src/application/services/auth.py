@@ -1,28 +1,25 @@
-import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-import orjson
 from src.application.services.jwt import JWTService
 from src.domain.user.entity import UserEntity
 from src.domain.user.exception import UserNotFoundException
-from src.infrastructure.cache.base import BaseCacheService
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseUserCacheService
 from src.infrastructure.repositories.user.base import BaseUserRepository
 
-logger = logging.getLogger(__name__)
-
 
 @dataclass
 class BaseAuthService(ABC):
     _user_repository: BaseUserRepository
     _jwt_service: JWTService
-    _cache_service: BaseCacheService
+    _user_cache: BaseUserCacheService
 
     @abstractmethod
     async def authenticate_user(self, telegram_id: int) -> UserEntity | None: ...
 
     @abstractmethod
-    async def get_current_user(self, token: str) -> UserEntity | None: ...
+    async def get_current_user(self, token: str) -> UserPrincipal | None: ...
 
 
 @dataclass
@@ -37,7 +34,7 @@ class AuthServiceImpl(BaseAuthService):
 
         return user
 
-    async def get_current_user(self, token: str) -> UserEntity | None:
+    async def get_current_user(self, token: str) -> UserPrincipal | None:
         payload: dict | None = self._jwt_service.verify_access_token(token=token)
 
         if not payload or payload.get('type') != 'access':
@@ -48,25 +45,20 @@ class AuthServiceImpl(BaseAuthService):
         if not user_tg_id:
             return None
 
-        cache_key: str = f'user:{user_tg_id}'
-        cached_user: str | None = await self._cache_service.get(cache_key)
+        cached_user: UserPrincipal | None = await self._user_cache.get(
+            telegram_id=int(user_tg_id)
+        )
 
         if cached_user:
-            try:
-                user_dict = orjson.loads(cached_user)
-                return UserEntity.from_dict(user_dict)
-            except orjson.JSONDecodeError:
-                logger.error('ORJSON error when loading cached user')
+            return cached_user
 
-        user: UserEntity | None = await self._user_repository.get_user_by_telegram_id(
-            int(user_tg_id)
-        )
+        user: (
+            UserPrincipal | None
+        ) = await self._user_repository.get_principal_by_telegram_id(int(user_tg_id))
 
         if not user:
             raise UserNotFoundException()
 
-        await self._cache_service.set_with_ttl(
-            key=cache_key, value=orjson.dumps(user.to_dict()), ttl_seconds=600
-        )
+        await self._user_cache.set(user=user)
 
         return user
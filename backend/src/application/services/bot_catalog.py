@@ -0,0 +1,52 @@
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import orjson
+from src.domain.bot.catalog import BotCatalog
+from src.domain.bot.entity import BotEntity
+from src.infrastructure.cache.base import BaseBotCatalogCache
+from src.infrastructure.repositories.bot.base import BaseBotRepository
+from src.presentation.schemas.bot import BotOutSchema
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BotCatalogService(ABC):
+    @abstractmethod
+    async def get(self) -> BotCatalog: ...
+
+    @abstractmethod
+    async def rebuild(self) -> BotCatalog: ...
+
+
+@dataclass
+class BotCatalogServiceImpl(BotCatalogService):
+    _bot_repository: BaseBotRepository
+    _catalog_cache: BaseBotCatalogCache
+
+    async def get(self) -> BotCatalog:
+        catalog: BotCatalog | None = await self._catalog_cache.get()
+
+        if catalog is None:
+            logger.info('Каталог ботов отсутствует в кэше, собираем заново')
+            catalog = await self.rebuild()
+
+        return catalog
+
+    async def rebuild(self) -> BotCatalog:
+        bots: list[BotEntity] = await self._bot_repository.get_all_bots() or []
+        body: str = orjson.dumps(
+            [
+                BotOutSchema.model_validate(bot.to_dict()).model_dump(mode='json')
+                for bot in bots
+            ]
+        ).decode()
+
+        catalog: BotCatalog = BotCatalog.from_body(body)
+        await self._catalog_cache.set(catalog)
+        logger.info(
+            'Каталог ботов пересобран: %s ботов, etag=%s', len(bots), catalog.etag
+        )
+        return catalog
@@ -12,10 +12,10 @@ logger = logging.getLogger(__name__)
 
 async def send_and_cache(telegram_id: int, cache_service: BaseCacheService) -> bool:
     code: str = str(random.randint(100000, 999999))
-    logger.info(f'Сгенерирован код: {code} для пользователя: {telegram_id}')
+    logger.info('Сгенерирован код для пользователя: %s', telegram_id)
 
     await send_notification.kiq(user_id=telegram_id, text=f'Ваш код: {code}')
-    logger.info(f'Код: {code} отправлен пользователю в телеграм: {telegram_id}')
+    logger.info('Код отправлен пользователю в телеграм: %s', telegram_id)
 
     await cache_service.set_with_ttl(
         key=f'{telegram_id}:code', value=code, ttl_seconds=300
@@ -55,17 +55,15 @@ class CheckCodeService:
         cache_code: str | None = await self._cache_service.get(
             key=f'{telegram_id}:code'
         )
-        logger.info(
-            f'Получение кода из кэша, для пользователя: {telegram_id}: код: {cache_code}'
-        )
+        logger.info('Получение кода из кэша для пользователя: %s', telegram_id)
 
         if not cache_code or int(cache_code) != code:
-            logger.warning(f'Неверный код для пользователя {telegram_id}')
+            logger.warning('Неверный код для пользователя %s', telegram_id)
             raise InvalidCodeException()
 
-        logger.info(f'Успешная проверка кода: {code} для пользователя: {telegram_id}')
+        logger.info('Успешная проверка кода для пользователя: %s', telegram_id)
 
         await self._cache_service.delete(key=f'{telegram_id}:code')
-        logger.info(f'Код из кэша для пользователя: {telegram_id} удален')
+        logger.info('Код из кэша для пользователя: %s удален', telegram_id)
 
         return True
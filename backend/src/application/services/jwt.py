@@ -1,5 +1,7 @@
+import hashlib
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 from fastapi import HTTPException, status
@@ -7,6 +9,14 @@ from jose import ExpiredSignatureError, JWTError, jwt
 from src.config import Config
 from src.const import MOSCOW_TZ
 from src.domain.jwt.exception import IncorrectTokenException, TokenExpiredException
+from src.infrastructure.cache.local import LocalTTLCache
+
+VERIFIED_TOKENS_MAX_SIZE: int = 10_000
+VERIFIED_TOKEN_MAX_TTL_SECONDS: float = 300.0
+
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
 @dataclass
@@ -33,6 +43,12 @@ class JWTService(ABC):
 @dataclass
 class JWTServiceImpl(JWTService):
     config: Config
+    _verified_tokens: LocalTTLCache[bytes, dict] = field(
+        default_factory=lambda: LocalTTLCache(
+            max_size=VERIFIED_TOKENS_MAX_SIZE,
+            ttl_seconds=VERIFIED_TOKEN_MAX_TTL_SECONDS,
+        )
+    )
 
     def _create_token(
         self, data: dict, expires_delta: timedelta, token_type: str, secret_key: str
@@ -81,12 +97,26 @@ class JWTServiceImpl(JWTService):
         return access_token, refresh_token
 
     def verify_access_token(self, token: str) -> dict:
-        return self._verify_token(
+        digest: bytes = _token_digest(token)
+        cached_payload: dict | None = self._verified_tokens.get(digest)
+
+        if cached_payload is not None:
+            return dict(cached_payload)
+
+        payload: dict = self._verify_token(
             token,
             'access',
             self.config.jwt.secret_key,
         )
 
+        ttl_seconds: float = min(
+            payload.get('exp', 0) - time.time(), VERIFIED_TOKEN_MAX_TTL_SECONDS
+        )
+        if ttl_seconds > 0:
+            self._verified_tokens.set(digest, dict(payload), ttl_seconds=ttl_seconds)
+
+        return payload
+
     def verify_refresh_token(self, token: str) -> dict:
         return self._verify_token(
             token,
@@ -0,0 +1,46 @@
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from src.const import MOSCOW_TZ
+from src.infrastructure.taskiq.delay import kick_at
+from src.infrastructure.taskiq.tasks import expire_rental, remind_rental_expiring
+
+logger = logging.getLogger(__name__)
+
+REMINDER_DAYS_AHEAD: int = 3
+
+
+@dataclass
+class RentalEventScheduler(ABC):
+    @abstractmethod
+    async def schedule(self, rental_id: int, rented_until: datetime) -> None: ...
+
+
+@dataclass
+class RentalEventSchedulerImpl(RentalEventScheduler):
+    # Отменить отложенное сообщение в RabbitMQ нельзя, поэтому задачи при
+    # срабатывании сверяют аренду с базой: остановленная или продленная аренда
+    # пропускается, а продление планирует события заново.
+    async def schedule(self, rental_id: int, rented_until: datetime) -> None:
+        remind_at: datetime = rented_until - timedelta(days=REMINDER_DAYS_AHEAD)
+
+        try:
+            if remind_at > datetime.now(tz=MOSCOW_TZ):
+                await kick_at(
+                    remind_rental_expiring,
+                    remind_at,
+                    rental_id=rental_id,
+                    rented_until=rented_until.isoformat(),
+                )
+            await kick_at(expire_rental, rented_until, rental_id=rental_id)
+        except Exception as e:
+            # Аренда уже оплачена и сохранена, истечение подберет сверка
+            # expire_rentals.
+            logger.error(
+                'Не удалось запланировать события аренды id=%s: %s',
+                rental_id,
+                e,
+                exc_info=True,
+            )
@@ -2,11 +2,12 @@ import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 
+from src.application.services.admin_notifier import AdminNotifier
+from src.application.services.bot_catalog import BotCatalogService
 from src.domain.bot.entity import BotEntity
 from src.domain.bot.exception import BotNotFoundException
-from src.domain.user.entity import UserEntity
+from src.domain.user.principal import UserPrincipal
 from src.infrastructure.repositories.bot.base import BaseBotRepository
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +15,13 @@ logger = logging.getLogger(__name__)
 @dataclass
 class BaseBotStatusUseCase:
     _bot_repository: BaseBotRepository
+    _bot_catalog: BotCatalogService
+    _admin_notifier: AdminNotifier
 
     async def _change_bot_status(
         self,
         bot_id: int,
-        admin: UserEntity,
+        admin: UserPrincipal,
         status_action: Callable[[BotEntity], None],
         action_name: str,
     ) -> BotEntity:
@@ -31,11 +34,15 @@ class BaseBotStatusUseCase:
 
         status_action(bot)
         updated_bot = await self._bot_repository.update(bot_entity=bot)
+        await self._bot_catalog.rebuild()
 
         logger.info(
-            f'Администратор: {admin.telegram_id.to_raw()} {action_name} бота: {bot.id}'
+            'Администратор: %s %s бота: %s',
+            admin.telegram_id.to_raw(),
+            action_name,
+            bot.id,
         )
-        await send_notification_for_admin.kiq(
+        await self._admin_notifier.notify(
             text=f'Администратор: {admin.telegram_id.to_raw()} {action_name} бота: {bot.id}'
         )
         return updated_bot
@@ -43,7 +50,7 @@ class BaseBotStatusUseCase:
 
 @dataclass
 class ActivateBotUseCase(BaseBotStatusUseCase):
-    async def execute(self, bot_id: int, admin: UserEntity) -> BotEntity:
+    async def execute(self, bot_id: int, admin: UserPrincipal) -> BotEntity:
         return await self._change_bot_status(
             bot_id=bot_id,
             admin=admin,
@@ -54,7 +61,7 @@ class ActivateBotUseCase(BaseBotStatusUseCase):
 
 @dataclass
 class DeactivateBotUseCase(BaseBotStatusUseCase):
-    async def execute(self, bot_id: int, admin: UserEntity) -> BotEntity:
+    async def execute(self, bot_id: int, admin: UserPrincipal) -> BotEntity:
         return await self._change_bot_status(
             bot_id=bot_id,
             admin=admin,
@@ -1,10 +1,11 @@
 import logging
 from dataclasses import dataclass
 
+from src.application.services.admin_notifier import AdminNotifier
+from src.application.services.bot_catalog import BotCatalogService
 from src.domain.bot.entity import BotEntity
-from src.domain.user.entity import UserEntity
+from src.domain.user.principal import UserPrincipal
 from src.infrastructure.repositories.bot.base import BaseBotRepository
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 from src.presentation.schemas.bot import CreateBotSchema
 
 logger = logging.getLogger(__name__)
@@ -13,16 +14,19 @@ logger = logging.getLogger(__name__)
 @dataclass
 class CreateNewBotUseCase:
     _bot_repository: BaseBotRepository
+    _bot_catalog: BotCatalogService
+    _admin_notifier: AdminNotifier
 
-    async def execute(self, bot: CreateBotSchema, admin: UserEntity) -> BotEntity:
+    async def execute(self, bot: CreateBotSchema, admin: UserPrincipal) -> BotEntity:
         new_bot: BotEntity = BotEntity.create_bot(
             name=bot.name, description=bot.description, price=bot.price
         )
         bot: BotEntity = await self._bot_repository.add(bot=new_bot)
+        await self._bot_catalog.rebuild()
         logger.info(
-            f'Администратор: {admin.telegram_id.to_raw()} добавил нового бота: {bot}'
+            'Администратор: %s добавил нового бота: %s', admin.telegram_id.to_raw(), bot
         )
-        await send_notification_for_admin.kiq(
+        await self._admin_notifier.notify(
             text=f'Администратор: {admin.telegram_id.to_raw()} добавил нового бота: {bot}'
         )
         return bot
@@ -1,11 +1,12 @@
 import logging
 from dataclasses import dataclass
 
+from src.application.services.admin_notifier import AdminNotifier
+from src.application.services.bot_catalog import BotCatalogService
 from src.domain.bot.entity import BotEntity
 from src.domain.bot.exception import BotNotFoundException
-from src.domain.user.entity import UserEntity
+from src.domain.user.principal import UserPrincipal
 from src.infrastructure.repositories.bot.base import BaseBotRepository
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 
 logger = logging.getLogger(__name__)
 
@@ -13,8 +14,10 @@ logger = logging.getLogger(__name__)
 @dataclass
 class DeleteBotUseCase:
     _bot_repository: BaseBotRepository
+    _bot_catalog: BotCatalogService
+    _admin_notifier: AdminNotifier
 
-    async def execute(self, bot_id: int, admin: UserEntity) -> BotEntity:
+    async def execute(self, bot_id: int, admin: UserPrincipal) -> BotEntity:
         bot: BotEntity | None = await self._bot_repository.get_bot_with_rentals(
             bot_id=bot_id
         )
@@ -24,10 +27,11 @@ class DeleteBotUseCase:
 
         bot.delete()
         deleted_bot: BotEntity = await self._bot_repository.update(bot_entity=bot)
+        await self._bot_catalog.rebuild()
         logger.info(
-            f'Администратор: {admin.telegram_id.to_raw()} удалил бота: {bot.id}'
+            'Администратор: %s удалил бота: %s', admin.telegram_id.to_raw(), bot.id
         )
-        await send_notification_for_admin.kiq(
+        await self._admin_notifier.notify(
             text=f'Администратор: {admin.telegram_id.to_raw()} удалил бота: {bot.id}'
         )
         return deleted_bot
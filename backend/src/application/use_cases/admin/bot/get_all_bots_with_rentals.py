@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from src.domain.bot.entity import BotEntity
+from src.domain.bot.admin_view import BotRentalPage, BotRentalSummary, BotWithRentals
 from src.infrastructure.repositories.bot.base import BaseBotRepository
 
 
@@ -8,5 +8,26 @@ from src.infrastructure.repositories.bot.base import BaseBotRepository
 class GetAllBotsWithRentalsUseCase:
     _bot_repository: BaseBotRepository
 
-    async def execute(self) -> list[BotEntity] | None:
-        return await self._bot_repository.get_all_bots_with_rentals()
+    async def execute(self, rentals_limit: int) -> list[BotWithRentals]:
+        return await self._bot_repository.get_bots_with_rentals(
+            rentals_limit=rentals_limit
+        )
+
+
+@dataclass
+class GetBotRentalsUseCase:
+    _bot_repository: BaseBotRepository
+
+    async def execute(
+        self, bot_id: int, limit: int, cursor: int | None = None
+    ) -> BotRentalPage:
+        rentals: list[BotRentalSummary] = await self._bot_repository.get_bot_rentals(
+            bot_id=bot_id, limit=limit + 1, after_id=cursor
+        )
+
+        next_cursor: int | None = None
+        if len(rentals) > limit:
+            rentals = rentals[:limit]
+            next_cursor = rentals[-1].id
+
+        return BotRentalPage(items=rentals, next_cursor=next_cursor)
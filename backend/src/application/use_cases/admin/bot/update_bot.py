@@ -1,11 +1,12 @@
 import logging
 from dataclasses import dataclass
 
+from src.application.services.admin_notifier import AdminNotifier
+from src.application.services.bot_catalog import BotCatalogService
 from src.domain.bot.entity import BotEntity
 from src.domain.bot.exception import BotNotFoundException
-from src.domain.user.entity import UserEntity
+from src.domain.user.principal import UserPrincipal
 from src.infrastructure.repositories.bot.base import BaseBotRepository
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 from src.presentation.schemas.bot import UpdateBotSchema
 
 logger = logging.getLogger(__name__)
@@ -14,9 +15,11 @@ logger = logging.getLogger(__name__)
 @dataclass
 class UpdateBotUseCase:
     _bot_repository: BaseBotRepository
+    _bot_catalog: BotCatalogService
+    _admin_notifier: AdminNotifier
 
     async def execute(
-        self, bot_id: int, admin: UserEntity, update_schema: UpdateBotSchema
+        self, bot_id: int, admin: UserPrincipal, update_schema: UpdateBotSchema
     ) -> BotEntity:
         bot: BotEntity | None = await self._bot_repository.get_bot_with_rentals(
             bot_id=bot_id
@@ -32,10 +35,14 @@ class UpdateBotUseCase:
         )
 
         updated_bot: BotEntity = await self._bot_repository.update(bot_entity=bot)
+        await self._bot_catalog.rebuild()
         logger.info(
-            f'Администратор: {admin.telegram_id.to_raw()} обновил бота: {bot.id} -> ({update_schema})'
+            'Администратор: %s обновил бота: %s -> (%s)',
+            admin.telegram_id.to_raw(),
+            bot.id,
+            update_schema,
         )
-        await send_notification_for_admin.kiq(
+        await self._admin_notifier.notify(
             text=f'Администратор: {admin.telegram_id.to_raw()} обновил бота: {bot.id} -> ({update_schema})'
         )
         return updated_bot
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from src.domain.broadcast.entity import BroadcastEntity
+from src.infrastructure.repositories.broadcast.base import BaseBroadcastRepository
+from src.infrastructure.repositories.telegram.base import BaseTelegramRepository
+from src.infrastructure.telegram.dispatcher import TelegramSendDispatcher
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE: int = 100
+CHUNK_SECONDS: float = 30.0
+LOCK_TTL_SECONDS: int = 60
+LOCK_RENEW_SECONDS: float = LOCK_TTL_SECONDS / 3
+
+
+@dataclass
+class RunBroadcastUseCase:
+    _broadcast_repository: BaseBroadcastRepository
+    _telegram_repository: BaseTelegramRepository
+    _sender: TelegramSendDispatcher
+    _owner: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    async def execute(self, broadcast_id: int) -> bool:
+        broadcast: BroadcastEntity | None = await self._broadcast_repository.get(
+            broadcast_id=broadcast_id
+        )
+
+        if broadcast is None or broadcast.is_finished:
+            return False
+
+        if not await self._wait_for_lock(broadcast_id):
+            logger.info('Рассылка id=%s уже выполняется другим воркером', broadcast_id)
+            return False
+
+        try:
+            # Пока ждали блокировку, курсор мог сдвинуться.
+            broadcast = await self._broadcast_repository.get(broadcast_id=broadcast_id)
+            if broadcast is None or broadcast.is_finished:
+                return False
+            return await self._run_chunk_locked(broadcast)
+        finally:
+            await self._broadcast_repository.release_lock(
+                broadcast_id=broadcast_id, owner=self._owner
+            )
+
+    async def _run_chunk_locked(self, broadcast: BroadcastEntity) -> bool:
+        # Пауза flood control может растянуть одну порцию дольше TTL блокировки,
+        # поэтому она продлевается по таймеру, пока идет отправка. Если
+        # блокировку все же потеряли, порция прерывается: ее доделает воркер,
+        # который блокировку взял.
+        chunk = asyncio.create_task(self._run_chunk(broadcast))
+        keeper = asyncio.create_task(self._keep_lock(broadcast.id))
+        try:
+            done, _ = await asyncio.wait(
+                {chunk, keeper}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            chunk.cancel()
+            keeper.cancel()
+            await asyncio.gather(chunk, keeper, return_exceptions=True)
+
+        if chunk in done:
+            return chunk.result()
+
+        keeper.result()
+        logger.warning(
+            'Блокировка рассылки id=%s потеряна, порция прервана', broadcast.id
+        )
+        return False
+
+    async def _keep_lock(self, broadcast_id: int) -> None:
+        while True:
+            await asyncio.sleep(LOCK_RENEW_SECONDS)
+            if not await self._broadcast_repository.extend_lock(
+                broadcast_id=broadcast_id, owner=self._owner, ttl=LOCK_TTL_SECONDS
+            ):
+                return
+
+    async def _run_chunk(self, broadcast: BroadcastEntity) -> bool:
+        deadline: float = time.monotonic() + CHUNK_SECONDS
+        cursor: int = broadcast.cursor
+
+        while time.monotonic() < deadline:
+            recipients: list[
+                tuple[int, int]
+            ] = await self._telegram_repository.get_recipients_batch(
+                after_id=cursor, limit=BATCH_SIZE
+            )
+
+            if not recipients:
+                await self._broadcast_repository.finish(broadcast_id=broadcast.id)
+                return False
+
+            results: list[bool] = await asyncio.gather(
+                *(
+                    self._sender.copy_message(
+                        chat_id=chat_id,
+                        from_chat_id=broadcast.from_chat_id,
+                        message_id=broadcast.message_id,
+                    )
+                    for _, chat_id in recipients
+                )
+            )
+            cursor = recipients[-1][0]
+            sent: int = sum(results)
+
+            await self._broadcast_repository.save_progress(
+                broadcast_id=broadcast.id,
+                cursor=cursor,
+                sent=sent,
+                failed=len(results) - sent,
+            )
+
+        return True
+
+    async def _wait_for_lock(self, broadcast_id: int) -> bool:
+        # После падения воркера сообщение вернется в очередь раньше, чем истечет
+        # блокировка упавшего воркера, поэтому ждем ее не дольше TTL.
+        deadline: float = time.monotonic() + LOCK_TTL_SECONDS
+
+        while not await self._broadcast_repository.acquire_lock(
+            broadcast_id=broadcast_id, owner=self._owner, ttl=LOCK_TTL_SECONDS
+        ):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(1)
+
+        return True
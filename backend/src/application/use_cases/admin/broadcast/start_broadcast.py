@@ -0,0 +1,37 @@
+import logging
+from dataclasses import dataclass
+
+from src.domain.broadcast.entity import BroadcastEntity
+from src.infrastructure.repositories.broadcast.base import BaseBroadcastRepository
+from src.infrastructure.repositories.telegram.base import BaseTelegramRepository
+from src.infrastructure.taskiq.tasks import run_broadcast
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartBroadcastUseCase:
+    _broadcast_repository: BaseBroadcastRepository
+    _telegram_repository: BaseTelegramRepository
+
+    async def execute(self, from_chat_id: int, message_id: int) -> BroadcastEntity:
+        broadcast: BroadcastEntity = await self._broadcast_repository.add(
+            entity=BroadcastEntity(
+                from_chat_id=from_chat_id,
+                message_id=message_id,
+                total=await self._telegram_repository.count_users(),
+            )
+        )
+        await run_broadcast.kiq(broadcast_id=broadcast.id)
+        logger.info('Рассылка id=%s поставлена в очередь', broadcast.id)
+        return broadcast
+
+
+@dataclass
+class GetBroadcastStatusUseCase:
+    _broadcast_repository: BaseBroadcastRepository
+
+    async def execute(self, broadcast_id: int | None = None) -> BroadcastEntity | None:
+        if broadcast_id is None:
+            return await self._broadcast_repository.get_latest()
+        return await self._broadcast_repository.get(broadcast_id=broadcast_id)
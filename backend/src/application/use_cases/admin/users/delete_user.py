@@ -1,10 +1,14 @@
 import logging
 from dataclasses import dataclass
 
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.services.admin_notifier import AdminNotifier
 from src.domain.user.entity import UserEntity
 from src.domain.user.exception import PermissionDeniedException, UserNotFoundException
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseUserCacheService
+from src.infrastructure.database.routing import ReadReplicaRouter
 from src.infrastructure.repositories.user.base import BaseUserRepository
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +16,14 @@ logger = logging.getLogger(__name__)
 @dataclass
 class DeleteUserUseCase:
     _user_repository: BaseUserRepository
+    _user_cache: BaseUserCacheService
+    _admin_notifier: AdminNotifier
+    _session: AsyncSession
+    _replica_router: ReadReplicaRouter
 
-    async def execute(self, telegram_id: int, admin: UserEntity) -> UserEntity | None:
+    async def execute(
+        self, telegram_id: int, admin: UserPrincipal
+    ) -> UserEntity | None:
         user: UserEntity | None = await self._user_repository.get_user_by_telegram_id(
             telegram_id=telegram_id
         )
@@ -23,29 +33,41 @@ class DeleteUserUseCase:
 
         if user.telegram_id.to_raw() == admin.telegram_id.to_raw():
             logger.warning(
-                f'Администратор: {admin.telegram_id.to_raw()} попытался удалить сам себя'
+                'Администратор: %s попытался удалить сам себя',
+                admin.telegram_id.to_raw(),
             )
-            await send_notification_for_admin.kiq(
-                text=f'Администратор: {admin.telegram_id.to_raw()} попытался удалить сам себя'
+            await self._admin_notifier.notify(
+                text=f'Администратор: {admin.telegram_id.to_raw()} попытался удалить сам себя',
+                priority=True,
             )
             raise PermissionDeniedException()
 
         if user.role in ['dev', 'admin']:
             logger.warning(
-                f'Администратор: {admin.telegram_id.to_raw()} попытался удалить администратора: {user.telegram_id.to_raw()}'
+                'Администратор: %s попытался удалить администратора: %s',
+                admin.telegram_id.to_raw(),
+                user.telegram_id.to_raw(),
             )
-            await send_notification_for_admin.kiq(
-                text=f'Администратор: {admin.telegram_id.to_raw()} попытался удалить администратора: {user.telegram_id.to_raw()}'
+            await self._admin_notifier.notify(
+                text=f'Администратор: {admin.telegram_id.to_raw()} попытался удалить администратора: {user.telegram_id.to_raw()}',
+                priority=True,
             )
             raise PermissionDeniedException()
 
         if not user.is_deleted:
             user.delete()
             deleted_user: UserEntity = await self._user_repository.update(entity=user)
+            await self._replica_router.pin_primary(
+                user.telegram_id.to_raw(), admin.telegram_id.to_raw()
+            )
+            await self._session.commit()
+            await self._user_cache.invalidate(telegram_id=user.telegram_id.to_raw())
             logger.info(
-                f'Администратор: {admin.telegram_id.to_raw()} удалил пользователя: {user.telegram_id.to_raw()}'
+                'Администратор: %s удалил пользователя: %s',
+                admin.telegram_id.to_raw(),
+                user.telegram_id.to_raw(),
             )
-            await send_notification_for_admin.kiq(
+            await self._admin_notifier.notify(
                 text=f'Администратор: {admin.telegram_id.to_raw()} удалил пользователя: {user.telegram_id.to_raw()}'
             )
             return deleted_user
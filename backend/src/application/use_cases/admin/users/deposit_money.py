@@ -2,10 +2,12 @@ import logging
 from dataclasses import dataclass
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.domain.user.entity import UserEntity
+from src.application.services.admin_notifier import AdminNotifier
 from src.domain.user.exception import UserNotFoundException
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseUserCacheService
+from src.infrastructure.database.routing import ReadReplicaRouter
 from src.infrastructure.repositories.user.base import BaseUserRepository
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 from src.presentation.schemas.user import UpdateBalance
 
 logger = logging.getLogger(__name__)
@@ -15,28 +17,34 @@ logger = logging.getLogger(__name__)
 class DepositMoneyForUser:
     _session: AsyncSession
     _user_repository: BaseUserRepository
+    _user_cache: BaseUserCacheService
+    _admin_notifier: AdminNotifier
+    _replica_router: ReadReplicaRouter
 
     async def execute(
-        self, telegram_id: int, admin: UserEntity, schema: UpdateBalance
+        self, telegram_id: int, admin: UserPrincipal, schema: UpdateBalance
     ) -> bool:
-        user: UserEntity | None = await self._user_repository.get_user_by_telegram_id(
-            telegram_id=telegram_id
+        new_balance: int | None = await self._user_repository.change_balance(
+            telegram_id=telegram_id, amount=schema.amount
         )
-        old_balance: int = user.balance.to_raw()
 
-        if not user:
+        if new_balance is None:
             raise UserNotFoundException()
 
-        user.deposit(amount=schema.amount)
-
-        await self._user_repository.update(entity=user)
+        await self._replica_router.pin_primary(telegram_id, admin.telegram_id.to_raw())
         await self._session.commit()
+        await self._user_cache.invalidate(telegram_id=telegram_id)
+        old_balance: int = new_balance - schema.amount
 
         logger.info(
-            f'Администратор: {admin.telegram_id.to_raw()} увеличил баланс пользователя: {user.telegram_id.to_raw()} ({old_balance} -> {user.balance.to_raw()})',
+            'Администратор: %s увеличил баланс пользователя: %s (%s -> %s)',
+            admin.telegram_id.to_raw(),
+            telegram_id,
+            old_balance,
+            new_balance,
         )
-        await send_notification_for_admin.kiq(
-            text=f'Администратор: {admin.telegram_id.to_raw()} увеличил баланс пользователя: {user.telegram_id.to_raw()} ({old_balance} -> {user.balance.to_raw()})'
+        await self._admin_notifier.notify(
+            text=f'Администратор: {admin.telegram_id.to_raw()} увеличил баланс пользователя: {telegram_id} ({old_balance} -> {new_balance})'
         )
 
         return True
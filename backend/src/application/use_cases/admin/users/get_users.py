@@ -1,10 +1,17 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
+from src.application.services.admin_notifier import AdminNotifier
 from src.domain.user.entity import UserEntity
 from src.domain.user.exception import UserNotFoundException
+from src.domain.user.listing import (
+    UserListFilter,
+    UserPage,
+    UserRelation,
+    UserSummary,
+)
+from src.domain.user.principal import UserPrincipal
 from src.infrastructure.repositories.user.base import BaseUserRepository
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 
 logger = logging.getLogger(__name__)
 
@@ -12,28 +19,72 @@ logger = logging.getLogger(__name__)
 @dataclass
 class GetAllUsersUseCase:
     _user_repository: BaseUserRepository
+    _admin_notifier: AdminNotifier
 
-    async def execute(self, admin: UserEntity) -> list[UserEntity] | None:
-        users: list[UserEntity] | None = await self._user_repository.get_all_users()
+    async def execute(
+        self,
+        admin: UserPrincipal,
+        filters: UserListFilter,
+        limit: int,
+        cursor: int | None = None,
+        with_count: bool = False,
+        relations: frozenset[UserRelation] = frozenset(),
+    ) -> UserPage:
+        users: list[UserSummary] = await self._user_repository.get_user_summaries(
+            filters=filters, limit=limit + 1, after_id=cursor
+        )
 
-        if not users:
-            return None
+        next_cursor: int | None = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = users[-1].id
 
-        logger.info(
-            f'Администратор {admin.telegram_id.value} получил список пользователей'
-        )
-        await send_notification_for_admin.kiq(
-            text=f'Администратор {admin.telegram_id.value} получил список пользователей'
+        if relations and users:
+            entities: dict[int, UserEntity] = {
+                user.id: user
+                for user in await self._user_repository.get_users_with_relations(
+                    user_ids=[user.id for user in users], relations=relations
+                )
+            }
+            users = [
+                replace(
+                    user,
+                    **{
+                        relation.value: getattr(entities[user.id], relation.value)
+                        for relation in relations
+                    },
+                )
+                if user.id in entities
+                else user
+                for user in users
+            ]
+
+        total: int | None = (
+            await self._user_repository.count_users(filters=filters)
+            if with_count
+            else None
         )
 
-        return users
+        # Уведомляем только о первой странице, чтобы обход списка не спамил.
+        if cursor is None:
+            logger.info(
+                'Администратор %s получил список пользователей', admin.telegram_id.value
+            )
+            await self._admin_notifier.notify(
+                text=f'Администратор {admin.telegram_id.value} получил список пользователей'
+            )
+
+        return UserPage(items=users, next_cursor=next_cursor, total=total)
 
 
 @dataclass
 class GetUserByTelegramId:
     _user_repository: BaseUserRepository
+    _admin_notifier: AdminNotifier
 
-    async def execute(self, telegram_id: int, admin: UserEntity) -> UserEntity | None:
+    async def execute(
+        self, telegram_id: int, admin: UserPrincipal
+    ) -> UserEntity | None:
         user: (
             UserEntity | None
         ) = await self._user_repository.get_full_user_info_for_admin(
@@ -44,9 +95,11 @@ class GetUserByTelegramId:
             raise UserNotFoundException()
 
         logger.info(
-            f'Администратор {admin.telegram_id.to_raw()} получил пользователя: {user.telegram_id.to_raw()}'
+            'Администратор %s получил пользователя: %s',
+            admin.telegram_id.to_raw(),
+            user.telegram_id.to_raw(),
         )
-        await send_notification_for_admin.kiq(
+        await self._admin_notifier.notify(
             text=f'Администратор {admin.telegram_id.to_raw()} получил пользователя: {user.telegram_id.to_raw()}'
         )
         return user
@@ -1,14 +1,18 @@
 import logging
 from dataclasses import dataclass
 
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.services.admin_notifier import AdminNotifier
 from src.domain.user.blocked_user import BlockedUserEntity
 from src.domain.user.entity import UserEntity
 from src.domain.user.exception import UserNotFoundException
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseUserCacheService
+from src.infrastructure.database.routing import ReadReplicaRouter
 from src.infrastructure.repositories.user.base import (
     BaseBlockedUserRepository,
     BaseUserRepository,
 )
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +21,12 @@ logger = logging.getLogger(__name__)
 class UnblockUserUseCase:
     _user_repository: BaseUserRepository
     _blocked_user_repository: BaseBlockedUserRepository
+    _user_cache: BaseUserCacheService
+    _admin_notifier: AdminNotifier
+    _session: AsyncSession
+    _replica_router: ReadReplicaRouter
 
-    async def execute(self, telegram_id: int, admin: UserEntity) -> bool:
+    async def execute(self, telegram_id: int, admin: UserPrincipal) -> bool:
         user: UserEntity | None = await self._user_repository.get_user_by_telegram_id(
             telegram_id=telegram_id
         )
@@ -29,10 +37,17 @@ class UnblockUserUseCase:
         block: BlockedUserEntity = user.unblock()
 
         await self._blocked_user_repository.update(block=block)
+        await self._replica_router.pin_primary(
+            user.telegram_id.to_raw(), admin.telegram_id.to_raw()
+        )
+        await self._session.commit()
+        await self._user_cache.invalidate(telegram_id=user.telegram_id.to_raw())
         logger.info(
-            f'Администратор: {admin.telegram_id.to_raw()} разблокировал пользователя: {user.telegram_id.to_raw()}'
+            'Администратор: %s разблокировал пользователя: %s',
+            admin.telegram_id.to_raw(),
+            user.telegram_id.to_raw(),
         )
-        await send_notification_for_admin.kiq(
+        await self._admin_notifier.notify(
             text=f'Администратор: {admin.telegram_id.to_raw()} разблокировал пользователя: {user.telegram_id.to_raw()}'
         )
         return True
@@ -1,10 +1,14 @@
 import logging
 from dataclasses import dataclass
 
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.services.admin_notifier import AdminNotifier
 from src.domain.user.entity import Role, UserEntity
 from src.domain.user.exception import PermissionDeniedException, UserNotFoundException
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseUserCacheService
+from src.infrastructure.database.routing import ReadReplicaRouter
 from src.infrastructure.repositories.user.base import BaseUserRepository
-from src.infrastructure.taskiq.tasks import send_notification_for_admin
 from src.presentation.schemas.user import UpdateUserRole
 
 logger = logging.getLogger(__name__)
@@ -13,9 +17,13 @@ logger = logging.getLogger(__name__)
 @dataclass
 class UpdateUserRoleUseCase:
     _user_repository: BaseUserRepository
+    _user_cache: BaseUserCacheService
+    _admin_notifier: AdminNotifier
+    _session: AsyncSession
+    _replica_router: ReadReplicaRouter
 
     async def execute(
-        self, telegram_id: int, admin: UserEntity, new_role: UpdateUserRole
+        self, telegram_id: int, admin: UserPrincipal, new_role: UpdateUserRole
     ) -> UserEntity:
         user: UserEntity | None = await self._user_repository.get_user_by_telegram_id(
             telegram_id=telegram_id
@@ -26,19 +34,24 @@ class UpdateUserRoleUseCase:
 
         if user.telegram_id.to_raw() == admin.telegram_id.to_raw():
             logger.warning(
-                f'Администратор: {admin.telegram_id.to_raw()} попытался сменить роль сам себе'
+                'Администратор: %s попытался сменить роль сам себе',
+                admin.telegram_id.to_raw(),
             )
-            await send_notification_for_admin.kiq(
-                text=f'Администратор: {admin.telegram_id.to_raw()} попытался сменить роль сам себе'
+            await self._admin_notifier.notify(
+                text=f'Администратор: {admin.telegram_id.to_raw()} попытался сменить роль сам себе',
+                priority=True,
             )
             raise PermissionDeniedException()
 
         if user.role == Role.DEV:
             logger.warning(
-                f'Администратор: {admin.telegram_id.to_raw()} попытался сменить роль у разработчика: {user.telegram_id.to_raw()}'
+                'Администратор: %s попытался сменить роль у разработчика: %s',
+                admin.telegram_id.to_raw(),
+                user.telegram_id.to_raw(),
             )
-            await send_notification_for_admin.kiq(
-                text=f'Администратор: {admin.telegram_id.to_raw()} попытался сменить роль у разработчика: {user.telegram_id.to_raw()}'
+            await self._admin_notifier.notify(
+                text=f'Администратор: {admin.telegram_id.to_raw()} попытался сменить роль у разработчика: {user.telegram_id.to_raw()}',
+                priority=True,
             )
             raise PermissionDeniedException()
 
@@ -47,10 +60,19 @@ class UpdateUserRoleUseCase:
         if user.role != new_role.role:
             user.change_role(new_role=new_role.role)
             await self._user_repository.update(entity=user)
+            await self._replica_router.pin_primary(
+                user.telegram_id.to_raw(), admin.telegram_id.to_raw()
+            )
+            await self._session.commit()
+            await self._user_cache.invalidate(telegram_id=user.telegram_id.to_raw())
             logger.info(
-                f'Администратор: {admin.telegram_id.to_raw()} сменил роль пользователю: {user.telegram_id.to_raw()} ({old_role} -> {new_role.role})'
+                'Администратор: %s сменил роль пользователю: %s (%s -> %s)',
+                admin.telegram_id.to_raw(),
+                user.telegram_id.to_raw(),
+                old_role,
+                new_role.role,
             )
-            await send_notification_for_admin.kiq(
+            await self._admin_notifier.notify(
                 text=f'Администратор: {admin.telegram_id.to_raw()} сменил роль пользователю: {user.telegram_id.to_raw()} ({old_role} -> {new_role.role})'
             )
         return user
@@ -0,0 +1,58 @@
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.services.admin_notifier import AdminNotifier
+from src.domain.balance.exception import InsufficientFundsError
+from src.domain.user.exception import UserNotFoundException
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseUserCacheService
+from src.infrastructure.database.routing import ReadReplicaRouter
+from src.infrastructure.repositories.user.base import BaseUserRepository
+from src.presentation.schemas.user import UpdateBalance
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WithdrawMoneyForUser:
+    _session: AsyncSession
+    _user_repository: BaseUserRepository
+    _user_cache: BaseUserCacheService
+    _admin_notifier: AdminNotifier
+    _replica_router: ReadReplicaRouter
+
+    async def execute(
+        self, telegram_id: int, admin: UserPrincipal, schema: UpdateBalance
+    ) -> bool:
+        new_balance: int | None = await self._user_repository.change_balance(
+            telegram_id=telegram_id, amount=-schema.amount
+        )
+
+        if new_balance is None:
+            user: (
+                UserPrincipal | None
+            ) = await self._user_repository.get_principal_by_telegram_id(
+                telegram_id=telegram_id
+            )
+            if user is None:
+                raise UserNotFoundException()
+            raise InsufficientFundsError()
+
+        await self._replica_router.pin_primary(telegram_id, admin.telegram_id.to_raw())
+        await self._session.commit()
+        await self._user_cache.invalidate(telegram_id=telegram_id)
+        old_balance: int = new_balance + schema.amount
+
+        logger.info(
+            'Администратор: %s уменьшил баланс пользователя: %s (%s -> %s)',
+            admin.telegram_id.to_raw(),
+            telegram_id,
+            old_balance,
+            new_balance,
+        )
+        await self._admin_notifier.notify(
+            text=f'Администратор: {admin.telegram_id.to_raw()} уменьшил баланс пользователя: {telegram_id} ({old_balance} -> {new_balance})'
+        )
+
+        return True
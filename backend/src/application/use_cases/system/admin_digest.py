@@ -0,0 +1,59 @@
+import logging
+from dataclasses import dataclass
+
+from src.domain.audit.event import AuditEvent
+from src.infrastructure.repositories.audit.base import BaseAuditEventRepository
+from src.infrastructure.telegram.dispatcher import TelegramSendDispatcher
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_MESSAGE_LIMIT: int = 4096
+
+
+def build_digest_messages(events: list[AuditEvent]) -> list[str]:
+    header: str = f'📋 Действия администраторов ({len(events)}):'
+    messages: list[str] = []
+    current: str = header
+
+    for event in events:
+        line: str = f'• {event.created_at:%H:%M:%S} {event.text}'
+        if len(current) + len(line) + 1 > TELEGRAM_MESSAGE_LIMIT:
+            messages.append(current)
+            current = line[:TELEGRAM_MESSAGE_LIMIT]
+        else:
+            current = f'{current}\n{line}'
+
+    messages.append(current)
+    return messages
+
+
+@dataclass
+class FlushAdminDigestUseCase:
+    _audit_repository: BaseAuditEventRepository
+    _sender: TelegramSendDispatcher
+    _chat_id: int
+    _max_events: int
+
+    async def execute(self) -> int:
+        # Окно закрываем до выборки, чтобы события, пришедшие во время отправки,
+        # открыли новое окно и не остались без сводки.
+        await self._audit_repository.close_window()
+        total: int = 0
+
+        while True:
+            events: list[AuditEvent] = await self._audit_repository.pop_batch(
+                limit=self._max_events
+            )
+            if not events:
+                return total
+
+            for text in build_digest_messages(events):
+                if not await self._sender.send_message(
+                    chat_id=self._chat_id, text=text
+                ):
+                    # События возвращаются в буфер и уйдут со следующей сводкой.
+                    await self._audit_repository.requeue(events)
+                    logger.error('Сводка для администратора не отправлена')
+                    return total
+
+            total += len(events)
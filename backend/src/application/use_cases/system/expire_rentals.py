@@ -0,0 +1,108 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.const import MOSCOW_TZ
+from src.domain.bot.expiry import ExpiredRental, ExpiringRental
+from src.infrastructure.cache.base import BaseCacheService, BaseUserCacheService
+from src.infrastructure.database.routing import ReadReplicaRouter
+from src.infrastructure.repositories.rental.base import BaseRentalRepository
+from src.infrastructure.telegram.dispatcher import TelegramSendDispatcher
+
+logger = logging.getLogger(__name__)
+
+EXPIRY_BATCH_SIZE: int = 500
+EXPIRY_MAX_BATCHES: int = 20
+REMINDER_SENT_KEY: str = 'rental:reminded'
+REMINDER_SENT_TTL_SECONDS: int = 7 * 24 * 60 * 60
+
+
+@dataclass
+class ExpireRentalsUseCase:
+    _rental_repository: BaseRentalRepository
+    _user_cache: BaseUserCacheService
+    _session: AsyncSession
+    _replica_router: ReadReplicaRouter
+
+    async def execute(self) -> int:
+        now: datetime = datetime.now(tz=MOSCOW_TZ)
+        total: int = 0
+
+        # Каждая порция коммитится отдельно, чтобы не держать долгие блокировки.
+        for _ in range(EXPIRY_MAX_BATCHES):
+            expired: list[
+                ExpiredRental
+            ] = await self._rental_repository.deactivate_expired(
+                now=now, limit=EXPIRY_BATCH_SIZE
+            )
+            telegram_ids: set[int] = {rental.telegram_id for rental in expired}
+            await self._replica_router.pin_primary(*telegram_ids)
+            await self._session.commit()
+
+            for telegram_id in telegram_ids:
+                await self._user_cache.invalidate(telegram_id=telegram_id)
+
+            total += len(expired)
+            if len(expired) < EXPIRY_BATCH_SIZE:
+                break
+
+        if total:
+            logger.info('Истекшие аренды деактивированы: %s', total)
+        return total
+
+
+@dataclass
+class ExpireRentalUseCase:
+    _rental_repository: BaseRentalRepository
+    _user_cache: BaseUserCacheService
+    _session: AsyncSession
+    _replica_router: ReadReplicaRouter
+
+    async def execute(self, rental_id: int) -> bool:
+        repository: BaseRentalRepository = self._rental_repository
+        now: datetime = datetime.now(tz=MOSCOW_TZ)
+        expired: ExpiredRental | None = await repository.deactivate_expired_by_id(
+            rental_id=rental_id, now=now
+        )
+
+        if expired is None:
+            return False
+
+        await self._replica_router.pin_primary(expired.telegram_id)
+        await self._session.commit()
+        await self._user_cache.invalidate(telegram_id=expired.telegram_id)
+        return True
+
+
+@dataclass
+class RemindExpiringRentalUseCase:
+    _rental_repository: BaseRentalRepository
+    _cache_service: BaseCacheService
+    _sender: TelegramSendDispatcher
+
+    async def execute(self, rental_id: int, rented_until: datetime) -> bool:
+        repository: BaseRentalRepository = self._rental_repository
+        rental: ExpiringRental | None = await repository.get_expiring_by_id(
+            rental_id=rental_id
+        )
+
+        # Остановленной аренде не напоминаем, продленная получит свое напоминание.
+        if rental is None or rental.rented_until != rented_until:
+            return False
+
+        # Сообщение может прийти повторно после падения воркера.
+        if not await self._cache_service.set(
+            f'{REMINDER_SENT_KEY}:{rental_id}:{int(rented_until.timestamp())}',
+            1,
+            nx=True,
+            ex=REMINDER_SENT_TTL_SECONDS,
+        ):
+            return False
+
+        return await self._sender.send_message(
+            chat_id=rental.telegram_id,
+            text=f'⏳ Аренда бота «{rental.bot_name}» закончится '
+            f'{rental.rented_until:%d.%m.%Y %H:%M}. '
+            f'Продлите ее, чтобы бот продолжил работу.',
+        )
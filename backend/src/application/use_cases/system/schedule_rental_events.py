@@ -0,0 +1,45 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.application.services.rental_events import RentalEventScheduler
+from src.const import MOSCOW_TZ
+from src.domain.bot.expiry import ExpiringRental
+from src.infrastructure.repositories.rental.base import BaseRentalRepository
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_BATCH_SIZE: int = 500
+
+
+@dataclass
+class ScheduleRentalEventsUseCase:
+    _rental_repository: BaseRentalRepository
+    _rental_events: RentalEventScheduler
+
+    async def execute(self) -> int:
+        now: datetime = datetime.now(tz=MOSCOW_TZ)
+        cursor: int = 0
+        total: int = 0
+
+        while True:
+            rentals: list[ExpiringRental] = await self._rental_repository.get_expiring(
+                expires_from=now,
+                expires_to=datetime.max.replace(tzinfo=MOSCOW_TZ),
+                after_id=cursor,
+                limit=SCHEDULE_BATCH_SIZE,
+            )
+
+            if not rentals:
+                break
+
+            for rental in rentals:
+                await self._rental_events.schedule(
+                    rental_id=rental.rental_id, rented_until=rental.rented_until
+                )
+
+            cursor = rentals[-1].rental_id
+            total += len(rentals)
+
+        logger.info('Запланированы события для аренд: %s', total)
+        return total
@@ -51,7 +51,7 @@ class RegisterUserUseCase:
                 UserEntity | None
             ) = await self._user_repository.get_user_by_telegram_id(telegram_id=ref_id)
             if not referrer_user:
-                logger.warning(f'Реферер с telegram_id={ref_id} не найден')
+                logger.warning('Реферер с telegram_id=%s не найден', ref_id)
                 await self._cache_service.delete(
                     key=f'{new_user.telegram_id.to_raw()}:referral'
                 )
@@ -72,12 +72,12 @@ class RegisterUserUseCase:
                 key=f'{new_user.telegram_id.to_raw()}:referral'
             )
 
-        logger.info(f'Новый пользователь {telegram_id} зарегистрирован')
+        logger.info('Новый пользователь %s зарегистрирован', telegram_id)
         await send_notification.kiq(
             user_id=telegram_id,
             text=f'Вы успешно зарегистрировались на сервисе BotRental\n{datetime.strftime(new_user.created_at, "%d.%m.%Y %H:%M")}',
         )
-        logger.info(f'Пользователю {telegram_id} направлено уведомление в Telegram')
+        logger.info('Пользователю %s направлено уведомление в Telegram', telegram_id)
 
         access_token, refresh_token = self._jwt_service.create_tokens(
             data={'sub': str(created_user.telegram_id.to_raw())}
@@ -117,7 +117,7 @@ class VerifyCodeUseCase:
                 user=user
             )
 
-            logger.info(f'Пользователь {user.telegram_id.to_raw()} совершил вход.')
+            logger.info('Пользователь %s совершил вход.', user.telegram_id.to_raw())
             current_datetime = datetime.now(tz=MOSCOW_TZ)
 
             await send_notification.kiq(
@@ -126,7 +126,8 @@ class VerifyCodeUseCase:
             )
 
             logger.info(
-                f'Пользователю {user.telegram_id.to_raw()} направлено уведомление в Telegram'
+                'Пользователю %s направлено уведомление в Telegram',
+                user.telegram_id.to_raw(),
             )
             return user, access_token, refresh_token
 
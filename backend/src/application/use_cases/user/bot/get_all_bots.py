@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
-from src.domain.bot.entity import BotEntity
-from src.infrastructure.repositories.bot.base import BaseBotRepository
+from src.application.services.bot_catalog import BotCatalogService
+from src.domain.bot.catalog import BotCatalog
 
 
 @dataclass
 class GetAllBotsUseCase:
-    _bot_repository: BaseBotRepository
+    _bot_catalog: BotCatalogService
 
-    async def execute(self) -> list[BotEntity] | None:
-        return await self._bot_repository.get_all_bots()
+    async def execute(self) -> BotCatalog:
+        return await self._bot_catalog.get()
@@ -3,11 +3,18 @@ from datetime import datetime
 
 from dateutil.relativedelta import relativedelta
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.services.rental_events import RentalEventScheduler
 from src.const import MOSCOW_TZ
+from src.domain.balance.exception import InsufficientFundsError
 from src.domain.bot.entity import BotEntity, BotRentalEntity
 from src.domain.bot.exception import BotCannotBeRentedException, BotNotFoundException
-from src.domain.user.entity import UserEntity
-from src.infrastructure.cache.base import BaseCacheService
+from src.domain.user.exception import (
+    PermissionDeniedException,
+    UserNotFoundException,
+)
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseUserCacheService
+from src.infrastructure.database.routing import ReadReplicaRouter
 from src.infrastructure.repositories.bot.base import BaseBotRepository
 from src.infrastructure.repositories.rental.base import BaseRentalRepository
 from src.infrastructure.repositories.user.base import BaseUserRepository
@@ -19,12 +26,22 @@ class RentBotUseCase:
     _bot_repository: BaseBotRepository
     _user_repository: BaseUserRepository
     _bot_rental_repository: BaseRentalRepository
-    _cache_service: BaseCacheService
+    _user_cache: BaseUserCacheService
+    _rental_events: RentalEventScheduler
     _session: AsyncSession
+    _replica_router: ReadReplicaRouter
 
     async def execute(
-        self, bot_id: int, user: UserEntity, schema: CreateBotRentSchema
+        self, bot_id: int, principal: UserPrincipal, schema: CreateBotRentSchema
     ) -> BotRentalEntity:
+        # Принципал уже загружен при аутентификации, полный агрегат с блокировками
+        # и арендами здесь не нужен: баланс меняет change_balance.
+        if principal.is_deleted:
+            raise UserNotFoundException()
+
+        if principal.is_blocked:
+            raise PermissionDeniedException()
+
         bot: BotEntity | None = await self._bot_repository.get_bot_by_id(bot_id)
 
         if not bot:
@@ -33,24 +50,31 @@ class RentBotUseCase:
         if not bot.is_available:
             raise BotCannotBeRentedException()
 
+        new_balance: int | None = await self._user_repository.change_balance(
+            telegram_id=principal.telegram_id.to_raw(),
+            amount=-bot.price.to_raw() * schema.months,
+        )
+
+        if new_balance is None:
+            raise InsufficientFundsError()
+
         now: datetime = datetime.now(MOSCOW_TZ)
         rented_until: datetime = now + relativedelta(months=schema.months)
         rental_entity = BotRentalEntity.create_rental(
-            user_id=user.id,
+            user_id=principal.id,
             bot_id=bot.id,
             token=schema.token,
             rented_until=rented_until,
-            user=user,
+            user=None,
             bot=bot,
         )
 
         await self._bot_rental_repository.add(rental_entity)
-
-        user.withdraw(bot.price.to_raw() * schema.months)
-        user.add_rental(rental_entity)
-
-        await self._user_repository.update(user)
+        await self._replica_router.pin_primary(principal.telegram_id.to_raw())
         await self._session.commit()
-        await self._cache_service.delete(key=f'user:{str(user.telegram_id.to_raw())}')
+        await self._user_cache.invalidate(telegram_id=principal.telegram_id.to_raw())
+        await self._rental_events.schedule(
+            rental_id=rental_entity.id, rented_until=rental_entity.rented_until
+        )
 
         return rental_entity
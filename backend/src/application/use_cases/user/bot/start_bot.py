@@ -3,8 +3,9 @@ from dataclasses import dataclass
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.bot.entity import BotRentalEntity
 from src.domain.bot.exception import RentalNotFoundException
-from src.domain.user.entity import UserEntity
 from src.domain.user.exception import PermissionDeniedException
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.database.routing import ReadReplicaRouter
 from src.infrastructure.repositories.rental.base import BaseRentalRepository
 
 
@@ -12,8 +13,9 @@ from src.infrastructure.repositories.rental.base import BaseRentalRepository
 class StartBotRentalUseCase:
     _rental_repository: BaseRentalRepository
     _session: AsyncSession
+    _replica_router: ReadReplicaRouter
 
-    async def execute(self, rental_id: int, user: UserEntity) -> bool:
+    async def execute(self, rental_id: int, user: UserPrincipal) -> bool:
         rental: BotRentalEntity | None = await self._rental_repository.get_by_id(
             rental_id=rental_id
         )
@@ -28,6 +30,7 @@ class StartBotRentalUseCase:
 
         await self._rental_repository.update(rental=rental)
 
+        await self._replica_router.pin_primary(user.telegram_id.to_raw())
         await self._session.commit()
 
         return True
@@ -1,4 +1,5 @@
 from os import environ as env
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -9,20 +10,117 @@ class PostgresConfig(BaseModel):
     login: str = Field(alias='POSTGRES_USER')
     password: str = Field(alias='POSTGRES_PASSWORD')
     database: str = Field(alias='POSTGRES_DB')
+    pool_size: int = Field(alias='POSTGRES_POOL_SIZE', default=15, ge=1)
+    max_overflow: int = Field(alias='POSTGRES_MAX_OVERFLOW', default=15, ge=0)
+    pool_timeout: float = Field(alias='POSTGRES_POOL_TIMEOUT', default=10.0, gt=0)
+    pool_recycle: int = Field(alias='POSTGRES_POOL_RECYCLE', default=1800)
+    pool_pre_ping: bool = Field(alias='POSTGRES_POOL_PRE_PING', default=True)
+    statement_timeout_ms: int = Field(
+        alias='POSTGRES_STATEMENT_TIMEOUT_MS', default=30_000, ge=0
+    )
+    statement_cache_size: int = Field(
+        alias='POSTGRES_STATEMENT_CACHE_SIZE', default=100, ge=0
+    )
+    slow_query_ms: int = Field(alias='POSTGRES_SLOW_QUERY_MS', default=200, ge=0)
+    replica_dsn: str | None = Field(alias='POSTGRES_REPLICA_DSN', default=None)
+    read_your_writes_seconds: int = Field(
+        alias='POSTGRES_READ_YOUR_WRITES_SECONDS', default=5, ge=1
+    )
 
 
 class RedisConfig(BaseModel):
     host: str = Field(alias='REDIS_HOST')
     port: int = Field(alias='REDIS_PORT', default=6379)
+    db: int = Field(alias='REDIS_DB', default=0)
+    max_connections: int = Field(alias='REDIS_MAX_CONNECTIONS', default=50)
+    pool_timeout: float = Field(alias='REDIS_POOL_TIMEOUT', default=5.0)
+    socket_timeout: float = Field(alias='REDIS_SOCKET_TIMEOUT', default=5.0)
+    health_check_interval: int = Field(alias='REDIS_HEALTH_CHECK_INTERVAL', default=30)
+
+
+class MonitoringConfig(BaseModel):
+    sample_interval_seconds: float = Field(
+        alias='MONITORING_SAMPLE_INTERVAL', default=5.0, gt=0
+    )
+
+
+class LoggingConfig(BaseModel):
+    level: str = Field(alias='LOG_LEVEL', default='INFO')
+    format: Literal['json', 'text'] = Field(alias='LOG_FORMAT', default='json')
+    # Доля INFO-записей по префиксу логгера, например
+    # 'src.infrastructure.repositories=0.1,src.infrastructure.cache=0.05'.
+    sampling: str = Field(alias='LOG_SAMPLING', default='')
+
+
+class AdminDigestConfig(BaseModel):
+    window_seconds: float = Field(
+        alias='ADMIN_DIGEST_WINDOW_SECONDS', default=5.0, gt=0
+    )
+    max_events: int = Field(alias='ADMIN_DIGEST_MAX_EVENTS', default=50, ge=1)
 
 
 class TelegramConfig(BaseModel):
     token: str = Field(alias='TELEGRAM_TOKEN_BOT')
+    broadcast_rate: float = Field(alias='TELEGRAM_BROADCAST_RATE', default=25.0, gt=0)
+    broadcast_burst: int = Field(alias='TELEGRAM_BROADCAST_BURST', default=25, ge=1)
+    send_concurrency: int = Field(alias='TELEGRAM_SEND_CONCURRENCY', default=20, ge=1)
+    connection_limit: int = Field(alias='TELEGRAM_CONNECTION_LIMIT', default=50, ge=1)
+    request_timeout: float = Field(alias='TELEGRAM_REQUEST_TIMEOUT', default=30.0, gt=0)
+    api_url: str | None = Field(alias='TELEGRAM_API_URL', default=None)
+    interactive_rate: float = Field(
+        alias='TELEGRAM_INTERACTIVE_RATE', default=5.0, gt=0
+    )
+    interactive_burst: int = Field(alias='TELEGRAM_INTERACTIVE_BURST', default=5, ge=1)
+
+
+class BotConfig(BaseModel):
+    webhook_url: str | None = Field(alias='BOT_WEBHOOK_URL', default=None)
+    webhook_path: str = Field(alias='BOT_WEBHOOK_PATH', default='/webhook/telegram')
+    webhook_secret: str | None = Field(alias='BOT_WEBHOOK_SECRET', default=None)
+    webhook_host: str = Field(alias='BOT_WEBHOOK_HOST', default='0.0.0.0')
+    webhook_port: int = Field(alias='BOT_WEBHOOK_PORT', default=8080)
+    webhook_max_connections: int = Field(
+        alias='BOT_WEBHOOK_MAX_CONNECTIONS', default=40, ge=1, le=100
+    )
+    handle_in_background: bool = Field(alias='BOT_HANDLE_IN_BACKGROUND', default=True)
+    update_concurrency: int = Field(alias='BOT_UPDATE_CONCURRENCY', default=100, ge=1)
+    update_queue: bool = Field(alias='BOT_UPDATE_QUEUE', default=False)
+    update_partitions: int = Field(alias='BOT_UPDATE_PARTITIONS', default=16, ge=1)
+    update_worker_index: int = Field(alias='BOT_UPDATE_WORKER_INDEX', default=0, ge=0)
+    update_workers: int = Field(alias='BOT_UPDATE_WORKERS', default=1, ge=1)
+    fsm_ttl_seconds: int = Field(alias='BOT_FSM_TTL_SECONDS', default=86400, ge=1)
+    throttle_rate: float = Field(alias='BOT_THROTTLE_RATE', default=1.0, gt=0)
+    throttle_burst: int = Field(alias='BOT_THROTTLE_BURST', default=5, ge=1)
+    throttle_mode: Literal['drop', 'delay'] = Field(
+        alias='BOT_THROTTLE_MODE', default='drop'
+    )
+    throttle_max_delay: float = Field(alias='BOT_THROTTLE_MAX_DELAY', default=2.0, ge=0)
 
 
 class RabbitMQ(BaseModel):
-    user: str = Field(alias='RABBITMQ_DEFAULT_USER')
-    password: str = Field(alias='RABBITMQ_DEFAULT_PASS')
+    # Брокеры создаются при импорте модуля задач, поэтому у всех полей есть
+    # значения по умолчанию (как у самого RabbitMQ): импорт не должен падать
+    # без окружения, а неверные учетные данные видны при startup брокера.
+    user: str = Field(alias='RABBITMQ_DEFAULT_USER', default='guest')
+    password: str = Field(alias='RABBITMQ_DEFAULT_PASS', default='guest')
+    host: str = Field(alias='RABBITMQ_HOST', default='rabbitmq')
+    port: int = Field(alias='RABBITMQ_PORT', default=5672)
+    interactive_queue: str = Field(
+        alias='TASKIQ_INTERACTIVE_QUEUE', default='interactive_queue'
+    )
+    interactive_prefetch: int = Field(
+        alias='TASKIQ_INTERACTIVE_PREFETCH', default=20, ge=1
+    )
+    bulk_queue: str = Field(alias='TASKIQ_BULK_QUEUE', default='bulk_queue')
+    bulk_prefetch: int = Field(alias='TASKIQ_BULK_PREFETCH', default=4, ge=1)
+    metrics_port: int = Field(alias='TASKIQ_METRICS_PORT', default=9000)
+    depth_interval_seconds: float = Field(
+        alias='TASKIQ_QUEUE_DEPTH_INTERVAL', default=15.0, gt=0
+    )
+
+    @property
+    def url(self) -> str:
+        return f'amqp://{self.user}:{self.password}@{self.host}:{self.port}/'
 
 
 class JWT(BaseModel):
@@ -45,4 +143,12 @@ class Config(BaseModel):
     redis: RedisConfig = Field(default_factory=lambda: RedisConfig(**env))
     telegram: TelegramConfig = Field(default_factory=lambda: TelegramConfig(**env))
     rabbitmq: RabbitMQ = Field(default_factory=lambda: RabbitMQ(**env))
+    bot: BotConfig = Field(default_factory=lambda: BotConfig(**env))
     jwt: JWT = Field(default_factory=lambda: JWT(**env))
+    monitoring: MonitoringConfig = Field(
+        default_factory=lambda: MonitoringConfig(**env)
+    )
+    logging: LoggingConfig = Field(default_factory=lambda: LoggingConfig(**env))
+    admin_digest: AdminDigestConfig = Field(
+        default_factory=lambda: AdminDigestConfig(**env)
+    )
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import orjson
+from src.const import MOSCOW_TZ
+
+
+@dataclass(frozen=True)
+class AuditEvent:
+    text: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(tz=MOSCOW_TZ))
+
+    def to_json(self) -> bytes:
+        return orjson.dumps({'text': self.text, 'created_at': self.created_at})
+
+    @classmethod
+    def from_json(cls, raw: bytes | str) -> 'AuditEvent':
+        data: dict = orjson.loads(raw)
+        return cls(
+            text=data['text'], created_at=datetime.fromisoformat(data['created_at'])
+        )
@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class BotRentalSummary:
+    id: int
+    user_id: int
+    bot_id: int
+    token: str
+    rented_until: datetime
+    is_active: bool
+
+
+@dataclass(frozen=True, kw_only=True)
+class BotRentalPage:
+    items: list[BotRentalSummary]
+    next_cursor: int | None = field(default=None)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BotWithRentals:
+    id: int
+    created_at: datetime
+    updated_at: datetime
+    name: str
+    description: str
+    price: int
+    is_available: bool
+    is_deleted: bool
+    rentals: list[BotRentalSummary]
+    rentals_next_cursor: int | None = field(default=None)
@@ -0,0 +1,13 @@
+import hashlib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BotCatalog:
+    body: str
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: str) -> 'BotCatalog':
+        digest: str = hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+        return cls(body=body, etag=f'"{digest}"')
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ExpiredRental:
+    rental_id: int
+    telegram_id: int
+
+
+@dataclass(frozen=True)
+class ExpiringRental:
+    rental_id: int
+    telegram_id: int
+    bot_name: str
+    rented_until: datetime
@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+
+from src.domain.common.entity import BaseEntity
+
+
+class BroadcastStatus(StrEnum):
+    RUNNING = 'running'
+    FINISHED = 'finished'
+
+
+@dataclass(kw_only=True)
+class BroadcastEntity(BaseEntity):
+    from_chat_id: int
+    message_id: int
+    status: BroadcastStatus = field(default=BroadcastStatus.RUNNING)
+    cursor: int = field(default=0)
+    total: int = field(default=0)
+    sent: int = field(default=0)
+    failed: int = field(default=0)
+
+    @property
+    def remaining(self) -> int:
+        return max(self.total - self.sent - self.failed, 0)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status == BroadcastStatus.FINISHED
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'from_chat_id': self.from_chat_id,
+            'message_id': self.message_id,
+            'status': self.status.value,
+            'cursor': self.cursor,
+            'total': self.total,
+            'sent': self.sent,
+            'failed': self.failed,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BroadcastEntity':
+        return cls(
+            id=int(data['id']),
+            from_chat_id=int(data['from_chat_id']),
+            message_id=int(data['message_id']),
+            status=BroadcastStatus(data['status']),
+            cursor=int(data['cursor']),
+            total=int(data['total']),
+            sent=int(data['sent']),
+            failed=int(data['failed']),
+            created_at=datetime.fromisoformat(data['created_at']),
+            updated_at=datetime.fromisoformat(data['updated_at']),
+        )
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from fastapi import status
+
 
 @dataclass(eq=False)
 class ApplicationException(Exception):
@@ -12,3 +14,21 @@ class ApplicationException(Exception):
 
 @dataclass(eq=False)
 class DomainErrorException(ApplicationException): ...
+
+
+@dataclass(eq=False)
+class RequestInProgressException(DomainErrorException):
+    status_code: int = status.HTTP_409_CONFLICT
+
+    @property
+    def message(self) -> str:
+        return 'Запрос с этим ключом идемпотентности еще выполняется.'
+
+
+@dataclass(eq=False)
+class IdempotencyKeyReusedException(DomainErrorException):
+    status_code: int = status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @property
+    def message(self) -> str:
+        return 'Ключ идемпотентности уже использован для другого запроса.'
@@ -94,6 +94,16 @@ class TooManyCodeRequestsException(DomainErrorException):
         return 'Код уже был отправлен, попробуйте через 5 минут.'
 
 
+@dataclass(eq=False)
+class TooManyRequestsException(DomainErrorException):
+    status_code: int = status.HTTP_429_TOO_MANY_REQUESTS
+    retry_after: int = 1
+
+    @property
+    def message(self) -> str:
+        return f'Слишком много запросов, попробуйте через {self.retry_after} с.'
+
+
 @dataclass(eq=False)
 class InvalidBlockDurationException(DomainErrorException):
     status_code: int = status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+
+from src.domain.bot.entity import BotRentalEntity
+from src.domain.referral.entity import ReferralEntity
+from src.domain.user.blocked_user import BlockedUserEntity
+from src.domain.user.entity import Role
+from src.domain.user.value_object import TelegramId
+
+
+class UserRelation(StrEnum):
+    BLOCKS = 'blocks'
+    RENTALS = 'rentals'
+    REFERRALS = 'referrals'
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserListFilter:
+    role: Role | None = field(default=None)
+    is_blocked: bool | None = field(default=None)
+    is_deleted: bool | None = field(default=None)
+    balance_min: int | None = field(default=None)
+    balance_max: int | None = field(default=None)
+    created_from: datetime | None = field(default=None)
+    created_to: datetime | None = field(default=None)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserSummary:
+    id: int
+    created_at: datetime
+    telegram_id: TelegramId
+    role: Role
+    balance: int
+    is_deleted: bool
+    blocked_until: datetime | None = field(default=None)
+    referrer_id: int | None = field(default=None)
+    total_bonus_received: int = field(default=0)
+    blocks: list[BlockedUserEntity] | None = field(default=None)
+    rentals: list[BotRentalEntity] | None = field(default=None)
+    referrals: list[ReferralEntity] | None = field(default=None)
+
+    @property
+    def is_blocked(self) -> bool:
+        if self.blocked_until is None:
+            return False
+        return self.blocked_until > datetime.now(tz=self.blocked_until.tzinfo)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserPage:
+    items: list[UserSummary]
+    next_cursor: int | None = field(default=None)
+    total: int | None = field(default=None)
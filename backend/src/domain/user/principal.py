@@ -0,0 +1,67 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from src.domain.user.entity import Role, UserEntity
+from src.domain.user.value_object import TelegramId
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserPrincipal:
+    id: int
+    telegram_id: TelegramId
+    role: Role = field(default=Role.USER)
+    is_deleted: bool = field(default=False)
+    blocked_until: datetime | None = field(default=None)
+    # Блокировка без срока (blocked_until=None у BlockedUserEntity).
+    blocked_forever: bool = field(default=False)
+
+    @property
+    def is_blocked(self) -> bool:
+        if self.blocked_forever:
+            return True
+        if self.blocked_until is None:
+            return False
+        return self.blocked_until > datetime.now(tz=self.blocked_until.tzinfo)
+
+    @classmethod
+    def from_entity(cls, user: UserEntity) -> 'UserPrincipal':
+        return cls(
+            id=user.id,
+            telegram_id=user.telegram_id,
+            role=user.role,
+            is_deleted=user.is_deleted,
+            blocked_until=max(
+                (
+                    block.blocked_until
+                    for block in user.blocks
+                    if block.blocked_until is not None
+                ),
+                default=None,
+            ),
+            blocked_forever=any(block.blocked_until is None for block in user.blocks),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'telegram_id': self.telegram_id.to_raw(),
+            'role': self.role.value,
+            'is_deleted': self.is_deleted,
+            'blocked_until': self.blocked_until.isoformat()
+            if self.blocked_until
+            else None,
+            'blocked_forever': self.blocked_forever,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'UserPrincipal':
+        return cls(
+            id=data['id'],
+            telegram_id=TelegramId(data['telegram_id']),
+            role=Role(data['role']),
+            is_deleted=data['is_deleted'],
+            blocked_until=datetime.fromisoformat(data['blocked_until'])
+            if data.get('blocked_until')
+            else None,
+            blocked_forever=data.get('blocked_forever', False),
+        )
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Any
 
+from src.domain.bot.catalog import BotCatalog
+from src.domain.user.principal import UserPrincipal
+
 
 class BaseCacheService(ABC):
     @abstractmethod
@@ -15,6 +20,63 @@ class BaseCacheService(ABC):
     @abstractmethod
     async def delete(self, key: str) -> int: ...
 
+    @abstractmethod
+    async def close(self) -> None: ...
+
     @property
     @abstractmethod
     def client(self) -> Any: ...
+
+
+class BaseUserCacheService(ABC):
+    @abstractmethod
+    async def get(self, telegram_id: int) -> UserPrincipal | None: ...
+
+    @abstractmethod
+    async def set(self, user: UserPrincipal) -> None: ...
+
+    @abstractmethod
+    async def invalidate(self, telegram_id: int) -> None: ...
+
+
+class BaseBotCatalogCache(ABC):
+    @abstractmethod
+    async def get(self) -> BotCatalog | None: ...
+
+    @abstractmethod
+    async def set(self, catalog: BotCatalog) -> None: ...
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    limit: int
+    window_seconds: int
+
+
+class BaseRateLimiter(ABC):
+    @abstractmethod
+    async def hit(self, limits: list[tuple[str, RateLimit]]) -> float: ...
+
+
+class IdempotencyStatus(StrEnum):
+    ACQUIRED = 'acquired'
+    IN_PROGRESS = 'in_progress'
+    DONE = 'done'
+    MISMATCH = 'mismatch'
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    status: IdempotencyStatus
+    response: str | None = field(default=None)
+
+
+class BaseIdempotencyStore(ABC):
+    @abstractmethod
+    async def begin(self, key: str, fingerprint: str) -> IdempotencyRecord: ...
+
+    @abstractmethod
+    async def complete(self, key: str, response: str) -> None: ...
+
+    @abstractmethod
+    async def abandon(self, key: str) -> None: ...
@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+
+from src.domain.bot.catalog import BotCatalog
+from src.infrastructure.cache.base import BaseBotCatalogCache, BaseCacheService
+from src.infrastructure.cache.local import LocalTTLCache
+
+CATALOG_KEY: str = 'bots:catalog'
+LOCAL_TTL_SECONDS: float = 5.0
+
+
+@dataclass
+class TwoTierBotCatalogCache(BaseBotCatalogCache):
+    _cache_service: BaseCacheService
+    _local: LocalTTLCache[str, BotCatalog] = field(
+        default_factory=lambda: LocalTTLCache(max_size=1, ttl_seconds=LOCAL_TTL_SECONDS)
+    )
+
+    async def get(self) -> BotCatalog | None:
+        catalog: BotCatalog | None = self._local.get(CATALOG_KEY)
+
+        if catalog is not None:
+            return catalog
+
+        data: dict = await self._cache_service.client.hgetall(CATALOG_KEY)
+
+        if not data:
+            return None
+
+        catalog = BotCatalog(body=data['body'], etag=data['etag'])
+        self._local.set(CATALOG_KEY, catalog)
+        return catalog
+
+    async def set(self, catalog: BotCatalog) -> None:
+        await self._cache_service.client.hset(
+            CATALOG_KEY, mapping={'body': catalog.body, 'etag': catalog.etag}
+        )
+        self._local.set(CATALOG_KEY, catalog)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+from src.infrastructure.cache.base import (
+    BaseCacheService,
+    BaseIdempotencyStore,
+    IdempotencyRecord,
+    IdempotencyStatus,
+)
+
+IDEMPOTENCY_LOCK_TTL_MS: int = 30_000
+IDEMPOTENCY_RESULT_TTL_SECONDS: int = 24 * 60 * 60
+
+# Проверка и захват ключа одной операцией: два одновременных повтора
+# не смогут оба начать выполнение.
+BEGIN_SCRIPT: str = """
+local state = redis.call('HMGET', KEYS[1], 'status', 'fingerprint', 'response')
+if not state[1] then
+    redis.call('HSET', KEYS[1], 'status', 'in_progress', 'fingerprint', ARGV[1])
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return {'acquired', false}
+end
+if state[2] ~= ARGV[1] then
+    return {'mismatch', false}
+end
+return {state[1], state[3]}
+"""
+
+ABANDON_SCRIPT: str = """
+if redis.call('HGET', KEYS[1], 'status') == 'in_progress' then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass
+class RedisIdempotencyStore(BaseIdempotencyStore):
+    _cache_service: BaseCacheService
+
+    def __post_init__(self) -> None:
+        client = self._cache_service.client
+        self._begin = client.register_script(BEGIN_SCRIPT)
+        self._abandon = client.register_script(ABANDON_SCRIPT)
+
+    async def begin(self, key: str, fingerprint: str) -> IdempotencyRecord:
+        status, response = await self._begin(
+            keys=[key], args=[fingerprint, IDEMPOTENCY_LOCK_TTL_MS]
+        )
+        return IdempotencyRecord(
+            status=IdempotencyStatus(status), response=response or None
+        )
+
+    async def complete(self, key: str, response: str) -> None:
+        async with self._cache_service.client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={'status': 'done', 'response': response})
+            pipe.expire(key, IDEMPOTENCY_RESULT_TTL_SECONDS)
+            await pipe.execute()
+
+    async def abandon(self, key: str) -> None:
+        await self._abandon(keys=[key])
@@ -0,0 +1,63 @@
+import logging
+import uuid
+from dataclasses import dataclass
+
+from redis.exceptions import RedisError
+from src.infrastructure.cache.base import BaseCacheService, BaseRateLimiter, RateLimit
+
+logger = logging.getLogger(__name__)
+
+# Скользящее окно по журналу запросов: сначала проверяем все ключи и только
+# если лимит не превышен ни по одному, записываем запрос во все окна сразу.
+SLIDING_WINDOW_SCRIPT: str = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local retry_after = 0
+
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[i * 2 - 1])
+    local window = tonumber(ARGV[i * 2])
+
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        retry_after = math.max(retry_after, tonumber(oldest[2]) + window - now)
+    end
+end
+
+if retry_after > 0 then
+    return retry_after
+end
+
+local member = now .. ':' .. ARGV[#ARGV]
+for i, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, member)
+    redis.call('PEXPIRE', key, tonumber(ARGV[i * 2]))
+end
+return 0
+"""
+
+
+@dataclass
+class RedisSlidingWindowRateLimiter(BaseRateLimiter):
+    _cache_service: BaseCacheService
+
+    def __post_init__(self) -> None:
+        self._script = self._cache_service.client.register_script(SLIDING_WINDOW_SCRIPT)
+
+    async def hit(self, limits: list[tuple[str, RateLimit]]) -> float:
+        args: list = []
+        for _, rate_limit in limits:
+            args.extend([rate_limit.limit, rate_limit.window_seconds * 1000])
+        args.append(uuid.uuid4().hex)
+
+        try:
+            retry_after_ms: int = await self._script(
+                keys=[key for key, _ in limits], args=args
+            )
+        except RedisError as e:
+            # Недоступность Redis не должна блокировать вход пользователей.
+            logger.warning('Лимитер запросов недоступен, пропускаем запрос: %s', e)
+            return 0.0
+
+        return retry_after_ms / 1000
@@ -1,22 +1,89 @@
+import time
+from dataclasses import dataclass
 from typing import Any
 
-from redis.asyncio import Redis
+from prometheus_client import Gauge, Histogram
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.connection import AbstractConnection
+from src.config import RedisConfig
 from src.infrastructure.cache.base import BaseCacheService
 
+REDIS_POOL_IN_USE: Gauge = Gauge(
+    'redis_pool_connections_in_use', 'Соединения Redis, выданные из пула'
+)
+REDIS_POOL_IDLE: Gauge = Gauge(
+    'redis_pool_connections_idle', 'Свободные соединения Redis в пуле'
+)
+REDIS_POOL_WAIT_SECONDS: Histogram = Histogram(
+    'redis_pool_wait_seconds', 'Время ожидания соединения из пула Redis'
+)
 
-class RedisCacheService(BaseCacheService):
-    def __init__(
-        self,
-        host: str = 'redis',
-        port: int = 6379,
-        db: int = 0,
-        decode_responses: bool = True,
-        **kwargs,
-    ):
-        self._client = Redis(
-            host=host, port=port, db=db, decode_responses=decode_responses, **kwargs
+
+@dataclass(frozen=True)
+class RedisPoolStats:
+    max_connections: int
+    in_use: int
+    idle: int
+    checkouts: int
+    wait_seconds_total: float
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        if not self.checkouts:
+            return 0.0
+        return self.wait_seconds_total / self.checkouts
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self._checkouts: int = 0
+        self._wait_seconds_total: float = 0.0
+
+    async def get_connection(
+        self, *args: object, **kwargs: object
+    ) -> AbstractConnection:
+        started: float = time.perf_counter()
+        try:
+            return await super().get_connection(*args, **kwargs)
+        finally:
+            waited: float = time.perf_counter() - started
+            self._checkouts += 1
+            self._wait_seconds_total += waited
+            REDIS_POOL_WAIT_SECONDS.observe(waited)
+
+    def stats(self) -> RedisPoolStats:
+        return RedisPoolStats(
+            max_connections=self.max_connections,
+            in_use=len(self._in_use_connections),
+            idle=len(self._available_connections),
+            checkouts=self._checkouts,
+            wait_seconds_total=self._wait_seconds_total,
         )
 
+
+def new_redis_pool(redis_config: RedisConfig) -> InstrumentedConnectionPool:
+    pool = InstrumentedConnectionPool(
+        host=redis_config.host,
+        port=redis_config.port,
+        db=redis_config.db,
+        max_connections=redis_config.max_connections,
+        timeout=redis_config.pool_timeout,
+        socket_timeout=redis_config.socket_timeout,
+        socket_connect_timeout=redis_config.socket_timeout,
+        health_check_interval=redis_config.health_check_interval,
+        decode_responses=True,
+    )
+    REDIS_POOL_IN_USE.set_function(lambda: pool.stats().in_use)
+    REDIS_POOL_IDLE.set_function(lambda: pool.stats().idle)
+    return pool
+
+
+class RedisCacheService(BaseCacheService):
+    def __init__(self, pool: InstrumentedConnectionPool):
+        self._pool = pool
+        self._client = Redis(connection_pool=pool)
+
     async def get(self, key: str) -> Any | None:
         return await self._client.get(key)
 
@@ -29,6 +96,13 @@ class RedisCacheService(BaseCacheService):
     async def delete(self, key: str) -> int:
         return await self._client.delete(key)
 
+    async def close(self) -> None:
+        await self._client.aclose()
+        await self._pool.disconnect()
+
+    def pool_stats(self) -> RedisPoolStats:
+        return self._pool.stats()
+
     @property
     def client(self) -> Redis:
         return self._client
@@ -0,0 +1,76 @@
+import asyncio
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+
+# Время берется из Redis, чтобы воркеры с разными часами делили одно ведро.
+ACQUIRE_SCRIPT: str = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at', 'paused_until')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+local paused_until = tonumber(state[3]) or 0
+
+if paused_until > now then
+    return paused_until - now
+end
+
+tokens = math.min(capacity, tokens + (now - updated_at) * rate / 1000)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate) + 60000)
+return wait
+"""
+
+PAUSE_SCRIPT: str = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local paused_until = now + tonumber(ARGV[1])
+local current = tonumber(redis.call('HGET', KEYS[1], 'paused_until')) or 0
+
+if paused_until > current then
+    redis.call('HSET', KEYS[1], 'paused_until', paused_until, 'tokens', 0, 'updated_at', paused_until)
+    redis.call('PEXPIRE', KEYS[1], tonumber(ARGV[1]) + 60000)
+end
+return paused_until
+"""
+
+
+@dataclass
+class RedisTokenBucket:
+    _client: Redis
+    key: str
+    rate: float
+    capacity: int
+
+    def __post_init__(self) -> None:
+        self._acquire = self._client.register_script(ACQUIRE_SCRIPT)
+        self._pause = self._client.register_script(PAUSE_SCRIPT)
+
+    async def acquire(self) -> None:
+        while True:
+            wait: float = await self.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def try_acquire(self, suffix: str | None = None) -> float:
+        # Без ожидания: 0, если токен взят, иначе сколько секунд ждать.
+        # Суффикс дает отдельное ведро с теми же параметрами, например на чат.
+        key: str = f'{self.key}:{suffix}' if suffix else self.key
+        wait_ms: int = await self._acquire(keys=[key], args=[self.rate, self.capacity])
+        return max(wait_ms, 0) / 1000
+
+    async def pause(self, seconds: float) -> None:
+        await self._pause(keys=[self.key], args=[int(seconds * 1000)])
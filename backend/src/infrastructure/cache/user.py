@@ -0,0 +1,116 @@
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+
+import orjson
+from prometheus_client import Counter
+from redis.exceptions import RedisError
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseCacheService, BaseUserCacheService
+from src.infrastructure.cache.local import LocalTTLCache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL: str = 'user-cache:invalidate'
+LOCAL_TTL_SECONDS: float = 5.0
+LOCAL_MAX_SIZE: int = 10_000
+REDIS_TTL_SECONDS: int = 600
+
+USER_CACHE_REQUESTS: Counter = Counter(
+    'user_cache_requests_total',
+    'Обращения к кэшу текущего пользователя',
+    ['tier', 'result'],
+)
+
+
+def user_cache_key(telegram_id: int) -> str:
+    return f'user:{telegram_id}'
+
+
+@dataclass
+class TwoTierUserCacheService(BaseUserCacheService):
+    _cache_service: BaseCacheService
+    _local: LocalTTLCache[int, UserPrincipal] = field(
+        default_factory=lambda: LocalTTLCache(
+            max_size=LOCAL_MAX_SIZE, ttl_seconds=LOCAL_TTL_SECONDS
+        )
+    )
+    _listener: asyncio.Task | None = field(default=None, init=False)
+
+    async def get(self, telegram_id: int) -> UserPrincipal | None:
+        user: UserPrincipal | None = self._local.get(telegram_id)
+
+        if user is not None:
+            USER_CACHE_REQUESTS.labels(tier='local', result='hit').inc()
+            return user
+
+        USER_CACHE_REQUESTS.labels(tier='local', result='miss').inc()
+
+        cached_user: str | None = await self._cache_service.get(
+            user_cache_key(telegram_id)
+        )
+
+        if not cached_user:
+            USER_CACHE_REQUESTS.labels(tier='redis', result='miss').inc()
+            return None
+
+        try:
+            user = UserPrincipal.from_dict(orjson.loads(cached_user))
+        except (orjson.JSONDecodeError, KeyError, ValueError):
+            logger.error('Не удалось разобрать пользователя из кэша')
+            USER_CACHE_REQUESTS.labels(tier='redis', result='miss').inc()
+            return None
+
+        USER_CACHE_REQUESTS.labels(tier='redis', result='hit').inc()
+        self._local.set(telegram_id, user)
+        return user
+
+    async def set(self, user: UserPrincipal) -> None:
+        telegram_id: int = user.telegram_id.to_raw()
+
+        await self._cache_service.set_with_ttl(
+            key=user_cache_key(telegram_id),
+            value=orjson.dumps(user.to_dict()),
+            ttl_seconds=REDIS_TTL_SECONDS,
+        )
+        self._local.set(telegram_id, user)
+
+    async def invalidate(self, telegram_id: int) -> None:
+        self._local.pop(telegram_id)
+        await self._cache_service.delete(key=user_cache_key(telegram_id))
+        await self._cache_service.client.publish(INVALIDATION_CHANNEL, telegram_id)
+
+    async def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._cache_service.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Пока подписки не было, могли пропустить инвалидации.
+                self._local.clear()
+
+                while True:
+                    message: dict | None = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        self._local.pop(int(message['data']))
+            except (RedisError, OSError) as e:
+                logger.warning('Подписка на инвалидацию кэша прервана: %s', e)
+                await asyncio.sleep(1)
+            finally:
+                with contextlib.suppress(RedisError, OSError):
+                    await pubsub.aclose()
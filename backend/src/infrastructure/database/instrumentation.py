@@ -0,0 +1,155 @@
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import Connection, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+logger = logging.getLogger(__name__)
+
+ExecuteParameters = Sequence[Any] | Mapping[str, Any] | None
+
+DB_QUERY_SECONDS: Histogram = Histogram(
+    'db_query_duration_seconds',
+    'Время выполнения SQL-запроса',
+    ['operation'],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+DB_QUERIES_PER_REQUEST: Histogram = Histogram(
+    'db_queries_per_request',
+    'Количество SQL-запросов на один HTTP-запрос',
+    ['handler'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+DB_POOL_WAIT_SECONDS: Histogram = Histogram(
+    'db_pool_wait_seconds', 'Время ожидания соединения из пула Postgres'
+)
+DB_POOL_CHECKED_OUT: Gauge = Gauge(
+    'db_pool_connections_checked_out',
+    'Соединения Postgres, выданные из пула',
+    ['engine'],
+)
+
+MAX_LOGGED_PARAMETERS_LENGTH: int = 1000
+UNKNOWN_OPERATION: str = 'other'
+
+_current_operation: ContextVar[str] = ContextVar(
+    'db_operation', default=UNKNOWN_OPERATION
+)
+_request_queries: ContextVar['QueryCounter | None'] = ContextVar(
+    'db_request_queries', default=None
+)
+
+
+@dataclass
+class QueryCounter:
+    count: int = 0
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self) -> ConnectionPoolEntry:
+        started: float = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+
+def instrument_queries(cls: type) -> type:
+    # Каждый публичный метод репозитория подписывает свои запросы меткой
+    # «Класс.метод», чтобы гистограмма показывала, какой метод медленный.
+    for name, method in list(vars(cls).items()):
+        if name.startswith('_') or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, name, _with_operation(f'{cls.__name__}.{name}', method))
+    return cls
+
+
+def _with_operation(
+    operation: str, method: Callable[..., Awaitable[object]]
+) -> Callable[..., Awaitable[object]]:
+    @functools.wraps(method)
+    async def wrapper(*args: object, **kwargs: object) -> object:
+        token = _current_operation.set(operation)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _current_operation.reset(token)
+
+    return wrapper
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+    token = _request_queries.set(counter)
+    try:
+        yield counter
+    finally:
+        _request_queries.reset(token)
+
+
+def setup_query_instrumentation(
+    engine: AsyncEngine, slow_query_ms: int, role: str = 'primary'
+) -> None:
+    sync_engine = engine.sync_engine
+    pool = sync_engine.pool
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        # У primary и реплики свои пулы: без метки движок, созданный
+        # последним, подменил бы функцию гейджа другого.
+        DB_POOL_CHECKED_OUT.labels(engine=role).set_function(pool.checkedout)
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: ExecuteParameters,
+        context: ExecutionContext | None,
+        many: bool,
+    ) -> None:
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def after_cursor_execute(
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: ExecuteParameters,
+        context: ExecutionContext | None,
+        many: bool,
+    ) -> None:
+        elapsed: float = time.perf_counter() - conn.info['query_started'].pop()
+        operation: str = _current_operation.get()
+        DB_QUERY_SECONDS.labels(operation=operation).observe(elapsed)
+
+        counter: QueryCounter | None = _request_queries.get()
+        if counter is not None:
+            counter.count += 1
+
+        if elapsed * 1000 >= slow_query_ms:
+            logger.warning(
+                'Медленный запрос %.0f мс [%s]: %s | параметры: %s',
+                elapsed * 1000,
+                operation,
+                statement,
+                str(parameters)[:MAX_LOGGED_PARAMETERS_LENGTH],
+            )
+
+    @event.listens_for(sync_engine, 'handle_error')
+    def handle_error(exception_context: ExceptionContext) -> None:
+        # Для упавшего запроса after_cursor_execute не вызывается.
+        started: list | None = exception_context.connection.info.get('query_started')
+        if started:
+            started.pop()
@@ -0,0 +1,180 @@
+"""add indexes for hot lookup columns
+
+Revision ID: 8f9d5708340b
+Revises: 344b41f66488
+Create Date: 2026-10-18 12:04:31.518214
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8f9d5708340b'
+down_revision: str | None = '344b41f66488'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def check_no_duplicate_users() -> None:
+    # На users ссылаются аренды, блокировки и рефералы, поэтому дубли нельзя
+    # просто удалить: их нужно свести вручную до построения индекса.
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                'SELECT telegram_id FROM users GROUP BY telegram_id '
+                'HAVING count(*) > 1 ORDER BY telegram_id LIMIT 20'
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            'В users есть дубли telegram_id, уникальный индекс не построится. '
+            f'Сведите пользователей вручную и повторите миграцию: {duplicates}'
+        )
+
+
+def drop_invalid_index(name: str) -> None:
+    # Прерванный CREATE INDEX CONCURRENTLY оставляет INVALID индекс с тем же
+    # именем, и повторный запуск миграции упал бы на нем.
+    is_invalid = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                'SELECT NOT i.indisvalid FROM pg_index i '
+                'JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name'
+            ),
+            {'name': name},
+        )
+        .scalar()
+    )
+    if is_invalid:
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    check_no_duplicate_users()
+
+    # Проверка и вставка в telegram_users не атомарны, поэтому дубли возможны.
+    op.execute(
+        'DELETE FROM telegram_users a USING telegram_users b '
+        'WHERE a.telegram_id = b.telegram_id AND a.id > b.id'
+    )
+
+    # CONCURRENTLY не блокирует запись в таблицы, но не работает внутри транзакции.
+    with op.get_context().autocommit_block():
+        for name in (
+            'ix_users_telegram_id',
+            'ix_telegram_users_telegram_id',
+            'ix_bot_rentals_user_id',
+            'ix_bot_rentals_bot_id',
+            'ix_bot_rentals_active_rented_until',
+            'ix_blocked_users_user_id_blocked_until',
+            'ix_referrals_referral_id',
+        ):
+            drop_invalid_index(name)
+
+        op.create_index(
+            op.f('ix_users_telegram_id'),
+            'users',
+            ['telegram_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f('ix_telegram_users_telegram_id'),
+            'telegram_users',
+            ['telegram_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f('ix_bot_rentals_user_id'),
+            'bot_rentals',
+            ['user_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f('ix_bot_rentals_bot_id'),
+            'bot_rentals',
+            ['bot_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_bot_rentals_active_rented_until',
+            'bot_rentals',
+            ['rented_until'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_blocked_users_user_id_blocked_until',
+            'blocked_users',
+            ['user_id', 'blocked_until'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f('ix_referrals_referral_id'),
+            'referrals',
+            ['referral_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_referrals_referral_id'),
+            table_name='referrals',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_blocked_users_user_id_blocked_until',
+            table_name='blocked_users',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_bot_rentals_active_rented_until',
+            table_name='bot_rentals',
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_bot_rentals_bot_id'),
+            table_name='bot_rentals',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_bot_rentals_user_id'),
+            table_name='bot_rentals',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_telegram_users_telegram_id'),
+            table_name='telegram_users',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_users_telegram_id'),
+            table_name='users',
+            postgresql_concurrently=True,
+        )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.const import MOSCOW_TZ
 from src.domain.user.blocked_user import BlockedUserEntity
@@ -19,6 +19,10 @@ class BlockedUser(Base):
     reason: Mapped[str]
     blocked_by: Mapped[int] = mapped_column(ForeignKey('users.id'))
 
+    __table_args__ = (
+        Index('ix_blocked_users_user_id_blocked_until', 'user_id', 'blocked_until'),
+    )
+
     user: Mapped['User'] = relationship(
         'User', foreign_keys=[user_id], back_populates='blocks'
     )
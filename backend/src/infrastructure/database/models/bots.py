@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.const import MOSCOW_TZ
 from src.domain.bot.entity import BotEntity, BotRentalEntity
@@ -61,12 +61,20 @@ class Bot(Base):
 class BotRental(Base):
     __tablename__ = 'bot_rentals'
 
-    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
-    bot_id: Mapped[int] = mapped_column(ForeignKey('bots.id'))
+    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'), index=True)
+    bot_id: Mapped[int] = mapped_column(ForeignKey('bots.id'), index=True)
     token: Mapped[str]
     rented_until: Mapped[DateTime] = mapped_column(DateTime(timezone=True))
     is_active: Mapped[bool]
 
+    __table_args__ = (
+        Index(
+            'ix_bot_rentals_active_rented_until',
+            'rented_until',
+            postgresql_where=text('is_active'),
+        ),
+    )
+
     user: Mapped['User'] = relationship(back_populates='rentals')
     bot: Mapped['Bot'] = relationship(back_populates='rentals')
 
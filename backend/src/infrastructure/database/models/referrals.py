@@ -14,7 +14,9 @@ class Referral(Base):
     __tablename__ = 'referrals'
 
     referrer_id: Mapped[int] = mapped_column(ForeignKey('users.id'), nullable=False)
-    referral_id: Mapped[int] = mapped_column(ForeignKey('users.id'), nullable=False)
+    referral_id: Mapped[int] = mapped_column(
+        ForeignKey('users.id'), nullable=False, index=True
+    )
     invited_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     telegram_id: Mapped[int] = mapped_column(BigInteger)
     total_bonus: Mapped[int]
@@ -21,7 +21,7 @@ class TelegramUser(Base):
         default=moscow_now,
         onupdate=moscow_now,
     )
-    telegram_id: Mapped[int] = mapped_column(BigInteger())
+    telegram_id: Mapped[int] = mapped_column(BigInteger(), unique=True, index=True)
 
     def to_dict(self) -> dict:
         return {
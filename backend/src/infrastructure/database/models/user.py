@@ -14,7 +14,7 @@ from src.infrastructure.database.models.referrals import Referral
 class User(Base):
     __tablename__ = 'users'
 
-    telegram_id: Mapped[int] = mapped_column(BigInteger)
+    telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True, index=True)
     is_deleted: Mapped[bool]
     balance: Mapped[int]
     role: Mapped[Role] = mapped_column(
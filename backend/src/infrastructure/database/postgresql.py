@@ -1,15 +1,58 @@
+from sqlalchemy import URL, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from src.config import PostgresConfig
+from src.infrastructure.database.instrumentation import (
+    InstrumentedQueuePool,
+    setup_query_instrumentation,
+)
 
 
-def new_session_maker(psql_config: PostgresConfig) -> async_sessionmaker[AsyncSession]:
-    database_uri = f'postgresql+asyncpg://{psql_config.login}:{psql_config.password}@{psql_config.host}:{psql_config.port}/{psql_config.database}'
+def new_session_maker(
+    psql_config: PostgresConfig,
+    database_uri: URL | None = None,
+    role: str = 'primary',
+) -> async_sessionmaker[AsyncSession]:
+    if database_uri is None:
+        database_uri = URL.create(
+            'postgresql+asyncpg',
+            username=psql_config.login,
+            password=psql_config.password,
+            host=psql_config.host,
+            port=psql_config.port,
+            database=psql_config.database,
+        )
+    database_uri = database_uri.update_query_dict(
+        {'prepared_statement_cache_size': str(psql_config.statement_cache_size)}
+    )
 
     engine = create_async_engine(
         database_uri,
-        pool_size=15,
-        max_overflow=15,
+        poolclass=InstrumentedQueuePool,
+        pool_size=psql_config.pool_size,
+        max_overflow=psql_config.max_overflow,
+        pool_timeout=psql_config.pool_timeout,
+        pool_recycle=psql_config.pool_recycle,
+        pool_pre_ping=psql_config.pool_pre_ping,
+        connect_args={
+            'server_settings': {
+                'statement_timeout': str(psql_config.statement_timeout_ms)
+            },
+        },
+    )
+    setup_query_instrumentation(
+        engine, slow_query_ms=psql_config.slow_query_ms, role=role
     )
+
     return async_sessionmaker(
         engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
     )
+
+
+def new_replica_session_maker(
+    psql_config: PostgresConfig,
+) -> async_sessionmaker[AsyncSession] | None:
+    if not psql_config.replica_dsn:
+        return None
+    return new_session_maker(
+        psql_config, database_uri=make_url(psql_config.replica_dsn), role='replica'
+    )
@@ -0,0 +1,57 @@
+import logging
+from dataclasses import dataclass
+from typing import NewType
+
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.infrastructure.cache.base import BaseCacheService
+
+logger = logging.getLogger(__name__)
+
+ReadSession = NewType('ReadSession', AsyncSession)
+
+
+def primary_pin_key(telegram_id: int) -> str:
+    return f'db:primary-pin:{telegram_id}'
+
+
+@dataclass
+class ReadReplicaRouter:
+    _cache_service: BaseCacheService
+    _replica_session_maker: async_sessionmaker[AsyncSession] | None
+    pin_seconds: int
+
+    @property
+    def enabled(self) -> bool:
+        return self._replica_session_maker is not None
+
+    def replica_session(self) -> AsyncSession:
+        return self._replica_session_maker()
+
+    async def pin_primary(self, *telegram_ids: int) -> None:
+        # Закрепление ставит тот, кто пишет, до коммита и по пользователям, чьи
+        # данные меняются: запись может прийти не из HTTP, а из задачи taskiq.
+        if not telegram_ids:
+            return
+        try:
+            async with self._cache_service.client.pipeline(transaction=False) as pipe:
+                for telegram_id in telegram_ids:
+                    pipe.set(primary_pin_key(telegram_id), 1, ex=self.pin_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning('Не удалось закрепить %s за primary: %s', telegram_ids, e)
+
+    async def should_use_primary(self, *telegram_ids: int | None) -> bool:
+        keys: list[str] = [
+            primary_pin_key(telegram_id)
+            for telegram_id in telegram_ids
+            if telegram_id is not None
+        ]
+        if not keys:
+            return False
+        try:
+            return bool(await self._cache_service.client.exists(*keys))
+        except RedisError as e:
+            # Без Redis не можем проверить свежие записи, поэтому читаем с primary.
+            logger.warning('Не удалось проверить закрепление %s: %s', telegram_ids, e)
+            return True
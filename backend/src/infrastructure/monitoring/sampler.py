@@ -0,0 +1,152 @@
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import psutil
+from src.config import MonitoringConfig
+from src.const import MB
+
+logger = logging.getLogger(__name__)
+
+WINDOWS: dict[str, int] = {'1m': 60, '5m': 300, '15m': 900}
+SUMMARY_FIELDS: tuple[str, ...] = (
+    'cpu_percent',
+    'memory_percent',
+    'disk_percent',
+    'loop_lag_ms',
+    'process_rss_mb',
+    'process_cpu_percent',
+)
+
+
+@dataclass(frozen=True)
+class SystemSample:
+    timestamp: float
+    cpu_percent: float
+    memory_total_mb: float
+    memory_used_mb: float
+    memory_percent: float
+    disk_total_mb: float
+    disk_used_mb: float
+    disk_percent: float
+    loop_lag_ms: float
+    process_rss_mb: float
+    process_cpu_percent: float
+    process_threads: int
+
+
+@dataclass(frozen=True)
+class MetricSummary:
+    min: float
+    avg: float
+    max: float
+
+
+@dataclass(frozen=True)
+class WindowSummary:
+    samples: int
+    metrics: dict[str, MetricSummary]
+
+
+@dataclass
+class SystemMetricsSampler:
+    interval_seconds: float
+    _samples: deque[SystemSample] = field(init=False)
+    _process: psutil.Process = field(default_factory=psutil.Process, init=False)
+    _task: asyncio.Task | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        capacity: int = math.ceil(max(WINDOWS.values()) / self.interval_seconds) + 1
+        self._samples = deque(maxlen=capacity)
+
+    @classmethod
+    def from_config(cls, config: MonitoringConfig) -> 'SystemMetricsSampler':
+        return cls(interval_seconds=config.sample_interval_seconds)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        # Первый вызов cpu_percent(interval=None) только запоминает точку отсчета
+        # и возвращает 0, поэтому первый замер сохраняем через интервал.
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def latest(self) -> SystemSample | None:
+        return self._samples[-1] if self._samples else None
+
+    def summary(self, window_seconds: int) -> WindowSummary:
+        threshold: float = time.time() - window_seconds
+        samples: list[SystemSample] = [
+            sample for sample in self._samples if sample.timestamp >= threshold
+        ]
+
+        metrics: dict[str, MetricSummary] = {}
+        for name in SUMMARY_FIELDS:
+            values: list[float] = [getattr(sample, name) for sample in samples]
+            metrics[name] = (
+                MetricSummary(
+                    min=min(values), avg=sum(values) / len(values), max=max(values)
+                )
+                if values
+                else MetricSummary(min=0.0, avg=0.0, max=0.0)
+            )
+
+        return WindowSummary(samples=len(samples), metrics=metrics)
+
+    def summaries(self) -> dict[str, WindowSummary]:
+        return {name: self.summary(seconds) for name, seconds in WINDOWS.items()}
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            started: float = loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            loop_lag: float = max(loop.time() - started - self.interval_seconds, 0.0)
+
+            try:
+                sample: SystemSample = await asyncio.to_thread(self._collect, loop_lag)
+            except Exception as e:
+                logger.error('Ошибка при сборе метрик сервера: %s', e, exc_info=True)
+                continue
+
+            self._samples.append(sample)
+
+    def _collect(self, loop_lag: float) -> SystemSample:
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+
+        with self._process.oneshot():
+            process_rss: int = self._process.memory_info().rss
+            process_cpu: float = self._process.cpu_percent(interval=None)
+            process_threads: int = self._process.num_threads()
+
+        return SystemSample(
+            timestamp=time.time(),
+            cpu_percent=psutil.cpu_percent(interval=None),
+            memory_total_mb=round(memory.total / MB, 2),
+            memory_used_mb=round(memory.used / MB, 2),
+            memory_percent=memory.percent,
+            disk_total_mb=round(disk.total / MB, 2),
+            disk_used_mb=round(disk.used / MB, 2),
+            disk_percent=disk.percent,
+            loop_lag_ms=round(loop_lag * 1000, 3),
+            process_rss_mb=round(process_rss / MB, 2),
+            process_cpu_percent=process_cpu,
+            process_threads=process_threads,
+        )
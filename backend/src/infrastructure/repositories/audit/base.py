@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.domain.audit.event import AuditEvent
+
+
+@dataclass
+class BaseAuditEventRepository(ABC):
+    @abstractmethod
+    async def push(self, event: AuditEvent) -> int: ...
+
+    @abstractmethod
+    async def pop_batch(self, limit: int) -> list[AuditEvent]: ...
+
+    @abstractmethod
+    async def requeue(self, events: list[AuditEvent]) -> None: ...
+
+    @abstractmethod
+    async def open_window(self, ttl: float) -> bool: ...
+
+    @abstractmethod
+    async def close_window(self) -> None: ...
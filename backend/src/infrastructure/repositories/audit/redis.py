@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from src.domain.audit.event import AuditEvent
+from src.infrastructure.cache.base import BaseCacheService
+from src.infrastructure.repositories.audit.base import BaseAuditEventRepository
+
+AUDIT_EVENTS_KEY: str = 'audit:events'
+AUDIT_WINDOW_KEY: str = 'audit:events:window'
+
+
+@dataclass
+class RedisAuditEventRepository(BaseAuditEventRepository):
+    _cache_service: BaseCacheService
+
+    async def push(self, event: AuditEvent) -> int:
+        return await self._cache_service.client.rpush(AUDIT_EVENTS_KEY, event.to_json())
+
+    async def pop_batch(self, limit: int) -> list[AuditEvent]:
+        raw_events: list | None = await self._cache_service.client.lpop(
+            AUDIT_EVENTS_KEY, limit
+        )
+        return [AuditEvent.from_json(raw) for raw in raw_events or []]
+
+    async def requeue(self, events: list[AuditEvent]) -> None:
+        if not events:
+            return
+        # LPUSH кладет элементы по одному в голову, поэтому идем с конца,
+        # чтобы сохранить исходный порядок событий.
+        await self._cache_service.client.lpush(
+            AUDIT_EVENTS_KEY, *(event.to_json() for event in reversed(events))
+        )
+
+    async def open_window(self, ttl: float) -> bool:
+        return bool(
+            await self._cache_service.set(
+                AUDIT_WINDOW_KEY, 1, nx=True, px=int(ttl * 1000)
+            )
+        )
+
+    async def close_window(self) -> None:
+        await self._cache_service.delete(AUDIT_WINDOW_KEY)
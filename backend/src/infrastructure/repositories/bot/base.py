@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from src.domain.bot.admin_view import BotRentalSummary, BotWithRentals
 from src.domain.bot.entity import BotEntity
 from src.infrastructure.database.models.base import Base
 
@@ -23,7 +24,14 @@ class BaseBotRepository(ABC, Generic[T]):
     async def get_bot_with_rentals(self, bot_id: int) -> BotEntity | None: ...
 
     @abstractmethod
-    async def get_all_bots_with_rentals(self) -> list[BotEntity] | None: ...
+    async def get_bots_with_rentals(
+        self, rentals_limit: int
+    ) -> list[BotWithRentals]: ...
+
+    @abstractmethod
+    async def get_bot_rentals(
+        self, bot_id: int, limit: int, after_id: int | None = None
+    ) -> list[BotRentalSummary]: ...
 
     @abstractmethod
     async def get_bot_by_id(self, bot_id: int) -> BotEntity | None: ...
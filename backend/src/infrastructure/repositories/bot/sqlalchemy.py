@@ -1,16 +1,30 @@
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from src.const import MOSCOW_TZ
+from src.domain.bot.admin_view import BotRentalSummary, BotWithRentals
 from src.domain.bot.entity import BotEntity
+from src.infrastructure.database.instrumentation import instrument_queries
 from src.infrastructure.database.models.bots import Bot, BotRental
 from src.infrastructure.repositories.bot.base import BaseBotRepository
 
 logger = logging.getLogger(__name__)
 
+RENTAL_SUMMARY_COLUMNS = (
+    BotRental.id,
+    BotRental.user_id,
+    BotRental.bot_id,
+    BotRental.token,
+    BotRental.rented_until,
+    BotRental.is_active,
+)
 
+
+@instrument_queries
 @dataclass
 class SQLAlchemyBotRepository(BaseBotRepository):
     _session: AsyncSession
@@ -32,7 +46,7 @@ class SQLAlchemyBotRepository(BaseBotRepository):
                 return None
             return [bot.to_entity(include_rentals=False) for bot in bots]
         except Exception as e:
-            logger.error(f'Ошибка при получении всех ботов: {e}', exc_info=True)
+            logger.error('Ошибка при получении всех ботов: %s', e, exc_info=True)
             raise
 
     async def get_bot_by_id(self, bot_id: int) -> BotEntity | None:
@@ -43,26 +57,110 @@ class SQLAlchemyBotRepository(BaseBotRepository):
                 return None
             return bot.to_entity(include_rentals=False)
         except Exception as e:
-            logger.error(f'Ошибка при получении всех ботов: {e}', exc_info=True)
+            logger.error('Ошибка при получении всех ботов: %s', e, exc_info=True)
             raise
 
-    async def get_all_bots_with_rentals(self) -> list[BotEntity] | None:
+    async def get_bots_with_rentals(self, rentals_limit: int) -> list[BotWithRentals]:
         try:
             result = await self._session.execute(
-                select(Bot).options(
-                    selectinload(Bot.rentals).selectinload(BotRental.user)
-                )
+                select(
+                    Bot.id,
+                    Bot.created_at,
+                    Bot.updated_at,
+                    Bot.name,
+                    Bot.description,
+                    Bot.price,
+                    Bot.is_available,
+                    Bot.is_deleted,
+                ).order_by(Bot.id)
             )
-            bots: list[Bot] = result.scalars().all()
+            bots = result.all()
             if not bots:
-                return None
-            return [bot.to_entity() for bot in bots]
+                return []
+
+            # Лишняя аренда на бота нужна только чтобы понять, есть ли следующая страница.
+            ranked = (
+                select(
+                    *RENTAL_SUMMARY_COLUMNS,
+                    func.row_number()
+                    .over(partition_by=BotRental.bot_id, order_by=BotRental.id)
+                    .label('position'),
+                )
+                .where(BotRental.bot_id.in_([bot.id for bot in bots]))
+                .subquery()
+            )
+            result = await self._session.execute(
+                select(
+                    ranked.c.id,
+                    ranked.c.user_id,
+                    ranked.c.bot_id,
+                    ranked.c.token,
+                    ranked.c.rented_until,
+                    ranked.c.is_active,
+                )
+                .where(ranked.c.position <= rentals_limit + 1)
+                .order_by(ranked.c.bot_id, ranked.c.id)
+            )
+
+            rentals: dict[int, list[BotRentalSummary]] = defaultdict(list)
+            for row in result.all():
+                rentals[row.bot_id].append(self._to_rental_summary(row))
+
+            return [
+                BotWithRentals(
+                    id=bot.id,
+                    created_at=bot.created_at.astimezone(MOSCOW_TZ),
+                    updated_at=bot.updated_at.astimezone(MOSCOW_TZ),
+                    name=bot.name,
+                    description=bot.description,
+                    price=bot.price,
+                    is_available=bot.is_available,
+                    is_deleted=bot.is_deleted,
+                    rentals=rentals[bot.id][:rentals_limit],
+                    rentals_next_cursor=rentals[bot.id][rentals_limit - 1].id
+                    if len(rentals[bot.id]) > rentals_limit
+                    else None,
+                )
+                for bot in bots
+            ]
         except Exception as e:
             logger.error(
-                f'Ошибка при получении ботов с арендаторами: {e}', exc_info=True
+                'Ошибка при получении ботов с арендаторами: %s', e, exc_info=True
             )
             raise
 
+    async def get_bot_rentals(
+        self, bot_id: int, limit: int, after_id: int | None = None
+    ) -> list[BotRentalSummary]:
+        try:
+            stmt = (
+                select(*RENTAL_SUMMARY_COLUMNS)
+                .where(BotRental.bot_id == bot_id)
+                .order_by(BotRental.id)
+                .limit(limit)
+            )
+            if after_id is not None:
+                stmt = stmt.where(BotRental.id > after_id)
+
+            result = await self._session.execute(stmt)
+            return [self._to_rental_summary(row) for row in result.all()]
+        except Exception as e:
+            logger.error(
+                'Ошибка при получении аренд бота id=%s: %s', bot_id, e, exc_info=True
+            )
+            raise
+
+    @staticmethod
+    def _to_rental_summary(row: Row) -> BotRentalSummary:
+        return BotRentalSummary(
+            id=row.id,
+            user_id=row.user_id,
+            bot_id=row.bot_id,
+            token=row.token,
+            rented_until=row.rented_until.astimezone(MOSCOW_TZ),
+            is_active=row.is_active,
+        )
+
     async def get_bot_with_rentals(self, bot_id: int) -> BotEntity | None:
         try:
             result = await self._session.execute(
@@ -74,7 +172,9 @@ class SQLAlchemyBotRepository(BaseBotRepository):
             return bot.to_entity() if bot else None
         except Exception as e:
             logger.error(
-                f'Ошибка при получении бота с арендаторами id={bot_id}: {e}',
+                'Ошибка при получении бота с арендаторами id=%s: %s',
+                bot_id,
+                e,
                 exc_info=True,
             )
             raise
@@ -104,7 +204,9 @@ class SQLAlchemyBotRepository(BaseBotRepository):
 
         except Exception as e:
             logger.error(
-                f'Неизвестная ошибка при обновлении бота с id={bot_entity.id}: {e}',
+                'Неизвестная ошибка при обновлении бота с id=%s: %s',
+                bot_entity.id,
+                e,
                 exc_info=True,
             )
             raise
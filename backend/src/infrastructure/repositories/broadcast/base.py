@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.domain.broadcast.entity import BroadcastEntity
+
+
+@dataclass
+class BaseBroadcastRepository(ABC):
+    @abstractmethod
+    async def add(self, entity: BroadcastEntity) -> BroadcastEntity: ...
+
+    @abstractmethod
+    async def get(self, broadcast_id: int) -> BroadcastEntity | None: ...
+
+    @abstractmethod
+    async def get_latest(self) -> BroadcastEntity | None: ...
+
+    @abstractmethod
+    async def save_progress(
+        self, broadcast_id: int, cursor: int, sent: int, failed: int
+    ) -> None: ...
+
+    @abstractmethod
+    async def finish(self, broadcast_id: int) -> None: ...
+
+    @abstractmethod
+    async def acquire_lock(self, broadcast_id: int, owner: str, ttl: int) -> bool: ...
+
+    @abstractmethod
+    async def extend_lock(self, broadcast_id: int, owner: str, ttl: int) -> bool: ...
+
+    @abstractmethod
+    async def release_lock(self, broadcast_id: int, owner: str) -> None: ...
@@ -0,0 +1,113 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.const import MOSCOW_TZ
+from src.domain.broadcast.entity import BroadcastEntity, BroadcastStatus
+from src.infrastructure.cache.base import BaseCacheService
+from src.infrastructure.repositories.broadcast.base import BaseBroadcastRepository
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_TTL_SECONDS: int = 7 * 24 * 60 * 60
+BROADCAST_ID_KEY: str = 'broadcast:id'
+BROADCAST_LATEST_KEY: str = 'broadcast:latest'
+
+EXTEND_LOCK_SCRIPT: str = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LOCK_SCRIPT: str = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def broadcast_key(broadcast_id: int) -> str:
+    return f'broadcast:{broadcast_id}'
+
+
+def broadcast_lock_key(broadcast_id: int) -> str:
+    return f'broadcast:{broadcast_id}:lock'
+
+
+@dataclass
+class RedisBroadcastRepository(BaseBroadcastRepository):
+    _cache_service: BaseCacheService
+
+    def __post_init__(self) -> None:
+        client = self._cache_service.client
+        self._extend_lock = client.register_script(EXTEND_LOCK_SCRIPT)
+        self._release_lock = client.register_script(RELEASE_LOCK_SCRIPT)
+
+    async def add(self, entity: BroadcastEntity) -> BroadcastEntity:
+        client = self._cache_service.client
+        entity.id = await client.incr(BROADCAST_ID_KEY)
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(broadcast_key(entity.id), mapping=entity.to_dict())
+            pipe.expire(broadcast_key(entity.id), BROADCAST_TTL_SECONDS)
+            pipe.set(BROADCAST_LATEST_KEY, entity.id, ex=BROADCAST_TTL_SECONDS)
+            await pipe.execute()
+
+        logger.info('Создана рассылка id=%s на %s получателей', entity.id, entity.total)
+        return entity
+
+    async def get(self, broadcast_id: int) -> BroadcastEntity | None:
+        data: dict = await self._cache_service.client.hgetall(
+            broadcast_key(broadcast_id)
+        )
+        return BroadcastEntity.from_dict(data) if data else None
+
+    async def get_latest(self) -> BroadcastEntity | None:
+        broadcast_id: str | None = await self._cache_service.get(BROADCAST_LATEST_KEY)
+        return await self.get(int(broadcast_id)) if broadcast_id else None
+
+    async def save_progress(
+        self, broadcast_id: int, cursor: int, sent: int, failed: int
+    ) -> None:
+        key: str = broadcast_key(broadcast_id)
+
+        async with self._cache_service.client.pipeline(transaction=True) as pipe:
+            pipe.hincrby(key, 'sent', sent)
+            pipe.hincrby(key, 'failed', failed)
+            pipe.hset(
+                key,
+                mapping={
+                    'cursor': cursor,
+                    'updated_at': datetime.now(tz=MOSCOW_TZ).isoformat(),
+                },
+            )
+            await pipe.execute()
+
+    async def finish(self, broadcast_id: int) -> None:
+        await self._cache_service.client.hset(
+            broadcast_key(broadcast_id),
+            mapping={
+                'status': BroadcastStatus.FINISHED.value,
+                'updated_at': datetime.now(tz=MOSCOW_TZ).isoformat(),
+            },
+        )
+        logger.info('Рассылка id=%s завершена', broadcast_id)
+
+    async def acquire_lock(self, broadcast_id: int, owner: str, ttl: int) -> bool:
+        return bool(
+            await self._cache_service.set(
+                broadcast_lock_key(broadcast_id), owner, nx=True, ex=ttl
+            )
+        )
+
+    async def extend_lock(self, broadcast_id: int, owner: str, ttl: int) -> bool:
+        return bool(
+            await self._extend_lock(
+                keys=[broadcast_lock_key(broadcast_id)], args=[owner, ttl]
+            )
+        )
+
+    async def release_lock(self, broadcast_id: int, owner: str) -> None:
+        await self._release_lock(keys=[broadcast_lock_key(broadcast_id)], args=[owner])
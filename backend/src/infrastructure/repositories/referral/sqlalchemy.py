@@ -5,12 +5,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from src.domain.referral.entity import ReferralEntity
+from src.infrastructure.database.instrumentation import instrument_queries
 from src.infrastructure.database.models.referrals import Referral
 from src.infrastructure.repositories.referral.base import BaseReferralRepository
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_queries
 @dataclass
 class SQLAlchemyReferralRepository(BaseReferralRepository):
     _session: AsyncSession
@@ -19,10 +21,14 @@ class SQLAlchemyReferralRepository(BaseReferralRepository):
         try:
             model = Referral.from_entity(entity)
             self._session.add(model)
-            logger.info(f'Реферал добавлен: {entity}')
+            logger.info(
+                'Реферал добавлен: referrer_id=%s referral_id=%s',
+                entity.referrer_id,
+                entity.referral_id,
+            )
             return entity
         except Exception:
-            logger.exception(f'Ошибка при добавлении реферала: {entity}')
+            logger.exception('Ошибка при добавлении реферала: %s', entity)
             raise
 
     async def get_referrals_by_referrer(self, referrer_id: int) -> list[ReferralEntity]:
@@ -34,12 +40,12 @@ class SQLAlchemyReferralRepository(BaseReferralRepository):
             )
             referrals = result.scalars().all()
             logger.info(
-                f'Найдено {len(referrals)} рефералов по referrer_id={referrer_id}'
+                'Найдено %s рефералов по referrer_id=%s', len(referrals), referrer_id
             )
             return [ref.to_entity() for ref in referrals]
         except Exception:
             logger.exception(
-                f'Ошибка при получении рефералов по referrer_id={referrer_id}'
+                'Ошибка при получении рефералов по referrer_id=%s', referrer_id
             )
             return []
 
@@ -52,11 +58,11 @@ class SQLAlchemyReferralRepository(BaseReferralRepository):
             )
             referrals = result.scalars().all()
             logger.info(
-                f'Найдено {len(referrals)} рефералов по referrer_id={referrer_id}'
+                'Найдено %s рефералов по referrer_id=%s', len(referrals), referrer_id
             )
             return [ref.to_entity() for ref in referrals]
         except Exception:
             logger.exception(
-                f'Ошибка при получении всех рефералов по referrer_id={referrer_id}'
+                'Ошибка при получении всех рефералов по referrer_id=%s', referrer_id
             )
             return []
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import datetime
 
 from src.domain.bot.entity import BotRentalEntity
+from src.domain.bot.expiry import ExpiredRental, ExpiringRental
 
 
 @dataclass
@@ -17,3 +19,21 @@ class BaseRentalRepository(ABC):
 
     @abstractmethod
     async def update(self, rental: BotRentalEntity) -> BotRentalEntity: ...
+
+    @abstractmethod
+    async def deactivate_expired(
+        self, now: datetime, limit: int
+    ) -> list[ExpiredRental]: ...
+
+    @abstractmethod
+    async def get_expiring(
+        self, expires_from: datetime, expires_to: datetime, after_id: int, limit: int
+    ) -> list[ExpiringRental]: ...
+
+    @abstractmethod
+    async def deactivate_expired_by_id(
+        self, rental_id: int, now: datetime
+    ) -> ExpiredRental | None: ...
+
+    @abstractmethod
+    async def get_expiring_by_id(self, rental_id: int) -> ExpiringRental | None: ...
@@ -1,15 +1,21 @@
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.const import MOSCOW_TZ
 from src.domain.bot.entity import BotRentalEntity
-from src.infrastructure.database.models.bots import BotRental
+from src.domain.bot.expiry import ExpiredRental, ExpiringRental
+from src.infrastructure.database.instrumentation import instrument_queries
+from src.infrastructure.database.models.bots import Bot, BotRental
+from src.infrastructure.database.models.user import User
 from src.infrastructure.repositories.rental.base import BaseRentalRepository
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_queries
 @dataclass
 class SQLAlchemyRentalRepository(BaseRentalRepository):
     _session: AsyncSession
@@ -20,10 +26,15 @@ class SQLAlchemyRentalRepository(BaseRentalRepository):
             self._session.add(model)
             await self._session.flush()
             rental.id = model.id
-            logger.info(f'Добавлена аренда: {rental.to_dict()}')
+            logger.info(
+                'Добавлена аренда: id=%s user_id=%s bot_id=%s',
+                rental.id,
+                rental.user_id,
+                rental.bot_id,
+            )
             return rental
         except Exception:
-            logger.exception(f'Ошибка при добавлении аренды: {rental}')
+            logger.exception('Ошибка при добавлении аренды: %s', rental)
             raise
 
     async def get_by_id(self, rental_id: int) -> BotRentalEntity | None:
@@ -33,12 +44,12 @@ class SQLAlchemyRentalRepository(BaseRentalRepository):
             )
             rental = result.scalar_one_or_none()
             if rental:
-                logger.info(f'Аренда найдена: id={rental_id}')
+                logger.info('Аренда найдена: id=%s', rental_id)
                 return rental.to_entity(include_user=False)
-            logger.info(f'Аренда не найдена: id={rental_id}')
+            logger.info('Аренда не найдена: id=%s', rental_id)
             return None
         except Exception:
-            logger.exception(f'Ошибка при получении аренды по id={rental_id}')
+            logger.exception('Ошибка при получении аренды по id=%s', rental_id)
             raise
 
     async def get_all_by_user_id(self, user_id: int) -> list[BotRentalEntity]:
@@ -47,7 +58,7 @@ class SQLAlchemyRentalRepository(BaseRentalRepository):
                 select(BotRental).where(BotRental.user_id == user_id)
             )
             rentals = result.scalars().all()
-            logger.info(f'Получено аренд: {len(rentals)}')
+            logger.info('Получено аренд: %s', len(rentals))
             return [rental.to_entity(include_user=False) for rental in rentals]
         except Exception:
             logger.exception('Ошибка при получении всех аренд')
@@ -60,16 +71,136 @@ class SQLAlchemyRentalRepository(BaseRentalRepository):
             )
             model: BotRental | None = result.scalar_one_or_none()
             if not model:
-                logger.warning(f'Аренда для обновления не найдена: id={rental.id}')
+                logger.warning('Аренда для обновления не найдена: id=%s', rental.id)
                 return None
 
             model.is_active = rental.is_active
             model.rented_until = rental.rented_until
             model.token = rental.token
 
-            logger.info(f'Аренда обновлена: {rental.to_dict()}')
+            logger.info(
+                'Аренда обновлена: id=%s is_active=%s', rental.id, rental.is_active
+            )
 
             return rental
         except Exception:
-            logger.exception(f'Ошибка при обновлении аренды: {rental}')
+            logger.exception('Ошибка при обновлении аренды: %s', rental)
+            raise
+
+    async def deactivate_expired(
+        self, now: datetime, limit: int
+    ) -> list[ExpiredRental]:
+        try:
+            expired_ids = (
+                select(BotRental.id)
+                .where(BotRental.is_active, BotRental.rented_until <= now)
+                .order_by(BotRental.rented_until)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            result = await self._session.execute(
+                update(BotRental)
+                .where(BotRental.id.in_(expired_ids), BotRental.user_id == User.id)
+                .values(is_active=False)
+                .returning(BotRental.id, User.telegram_id)
+                .execution_options(synchronize_session=False)
+            )
+            expired: list[ExpiredRental] = [
+                ExpiredRental(rental_id=row.id, telegram_id=row.telegram_id)
+                for row in result.all()
+            ]
+            logger.info('Деактивировано истекших аренд: %s', len(expired))
+            return expired
+        except Exception:
+            logger.exception('Ошибка при деактивации истекших аренд')
+            raise
+
+    async def get_expiring(
+        self, expires_from: datetime, expires_to: datetime, after_id: int, limit: int
+    ) -> list[ExpiringRental]:
+        try:
+            result = await self._session.execute(
+                select(
+                    BotRental.id,
+                    BotRental.rented_until,
+                    User.telegram_id,
+                    Bot.name,
+                )
+                .join(User, User.id == BotRental.user_id)
+                .join(Bot, Bot.id == BotRental.bot_id)
+                .where(
+                    BotRental.is_active,
+                    BotRental.rented_until >= expires_from,
+                    BotRental.rented_until < expires_to,
+                    BotRental.id > after_id,
+                )
+                .order_by(BotRental.id)
+                .limit(limit)
+            )
+            return [
+                ExpiringRental(
+                    rental_id=row.id,
+                    telegram_id=row.telegram_id,
+                    bot_name=row.name,
+                    rented_until=row.rented_until.astimezone(MOSCOW_TZ),
+                )
+                for row in result.all()
+            ]
+        except Exception:
+            logger.exception('Ошибка при получении истекающих аренд')
+            raise
+
+    async def deactivate_expired_by_id(
+        self, rental_id: int, now: datetime
+    ) -> ExpiredRental | None:
+        try:
+            # Условие на rented_until отсекает продленные аренды, на is_active -
+            # остановленные и уже деактивированные.
+            result = await self._session.execute(
+                update(BotRental)
+                .where(
+                    BotRental.id == rental_id,
+                    BotRental.is_active,
+                    BotRental.rented_until <= now,
+                    BotRental.user_id == User.id,
+                )
+                .values(is_active=False)
+                .returning(BotRental.id, User.telegram_id)
+                .execution_options(synchronize_session=False)
+            )
+            row = result.one_or_none()
+            if row is None:
+                logger.info('Аренда id=%s не требует деактивации', rental_id)
+                return None
+            logger.info('Деактивирована истекшая аренда: id=%s', rental_id)
+            return ExpiredRental(rental_id=row.id, telegram_id=row.telegram_id)
+        except Exception:
+            logger.exception('Ошибка при деактивации аренды id=%s', rental_id)
+            raise
+
+    async def get_expiring_by_id(self, rental_id: int) -> ExpiringRental | None:
+        try:
+            result = await self._session.execute(
+                select(
+                    BotRental.id,
+                    BotRental.rented_until,
+                    User.telegram_id,
+                    Bot.name,
+                )
+                .join(User, User.id == BotRental.user_id)
+                .join(Bot, Bot.id == BotRental.bot_id)
+                .where(BotRental.id == rental_id, BotRental.is_active)
+            )
+            row = result.one_or_none()
+            if row is None:
+                return None
+            return ExpiringRental(
+                rental_id=row.id,
+                telegram_id=row.telegram_id,
+                bot_name=row.name,
+                rented_until=row.rented_until.astimezone(MOSCOW_TZ),
+            )
+        except Exception:
+            logger.exception('Ошибка при получении аренды id=%s', rental_id)
             raise
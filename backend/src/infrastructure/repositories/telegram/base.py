@@ -5,7 +5,15 @@ from dataclasses import dataclass
 @dataclass
 class BaseTelegramRepository:
     @abstractmethod
-    async def add_user_if_not_exists(self, telegram_id: int): ...
+    async def add_user_if_not_exists(self, telegram_id: int) -> bool: ...
 
     @abstractmethod
     async def get_all_users(self): ...
+
+    @abstractmethod
+    async def get_recipients_batch(
+        self, after_id: int, limit: int
+    ) -> list[tuple[int, int]]: ...
+
+    @abstractmethod
+    async def count_users(self) -> int: ...
@@ -1,34 +1,37 @@
 import logging
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.instrumentation import instrument_queries
 from src.infrastructure.database.models.telegram_users import TelegramUser
 from src.infrastructure.repositories.telegram.base import BaseTelegramRepository
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_queries
 @dataclass
 class SQLAlchemyTelegramRepository(BaseTelegramRepository):
     _session: AsyncSession
 
-    async def add_user_if_not_exists(self, telegram_id: int) -> TelegramUser:
+    async def add_user_if_not_exists(self, telegram_id: int) -> bool:
         try:
-            result = await self._session.execute(
-                select(TelegramUser).where(TelegramUser.telegram_id == telegram_id)
+            await self._session.execute(
+                insert(TelegramUser)
+                .values(telegram_id=telegram_id)
+                .on_conflict_do_nothing(index_elements=[TelegramUser.telegram_id])
             )
-            user = result.scalar_one_or_none()
-            if user is None:
-                user = TelegramUser(telegram_id=telegram_id)
-                self._session.add(user)
-                await self._session.commit()
-                await self._session.refresh(user)
-            return user
+            await self._session.commit()
+            return True
         except Exception as e:
             logger.error(
-                f'Ошибка при добавлении пользователя с telegram_id={telegram_id}: {e}'
+                'Ошибка при добавлении пользователя с telegram_id=%s: %s',
+                telegram_id,
+                e,
             )
+            return False
 
     async def get_all_users(self) -> list[TelegramUser]:
         try:
@@ -36,5 +39,28 @@ class SQLAlchemyTelegramRepository(BaseTelegramRepository):
             users = result.scalars().all()
             return users
         except Exception as e:
-            logger.error(f'Ошибка при получении списка пользователей: {e}')
+            logger.error('Ошибка при получении списка пользователей: %s', e)
             return []
+
+    async def get_recipients_batch(
+        self, after_id: int, limit: int
+    ) -> list[tuple[int, int]]:
+        try:
+            result = await self._session.execute(
+                select(TelegramUser.id, TelegramUser.telegram_id)
+                .where(TelegramUser.id > after_id)
+                .order_by(TelegramUser.id)
+                .limit(limit)
+            )
+            return [(row.id, row.telegram_id) for row in result.all()]
+        except Exception:
+            logger.exception('Ошибка при получении получателей после id=%s', after_id)
+            raise
+
+    async def count_users(self) -> int:
+        try:
+            result = await self._session.execute(select(func.count(TelegramUser.id)))
+            return result.scalar_one()
+        except Exception:
+            logger.exception('Ошибка при подсчете пользователей бота')
+            raise
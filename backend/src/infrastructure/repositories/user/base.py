@@ -4,6 +4,8 @@ from typing import Generic, TypeVar
 
 from src.domain.user.blocked_user import BlockedUserEntity
 from src.domain.user.entity import UserEntity
+from src.domain.user.listing import UserListFilter, UserRelation, UserSummary
+from src.domain.user.principal import UserPrincipal
 from src.infrastructure.database.models.base import Base
 
 T = TypeVar('T', bound=Base)
@@ -18,7 +20,22 @@ class BaseUserRepository(ABC, Generic[T]):
     async def get_user_by_telegram_id(self, telegram_id: int) -> UserEntity | None: ...
 
     @abstractmethod
-    async def get_all_users(self) -> list[UserEntity] | None: ...
+    async def get_principal_by_telegram_id(
+        self, telegram_id: int
+    ) -> UserPrincipal | None: ...
+
+    @abstractmethod
+    async def get_user_summaries(
+        self, filters: UserListFilter, limit: int, after_id: int | None = None
+    ) -> list[UserSummary]: ...
+
+    @abstractmethod
+    async def count_users(self, filters: UserListFilter) -> int: ...
+
+    @abstractmethod
+    async def get_users_with_relations(
+        self, user_ids: list[int], relations: frozenset[UserRelation]
+    ) -> list[UserEntity]: ...
 
     @abstractmethod
     async def get_user_with_rentals(self, user_id: int) -> UserEntity | None: ...
@@ -31,6 +48,9 @@ class BaseUserRepository(ABC, Generic[T]):
         self, telegram_id: int
     ) -> UserEntity | None: ...
 
+    @abstractmethod
+    async def change_balance(self, telegram_id: int, amount: int) -> int | None: ...
+
     @abstractmethod
     async def delete(self, entity: UserEntity) -> None: ...
 
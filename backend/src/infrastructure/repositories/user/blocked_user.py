@@ -6,12 +6,14 @@ from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.const import MOSCOW_TZ
 from src.domain.user.blocked_user import BlockedUserEntity
+from src.infrastructure.database.instrumentation import instrument_queries
 from src.infrastructure.database.models.blocked_users import BlockedUser
 from src.infrastructure.repositories.user.base import BaseBlockedUserRepository
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_queries
 @dataclass
 class BlockedUserRepository(BaseBlockedUserRepository):
     _session: AsyncSession
@@ -20,10 +22,12 @@ class BlockedUserRepository(BaseBlockedUserRepository):
         try:
             model: BlockedUser = BlockedUser.from_entity(entity=block)
             self._session.add(model)
-            logger.info(f'Блокировка добавлена для пользователя с id={block.user_id}')
+            logger.info('Блокировка добавлена для пользователя с id=%s', block.user_id)
         except Exception as e:
             logger.error(
-                f'Ошибка при добавлении блокировки пользователя id={block.user_id}: {e}'
+                'Ошибка при добавлении блокировки пользователя id=%s: %s',
+                block.user_id,
+                e,
             )
             raise
 
@@ -42,9 +46,9 @@ class BlockedUserRepository(BaseBlockedUserRepository):
             db_block.reason = block.reason
             db_block.blocked_by = block.blocked_by
 
-            logger.info(f'Блокировка с id={block.id} успешно обновлена')
+            logger.info('Блокировка с id=%s успешно обновлена', block.id)
         except Exception as e:
-            logger.error(f'Ошибка при обновлении блокировки id={block.id}: {e}')
+            logger.error('Ошибка при обновлении блокировки id=%s: %s', block.id, e)
             raise
 
     async def get_active_block_by_user_id(
@@ -60,7 +64,7 @@ class BlockedUserRepository(BaseBlockedUserRepository):
             db_block = result.scalar_one_or_none()
             if db_block is None:
                 logger.info(
-                    f'Активная блокировка для пользователя id={user_id} не найдена'
+                    'Активная блокировка для пользователя id=%s не найдена', user_id
                 )
                 return None
             return db_block.to_entity()
@@ -73,11 +77,13 @@ class BlockedUserRepository(BaseBlockedUserRepository):
             result = await self._session.execute(stmt)
             db_blocks = result.scalars().all()
             logger.info(
-                f'Найдено {len(db_blocks)} блокировок для пользователя id={user_id}'
+                'Найдено %s блокировок для пользователя id=%s', len(db_blocks), user_id
             )
             return [db_block.to_entity() for db_block in db_blocks]
         except Exception as e:
             logger.error(
-                f'Ошибка при получении всех блокировок пользователя id={user_id}: {e}'
+                'Ошибка при получении всех блокировок пользователя id=%s: %s',
+                user_id,
+                e,
             )
             raise
@@ -1,10 +1,16 @@
 import logging
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
+from src.const import MOSCOW_TZ
 from src.domain.user.entity import UserEntity
+from src.domain.user.listing import UserListFilter, UserRelation, UserSummary
+from src.domain.user.principal import UserPrincipal
+from src.domain.user.value_object import TelegramId
+from src.infrastructure.database.instrumentation import instrument_queries
+from src.infrastructure.database.models.blocked_users import BlockedUser
 from src.infrastructure.database.models.bots import BotRental
 from src.infrastructure.database.models.user import User
 from src.infrastructure.repositories.user.base import BaseUserRepository
@@ -12,6 +18,7 @@ from src.infrastructure.repositories.user.base import BaseUserRepository
 logger = logging.getLogger(__name__)
 
 
+@instrument_queries
 @dataclass
 class SQLAlchemyUserRepository(BaseUserRepository):
     _session: AsyncSession
@@ -21,10 +28,10 @@ class SQLAlchemyUserRepository(BaseUserRepository):
             model: User = User.from_entity(entity=entity)
             self._session.add(model)
             await self._session.flush()
-            logger.info(f'Пользователь добавлен: {entity}')
+            logger.info('Пользователь добавлен: %s', entity.telegram_id.to_raw())
             return entity
         except Exception:
-            logger.exception(f'Ошибка при добавлении пользователя: {entity} в БД')
+            logger.exception('Ошибка при добавлении пользователя: %s в БД', entity)
             raise
 
     async def get_full_user_info_for_admin(self, telegram_id: int) -> UserEntity | None:
@@ -41,16 +48,122 @@ class SQLAlchemyUserRepository(BaseUserRepository):
 
         return user.to_entity() if user else None
 
-    async def get_all_users(self) -> list[UserEntity] | None:
+    async def get_user_summaries(
+        self, filters: UserListFilter, limit: int, after_id: int | None = None
+    ) -> list[UserSummary]:
         try:
-            result = await self._session.execute(select(User))
-            users: list[User] = result.scalars().all()
-            logger.info(f'Получено пользователей: {len(users)}')
-            return [user.to_entity() for user in users] if users else None
+            blocked_until = (
+                select(func.max(BlockedUser.blocked_until))
+                .where(BlockedUser.user_id == User.id)
+                .scalar_subquery()
+            )
+            stmt = (
+                select(
+                    User.id,
+                    User.created_at,
+                    User.telegram_id,
+                    User.role,
+                    User.balance,
+                    User.is_deleted,
+                    User.referrer_id,
+                    User.total_bonus_received,
+                    blocked_until.label('blocked_until'),
+                )
+                .where(*self._user_list_conditions(filters))
+                .order_by(User.id)
+                .limit(limit)
+            )
+            if after_id is not None:
+                stmt = stmt.where(User.id > after_id)
+
+            result = await self._session.execute(stmt)
+            rows = result.all()
+            logger.info('Получено пользователей: %s', len(rows))
+
+            return [
+                UserSummary(
+                    id=row.id,
+                    created_at=row.created_at.astimezone(MOSCOW_TZ),
+                    telegram_id=TelegramId(value=row.telegram_id),
+                    role=row.role,
+                    balance=row.balance,
+                    is_deleted=row.is_deleted,
+                    blocked_until=row.blocked_until.astimezone(MOSCOW_TZ)
+                    if row.blocked_until
+                    else None,
+                    referrer_id=row.referrer_id,
+                    total_bonus_received=row.total_bonus_received,
+                )
+                for row in rows
+            ]
+        except Exception:
+            logger.exception('Ошибка при получении списка пользователей')
+            raise
+
+    async def count_users(self, filters: UserListFilter) -> int:
+        try:
+            result = await self._session.execute(
+                select(func.count(User.id)).where(*self._user_list_conditions(filters))
+            )
+            return result.scalar_one()
+        except Exception:
+            logger.exception('Ошибка при подсчете пользователей')
+            raise
+
+    async def get_users_with_relations(
+        self, user_ids: list[int], relations: frozenset[UserRelation]
+    ) -> list[UserEntity]:
+        try:
+            loaders = {
+                UserRelation.BLOCKS: User.blocks,
+                UserRelation.RENTALS: User.rentals,
+                UserRelation.REFERRALS: User.referrals,
+            }
+            result = await self._session.execute(
+                select(User)
+                .where(User.id.in_(user_ids))
+                .options(
+                    noload(User.referred_by),
+                    *(
+                        selectinload(attr) if relation in relations else noload(attr)
+                        for relation, attr in loaders.items()
+                    ),
+                )
+            )
+            return [user.to_entity() for user in result.scalars().all()]
         except Exception:
-            logger.exception('Ошибка при получении всех пользователей')
+            logger.exception('Ошибка при загрузке связей пользователей')
             raise
 
+    @staticmethod
+    def _user_list_conditions(filters: UserListFilter) -> list:
+        conditions: list = []
+
+        if filters.role is not None:
+            conditions.append(User.role == filters.role)
+        if filters.is_deleted is not None:
+            conditions.append(User.is_deleted == filters.is_deleted)
+        if filters.balance_min is not None:
+            conditions.append(User.balance >= filters.balance_min)
+        if filters.balance_max is not None:
+            conditions.append(User.balance <= filters.balance_max)
+        if filters.created_from is not None:
+            conditions.append(User.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            conditions.append(User.created_at <= filters.created_to)
+        if filters.is_blocked is not None:
+            active_block = (
+                select(BlockedUser.id)
+                .where(
+                    BlockedUser.user_id == User.id,
+                    BlockedUser.blocked_until > func.now(),
+                )
+                .exists()
+            )
+            conditions.append(active_block if filters.is_blocked else ~active_block)
+
+        return conditions
+
     async def get_user_with_rentals(self, user_id: int) -> UserEntity | None:
         result = await self._session.execute(
             select(User)
@@ -71,14 +184,63 @@ class SQLAlchemyUserRepository(BaseUserRepository):
             user: User | None = result.scalar_one_or_none()
 
             if user:
-                logger.info(f'Найден пользователь с telegram_id={telegram_id}')
+                logger.info('Найден пользователь с telegram_id=%s', telegram_id)
                 return user.to_entity()
 
-            logger.warning(f'Пользователь с telegram_id={telegram_id} не найден')
+            logger.warning('Пользователь с telegram_id=%s не найден', telegram_id)
             return None
         except Exception:
             logger.exception(
-                f'Ошибка при получении пользователя с telegram_id={telegram_id}'
+                'Ошибка при получении пользователя с telegram_id=%s', telegram_id
+            )
+            raise
+
+    async def get_principal_by_telegram_id(
+        self, telegram_id: int
+    ) -> UserPrincipal | None:
+        try:
+            blocked_until = (
+                select(func.max(BlockedUser.blocked_until))
+                .where(BlockedUser.user_id == User.id)
+                .scalar_subquery()
+            )
+            # max() пропускает NULL, а NULL означает бессрочную блокировку.
+            blocked_forever = (
+                select(BlockedUser.id)
+                .where(
+                    BlockedUser.user_id == User.id, BlockedUser.blocked_until.is_(None)
+                )
+                .exists()
+            )
+            result = await self._session.execute(
+                select(
+                    User.id,
+                    User.telegram_id,
+                    User.role,
+                    User.is_deleted,
+                    blocked_until.label('blocked_until'),
+                    blocked_forever.label('blocked_forever'),
+                ).where(User.telegram_id == telegram_id)
+            )
+            row = result.one_or_none()
+
+            if row is None:
+                logger.warning('Пользователь с telegram_id=%s не найден', telegram_id)
+                return None
+
+            return UserPrincipal(
+                id=row.id,
+                telegram_id=TelegramId(value=row.telegram_id),
+                role=row.role,
+                is_deleted=row.is_deleted,
+                blocked_until=row.blocked_until.astimezone(MOSCOW_TZ)
+                if row.blocked_until
+                else None,
+                blocked_forever=row.blocked_forever,
+            )
+        except Exception:
+            logger.exception(
+                'Ошибка при получении пользователя с telegram_id=%s', telegram_id
             )
             raise
 
@@ -91,26 +253,53 @@ class SQLAlchemyUserRepository(BaseUserRepository):
 
             if not user_model:
                 logger.warning(
-                    f'Пользователь для обновления не найден: {entity.telegram_id}'
+                    'Пользователь для обновления не найден: %s', entity.telegram_id
                 )
                 return None
 
-            user_model.balance = entity.balance.to_raw()
             user_model.is_deleted = entity.is_deleted
             user_model.role = entity.role.value
             user_model.referrer_id = entity.referrer_id
             user_model.total_bonus_received = entity.total_bonus_received
 
-            logger.info(f'Изменения пользователя подготовлены: {entity.telegram_id}')
+            logger.info(
+                'Изменения пользователя подготовлены: %s', entity.telegram_id.to_raw()
+            )
             return entity
 
         except Exception:
-            logger.exception(f'Ошибка при подготовке обновления пользователя: {entity}')
+            logger.exception(
+                'Ошибка при подготовке обновления пользователя: %s', entity
+            )
+            raise
+
+    async def change_balance(self, telegram_id: int, amount: int) -> int | None:
+        try:
+            result = await self._session.execute(
+                update(User)
+                .where(User.telegram_id == telegram_id, User.balance + amount >= 0)
+                .values(balance=User.balance + amount)
+                .returning(User.balance)
+            )
+            balance: int | None = result.scalar_one_or_none()
+
+            if balance is None:
+                logger.warning(
+                    'Баланс пользователя %s не изменен на %s', telegram_id, amount
+                )
+                return None
+
+            logger.info('Баланс пользователя %s изменен на %s', telegram_id, amount)
+            return balance
+        except Exception:
+            logger.exception(
+                'Ошибка при изменении баланса пользователя %s', telegram_id
+            )
             raise
 
     async def delete(self, entity):
         try:
             return await super().delete(entity)
         except Exception:
-            logger.exception(f'Ошибка при удалении пользователя: {entity}')
+            logger.exception('Ошибка при удалении пользователя: %s', entity)
             raise
@@ -0,0 +1,42 @@
+from datetime import datetime
+
+from src.const import MOSCOW_TZ
+from taskiq import AsyncTaskiqDecoratedTask
+from taskiq.kicker import AsyncKicker
+
+# Плагин delayed exchange хранит задержку в 32 битах миллисекунд (~49 дней),
+# поэтому далекие события доставляются в несколько переходов.
+MAX_DELAY_SECONDS: float = 30 * 24 * 60 * 60
+ETA_TOLERANCE_SECONDS: float = 1.0
+
+
+def delayed_kicker(task: AsyncTaskiqDecoratedTask, delay: float) -> AsyncKicker:
+    # with_labels меняет словарь меток самой задачи: без копии delay одного
+    # вызова достался бы всем следующим отправкам этой задачи.
+    kicker: AsyncKicker = task.kicker()
+    kicker.labels = dict(kicker.labels)
+    return kicker.with_labels(delay=delay)
+
+
+async def kick_at(
+    task: AsyncTaskiqDecoratedTask, eta: datetime, **kwargs: object
+) -> None:
+    delay: float = (eta - datetime.now(tz=MOSCOW_TZ)).total_seconds()
+    kicker: AsyncKicker = (
+        delayed_kicker(task, min(delay, MAX_DELAY_SECONDS))
+        if delay > ETA_TOLERANCE_SECONDS
+        else task.kicker()
+    )
+    await kicker.kiq(eta=eta.isoformat(), **kwargs)
+
+
+async def reschedule_if_early(
+    task: AsyncTaskiqDecoratedTask, eta: str, **kwargs: object
+) -> bool:
+    eta_at: datetime = datetime.fromisoformat(eta)
+
+    if (eta_at - datetime.now(tz=MOSCOW_TZ)).total_seconds() <= ETA_TOLERANCE_SECONDS:
+        return False
+
+    await kick_at(task, eta_at, **kwargs)
+    return True
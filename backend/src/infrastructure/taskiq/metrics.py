@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from aio_pika import connect_robust
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.exceptions import AMQPError
+from prometheus_client import Gauge, Histogram
+from taskiq import TaskiqMessage, TaskiqMiddleware
+
+logger = logging.getLogger(__name__)
+
+ENQUEUED_AT_LABEL: str = 'enqueued_at'
+
+TASKIQ_QUEUE_LATENCY_SECONDS: Histogram = Histogram(
+    'taskiq_queue_latency_seconds',
+    'Время от постановки задачи в очередь до начала выполнения',
+    ['queue', 'task'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900),
+)
+TASKIQ_QUEUE_DEPTH: Gauge = Gauge(
+    'taskiq_queue_depth', 'Сообщения, ожидающие в очереди RabbitMQ', ['queue']
+)
+TASKIQ_QUEUE_CONSUMERS: Gauge = Gauge(
+    'taskiq_queue_consumers', 'Подписчики очереди RabbitMQ', ['queue']
+)
+
+
+class QueueLatencyMiddleware(TaskiqMiddleware):
+    def __init__(self, queue_name: str) -> None:
+        super().__init__()
+        self._queue_name = queue_name
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        message.labels.setdefault(ENQUEUED_AT_LABEL, time.time())
+        return message
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        enqueued_at: str | None = message.labels.get(ENQUEUED_AT_LABEL)
+
+        if enqueued_at is not None:
+            # Отложенная задача ждет delay намеренно, это не задержка очереди.
+            delay: float = float(message.labels.get('delay') or 0)
+            TASKIQ_QUEUE_LATENCY_SECONDS.labels(
+                queue=self._queue_name, task=message.task_name
+            ).observe(max(time.time() - float(enqueued_at) - delay, 0.0))
+
+        return message
+
+
+@dataclass
+class QueueDepthMonitor:
+    _url: str
+    queue_names: list[str]
+    interval_seconds: float
+
+    def __post_init__(self) -> None:
+        self._connection: AbstractRobustConnection | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        # Отдельное соединение: события воркера срабатывают раньше, чем брокер
+        # открывает свои, а пассивная проверка отсутствующей очереди закрывает
+        # канал, на котором выполнялась.
+        self._connection = await connect_robust(self._url)
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        if self._connection is not None:
+            await self._connection.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                channel: AbstractChannel = await self._connection.channel()
+                async with channel:
+                    for name in self.queue_names:
+                        queue = await channel.declare_queue(name, passive=True)
+                        TASKIQ_QUEUE_DEPTH.labels(queue=name).set(
+                            queue.declaration_result.message_count
+                        )
+                        TASKIQ_QUEUE_CONSUMERS.labels(queue=name).set(
+                            queue.declaration_result.consumer_count
+                        )
+            except AMQPError as e:
+                logger.warning('Не удалось получить размер очередей: %s', e)
+
+            await asyncio.sleep(self.interval_seconds)
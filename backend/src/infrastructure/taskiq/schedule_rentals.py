@@ -0,0 +1,35 @@
+import asyncio
+
+from src.application.services.rental_events import RentalEventSchedulerImpl
+from src.application.use_cases.system.schedule_rental_events import (
+    ScheduleRentalEventsUseCase,
+)
+from src.config import Config
+from src.infrastructure.database.postgresql import new_session_maker
+from src.infrastructure.repositories.rental.sqlalchemy import SQLAlchemyRentalRepository
+from src.infrastructure.taskiq.broker import shutdown_brokers, startup_brokers
+from src.logger import setup_logger, shutdown_logger
+
+
+# Разовый запуск для аренд, созданных до появления отложенных событий.
+# Повторный запуск безопасен: задачи сверяют аренду с базой, а напоминание
+# отправляется не больше одного раза.
+async def main() -> None:
+    config: Config = Config()
+    setup_logger(config.logging)
+    await startup_brokers()
+
+    try:
+        async with new_session_maker(config.postgres)() as session:
+            use_case = ScheduleRentalEventsUseCase(
+                _rental_repository=SQLAlchemyRentalRepository(_session=session),
+                _rental_events=RentalEventSchedulerImpl(),
+            )
+            await use_case.execute()
+    finally:
+        await shutdown_brokers()
+        shutdown_logger()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
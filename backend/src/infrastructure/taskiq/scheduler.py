@@ -1,9 +1,43 @@
-from taskiq import TaskiqScheduler
+from taskiq import ScheduledTask, TaskiqScheduler
+from taskiq.abc.schedule_source import ScheduleSource
+from taskiq.exceptions import ScheduledTaskCancelledError
+from taskiq.kicker import AsyncKicker
 from taskiq.schedule_sources import LabelScheduleSource
+from taskiq.utils import maybe_awaitable
+
+from .broker import BROKERS, broker, shutdown_brokers, startup_brokers
+
+
+class MultiBrokerScheduler(TaskiqScheduler):
+    # Стандартный планировщик отправляет все задачи через один брокер, а у
+    # задач разные очереди: отправляем через брокер источника расписания.
+    async def startup(self) -> None:
+        for item in BROKERS:
+            item.is_scheduler_process = True
+        await startup_brokers()
+
+    async def on_ready(self, source: ScheduleSource, task: ScheduledTask) -> None:
+        if not isinstance(source, LabelScheduleSource):
+            await super().on_ready(source, task)
+            return
+
+        try:
+            await maybe_awaitable(source.pre_send(task))
+        except ScheduledTaskCancelledError:
+            return
+
+        await (
+            AsyncKicker(task.task_name, source.broker, task.labels)
+            .with_labels(schedule_id=task.schedule_id)
+            .kiq(*task.args, **task.kwargs)
+        )
+        await maybe_awaitable(source.post_send(task))
+
+    async def shutdown(self) -> None:
+        await shutdown_brokers()
 
-from .broker import broker
 
 # redis_source: RedisScheduleSource = RedisScheduleSource('redis://redis:6379')
-schedule: TaskiqScheduler = TaskiqScheduler(
-    broker, sources=[LabelScheduleSource(broker=broker)]
+schedule: TaskiqScheduler = MultiBrokerScheduler(
+    broker, sources=[LabelScheduleSource(broker=item) for item in BROKERS]
 )
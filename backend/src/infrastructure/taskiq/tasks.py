@@ -1,94 +1,329 @@
-import asyncio
 import logging
 import os
+from datetime import datetime
+from typing import Annotated
 
-import psutil
-from aiogram import Bot
-from src.const import MB
-from src.infrastructure.taskiq.broker import broker
-
-token: str = os.getenv(key='TELEGRAM_TOKEN_BOT')
-
-bot: Bot = Bot(token=token)
+from prometheus_client import start_http_server
+from src.application.use_cases.admin.broadcast.run_broadcast import (
+    RunBroadcastUseCase,
+)
+from src.application.use_cases.system.admin_digest import FlushAdminDigestUseCase
+from src.application.use_cases.system.expire_rentals import (
+    ExpireRentalsUseCase,
+    ExpireRentalUseCase,
+    RemindExpiringRentalUseCase,
+)
+from src.config import Config
+from src.infrastructure.cache.redis import RedisCacheService, new_redis_pool
+from src.infrastructure.cache.token_bucket import RedisTokenBucket
+from src.infrastructure.cache.user import TwoTierUserCacheService
+from src.infrastructure.database.postgresql import new_session_maker
+from src.infrastructure.database.routing import ReadReplicaRouter
+from src.infrastructure.monitoring.sampler import (
+    SystemMetricsSampler,
+    SystemSample,
+    WindowSummary,
+)
+from src.infrastructure.repositories.audit.redis import RedisAuditEventRepository
+from src.infrastructure.repositories.broadcast.redis import RedisBroadcastRepository
+from src.infrastructure.repositories.rental.sqlalchemy import SQLAlchemyRentalRepository
+from src.infrastructure.repositories.telegram.sqlalchemy import (
+    SQLAlchemyTelegramRepository,
+)
+from src.infrastructure.taskiq.broker import (
+    BROKERS,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    broker,
+    bulk_broker,
+)
+from src.infrastructure.taskiq.delay import delayed_kicker, reschedule_if_early
+from src.infrastructure.taskiq.metrics import QueueDepthMonitor
+from src.infrastructure.telegram.bot import new_telegram_bot
+from src.infrastructure.telegram.dispatcher import TelegramSendDispatcher
+from src.logger import setup_logger, shutdown_logger
+from taskiq import Context, TaskiqDepends, TaskiqEvents, TaskiqState
 
 ADMIN_CHAT_ID: int = 340906161
+BROADCAST_RATE_LIMIT_KEY: str = 'broadcast:rate-limit'
+INTERACTIVE_RATE_LIMIT_KEY: str = 'interactive:rate-limit'
+BROADCAST_RETRY_SECONDS: float = 30.0
+BROADCAST_MAX_RETRY_SECONDS: float = 10 * 60
+BROADCAST_MAX_ATTEMPTS: int = 10
 
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.ERROR)
-
 
 log_file_path = os.path.join(os.path.dirname(__file__), 'error.log')
 
-file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
-formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s')
-file_handler.setFormatter(formatter)
 
-logger.addHandler(file_handler)
-
-
-@broker.task
-async def send_notification(user_id: int, text: str) -> None:
+@broker.task(priority=PRIORITY_HIGH)
+async def send_notification(
+    user_id: int, text: str, context: Annotated[Context, TaskiqDepends()]
+) -> None:
     try:
-        await bot.send_message(chat_id=user_id, text=text)
+        sender: TelegramSendDispatcher = context.state.interactive_sender
+        await sender.send_message(chat_id=user_id, text=text)
     except Exception as e:
         logger.error(
-            f'Ошибка в send_notification для user_id={user_id}: {e}', exc_info=True
+            'Ошибка в send_notification для user_id=%s: %s', user_id, e, exc_info=True
         )
 
 
-@broker.task
-async def send_notification_for_admin(text: str) -> None:
+@broker.task(priority=PRIORITY_NORMAL)
+async def send_notification_for_admin(
+    text: str, context: Annotated[Context, TaskiqDepends()]
+) -> None:
     try:
-        await bot.send_message(chat_id=ADMIN_CHAT_ID, text=text)
+        sender: TelegramSendDispatcher = context.state.interactive_sender
+        await sender.send_message(chat_id=ADMIN_CHAT_ID, text=text)
     except Exception as e:
         logger.error(
-            f'Ошибка в send_notification для user_id={ADMIN_CHAT_ID}: {e}',
+            'Ошибка в send_notification для user_id=%s: %s',
+            ADMIN_CHAT_ID,
+            e,
             exc_info=True,
         )
 
 
-@broker.task(schedule=[{'cron': '*/10 * * * *'}])
-async def send_system_stats() -> None:
+# Основной запуск идет с задержкой из AdminNotifier, а расписание подбирает
+# события, если отложенное сообщение потерялось.
+@broker.task(schedule=[{'cron': '* * * * *'}], priority=PRIORITY_LOW)
+async def flush_admin_digest(context: Annotated[Context, TaskiqDepends()]) -> None:
     try:
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        use_case = FlushAdminDigestUseCase(
+            _audit_repository=RedisAuditEventRepository(
+                _cache_service=context.state.cache_service
+            ),
+            _sender=context.state.interactive_sender,
+            _chat_id=ADMIN_CHAT_ID,
+            _max_events=context.state.config.admin_digest.max_events,
+        )
+        await use_case.execute()
+    except Exception as e:
+        logger.error('Ошибка в flush_admin_digest: %s', e, exc_info=True)
+
+
+async def startup_worker(state: TaskiqState) -> None:
+    config: Config = Config()
+    setup_logger(config.logging, error_log_path=log_file_path)
+    try:
+        start_http_server(config.rabbitmq.metrics_port)
+    except OSError as e:
+        # При нескольких процессах воркера порт занимает первый из них.
+        logger.error('Метрики воркера не запущены: %s', e)
+
+    state.config = config
+    state.session_maker = new_session_maker(config.postgres)
+    state.cache_service = RedisCacheService(pool=new_redis_pool(config.redis))
+    # Воркер читает только с primary, роутер нужен, чтобы закреплять за primary
+    # пользователей, чьи аренды меняют задачи.
+    state.replica_router = ReadReplicaRouter(
+        _cache_service=state.cache_service,
+        _replica_session_maker=None,
+        pin_seconds=config.postgres.read_your_writes_seconds,
+    )
+    state.broadcast_rate_limiter = RedisTokenBucket(
+        _client=state.cache_service.client,
+        key=BROADCAST_RATE_LIMIT_KEY,
+        rate=config.telegram.broadcast_rate,
+        capacity=config.telegram.broadcast_burst,
+    )
+    # Один клиент Telegram на процесс воркера: соединения переиспользуются
+    # между задачами, а отправки ограничены общим диспетчером.
+    state.bot = new_telegram_bot(config.telegram)
+    state.telegram_sender = TelegramSendDispatcher(
+        _bot=state.bot,
+        _rate_limiter=state.broadcast_rate_limiter,
+        concurrency=config.telegram.send_concurrency,
+    )
+    # Коды входа не должны стоять в очереди за рассылкой к лимиту Telegram,
+    # поэтому у интерактивных отправок свое ведро и свой семафор.
+    state.interactive_sender = TelegramSendDispatcher(
+        _bot=state.bot,
+        _rate_limiter=RedisTokenBucket(
+            _client=state.cache_service.client,
+            key=INTERACTIVE_RATE_LIMIT_KEY,
+            rate=config.telegram.interactive_rate,
+            capacity=config.telegram.interactive_burst,
+        ),
+        concurrency=config.telegram.send_concurrency,
+    )
+    state.system_metrics_sampler = SystemMetricsSampler.from_config(config.monitoring)
+    await state.system_metrics_sampler.start()
 
-        memory_total_mb = round(memory.total / MB, 2)
-        memory_used_mb = round(memory.used / MB, 2)
-        memory_percent = memory.percent
+    state.queue_depth_monitor = QueueDepthMonitor(
+        _url=config.rabbitmq.url,
+        queue_names=[config.rabbitmq.interactive_queue, config.rabbitmq.bulk_queue],
+        interval_seconds=config.rabbitmq.depth_interval_seconds,
+    )
+    await state.queue_depth_monitor.start()
 
-        disk_total_mb = round(disk.total / MB, 2)
-        disk_used_mb = round(disk.used / MB, 2)
-        disk_percent = disk.percent
+
+async def shutdown_worker(state: TaskiqState) -> None:
+    await state.queue_depth_monitor.close()
+    await state.system_metrics_sampler.close()
+    await state.bot.session.close()
+    await state.cache_service.close()
+    shutdown_logger()
+
+
+@broker.task(schedule=[{'cron': '*/10 * * * *'}], priority=PRIORITY_LOW)
+async def send_system_stats(context: Annotated[Context, TaskiqDepends()]) -> None:
+    try:
+        sampler: SystemMetricsSampler = context.state.system_metrics_sampler
+        sample: SystemSample | None = sampler.latest()
+
+        if sample is None:
+            logger.error('send_system_stats: метрики сервера еще не собраны')
+            return
+
+        window: WindowSummary = sampler.summary(window_seconds=300)
+        cpu_avg: float = round(window.metrics['cpu_percent'].avg, 1)
+        loop_lag_max: float = window.metrics['loop_lag_ms'].max
 
         msg = (
             f'🖥 <b>Мониторинг сервера</b>\n'
-            f'🧠 CPU: {cpu_percent}%\n\n'
+            f'🧠 CPU: {sample.cpu_percent}% (среднее за 5 мин: {cpu_avg}%)\n\n'
             f'💾 Память:\n'
-            f'• Всего: {memory_total_mb} MB\n'
-            f'• Использовано: {memory_used_mb} MB\n'
-            f'• Загрузка: {memory_percent}%\n\n'
+            f'• Всего: {sample.memory_total_mb} MB\n'
+            f'• Использовано: {sample.memory_used_mb} MB\n'
+            f'• Загрузка: {sample.memory_percent}%\n\n'
             f'📀 Диск:\n'
-            f'• Всего: {disk_total_mb} MB\n'
-            f'• Использовано: {disk_used_mb} MB\n'
-            f'• Загрузка: {disk_percent}%'
+            f'• Всего: {sample.disk_total_mb} MB\n'
+            f'• Использовано: {sample.disk_used_mb} MB\n'
+            f'• Загрузка: {sample.disk_percent}%\n\n'
+            f'⏱ Задержка event loop: {sample.loop_lag_ms} ms '
+            f'(макс. за 5 мин: {loop_lag_max} ms)'
         )
 
-        await bot.send_message(chat_id=ADMIN_CHAT_ID, text=msg, parse_mode='HTML')
+        sender: TelegramSendDispatcher = context.state.interactive_sender
+        await sender.send_message(chat_id=ADMIN_CHAT_ID, text=msg, parse_mode='HTML')
+
+    except Exception as e:
+        logger.error('Ошибка в send_system_stats: %s', e, exc_info=True)
 
+
+# Сверка на случай потерянных отложенных сообщений и аренд, созданных до
+# появления событий: основное истечение приходит из expire_rental.
+@bulk_broker.task(schedule=[{'cron': '0 * * * *'}])
+async def expire_rentals(context: Annotated[Context, TaskiqDepends()]) -> None:
+    try:
+        async with context.state.session_maker() as session:
+            use_case = ExpireRentalsUseCase(
+                _rental_repository=SQLAlchemyRentalRepository(_session=session),
+                _user_cache=TwoTierUserCacheService(
+                    _cache_service=context.state.cache_service
+                ),
+                _session=session,
+                _replica_router=context.state.replica_router,
+            )
+            await use_case.execute()
     except Exception as e:
-        logger.error(f'Ошибка в send_system_stats: {e}', exc_info=True)
+        logger.error('Ошибка в expire_rentals: %s', e, exc_info=True)
 
 
-@broker.task
-async def send_copy_task(to_chat_id: int, from_chat_id: int, from_message_id: int):
+@bulk_broker.task
+async def expire_rental(
+    rental_id: int, eta: str, context: Annotated[Context, TaskiqDepends()]
+) -> None:
     try:
-        await bot.copy_message(
-            chat_id=to_chat_id, from_chat_id=from_chat_id, message_id=from_message_id
+        if await reschedule_if_early(expire_rental, eta, rental_id=rental_id):
+            return
+
+        async with context.state.session_maker() as session:
+            use_case = ExpireRentalUseCase(
+                _rental_repository=SQLAlchemyRentalRepository(_session=session),
+                _user_cache=TwoTierUserCacheService(
+                    _cache_service=context.state.cache_service
+                ),
+                _session=session,
+                _replica_router=context.state.replica_router,
+            )
+            await use_case.execute(rental_id=rental_id)
+    except Exception as e:
+        logger.error('Ошибка в expire_rental id=%s: %s', rental_id, e, exc_info=True)
+
+
+@bulk_broker.task
+async def remind_rental_expiring(
+    rental_id: int,
+    rented_until: str,
+    eta: str,
+    context: Annotated[Context, TaskiqDepends()],
+) -> None:
+    try:
+        if await reschedule_if_early(
+            remind_rental_expiring, eta, rental_id=rental_id, rented_until=rented_until
+        ):
+            return
+
+        async with context.state.session_maker() as session:
+            use_case = RemindExpiringRentalUseCase(
+                _rental_repository=SQLAlchemyRentalRepository(_session=session),
+                _cache_service=context.state.cache_service,
+                _sender=context.state.telegram_sender,
+            )
+            await use_case.execute(
+                rental_id=rental_id, rented_until=datetime.fromisoformat(rented_until)
+            )
+    except Exception as e:
+        logger.error(
+            'Ошибка в remind_rental_expiring id=%s: %s', rental_id, e, exc_info=True
         )
-        await asyncio.sleep(0.4)
+
+
+@bulk_broker.task
+async def run_broadcast(
+    broadcast_id: int,
+    context: Annotated[Context, TaskiqDepends()],
+    attempt: int = 0,
+) -> None:
+    try:
+        async with context.state.session_maker() as session:
+            use_case = RunBroadcastUseCase(
+                _broadcast_repository=RedisBroadcastRepository(
+                    _cache_service=context.state.cache_service
+                ),
+                _telegram_repository=SQLAlchemyTelegramRepository(_session=session),
+                _sender=context.state.telegram_sender,
+            )
+            has_more: bool = await use_case.execute(broadcast_id=broadcast_id)
     except Exception as e:
-        print(f'Ошибка рассылки пользователю {to_chat_id}: {e}')
-        raise e
+        # Курсор сохранен в Redis, поэтому рассылку продолжает отложенный
+        # повтор: кроме него и StartBroadcastUseCase задачу никто не ставит.
+        if attempt + 1 >= BROADCAST_MAX_ATTEMPTS:
+            logger.error(
+                'Рассылка id=%s остановлена после %s попыток: %s',
+                broadcast_id,
+                attempt + 1,
+                e,
+                exc_info=True,
+            )
+            return
+
+        delay: float = min(
+            BROADCAST_RETRY_SECONDS * 2**attempt, BROADCAST_MAX_RETRY_SECONDS
+        )
+        logger.error(
+            'Ошибка в run_broadcast id=%s, повтор через %s с: %s',
+            broadcast_id,
+            delay,
+            e,
+            exc_info=True,
+        )
+        await delayed_kicker(run_broadcast, delay).kiq(
+            broadcast_id=broadcast_id, attempt=attempt + 1
+        )
+        return
+
+    # Рассылка идет порциями, чтобы сообщение не висело неподтвержденным
+    # часами: при падении воркера RabbitMQ вернет только текущую порцию.
+    if has_more:
+        await run_broadcast.kiq(broadcast_id=broadcast_id)
+
+
+for item in BROKERS:
+    item.add_event_handler(TaskiqEvents.WORKER_STARTUP, startup_worker)
+    item.add_event_handler(TaskiqEvents.WORKER_SHUTDOWN, shutdown_worker)
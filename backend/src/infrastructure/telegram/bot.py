@@ -0,0 +1,18 @@
+import orjson
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
+from src.config import TelegramConfig
+
+
+def new_telegram_bot(config: TelegramConfig) -> Bot:
+    session = AiohttpSession(
+        api=TelegramAPIServer.from_base(config.api_url)
+        if config.api_url
+        else PRODUCTION,
+        limit=config.connection_limit,
+        timeout=config.request_timeout,
+        json_loads=orjson.loads,
+        json_dumps=lambda data: orjson.dumps(data).decode(),
+    )
+    return Bot(token=config.token, session=session)
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+from src.infrastructure.cache.token_bucket import RedisTokenBucket
+
+logger = logging.getLogger(__name__)
+
+SEND_ATTEMPTS: int = 3
+PER_CHAT_INTERVAL_SECONDS: float = 1.0
+CHAT_SLOTS_PRUNE_SIZE: int = 10_000
+
+
+@dataclass
+class TelegramSendDispatcher:
+    _bot: Bot
+    _rate_limiter: RedisTokenBucket
+    concurrency: int
+    per_chat_interval: float = PER_CHAT_INTERVAL_SECONDS
+    attempts: int = SEND_ATTEMPTS
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._chat_slots: dict[int, float] = {}
+
+    async def send_message(self, chat_id: int, text: str, **kwargs: object) -> bool:
+        return await self._dispatch(
+            chat_id,
+            lambda: self._bot.send_message(chat_id=chat_id, text=text, **kwargs),
+        )
+
+    async def copy_message(
+        self, chat_id: int, from_chat_id: int, message_id: int
+    ) -> bool:
+        return await self._dispatch(
+            chat_id,
+            lambda: self._bot.copy_message(
+                chat_id=chat_id, from_chat_id=from_chat_id, message_id=message_id
+            ),
+        )
+
+    async def _dispatch(
+        self, chat_id: int, call: Callable[[], Awaitable[object]]
+    ) -> bool:
+        for _ in range(self.attempts):
+            # Ожидание лимитов не занимает слот, поэтому медленный чат
+            # не тормозит отправку остальным.
+            delay: float = self._reserve_chat_slot(chat_id)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._rate_limiter.acquire()
+
+            try:
+                async with self._semaphore:
+                    await call()
+                return True
+            except TelegramRetryAfter as e:
+                # Flood control общий для бота, поэтому тормозим всех отправителей.
+                logger.warning(
+                    'Flood control для %s: пауза %s с', chat_id, e.retry_after
+                )
+                await self._rate_limiter.pause(e.retry_after)
+            except (TelegramForbiddenError, TelegramBadRequest) as e:
+                logger.info('Сообщение для %s не доставлено: %s', chat_id, e)
+                return False
+            except TelegramAPIError as e:
+                logger.error('Ошибка отправки сообщения %s: %s', chat_id, e)
+                return False
+
+        return False
+
+    def _reserve_chat_slot(self, chat_id: int) -> float:
+        now: float = time.monotonic()
+
+        if len(self._chat_slots) > CHAT_SLOTS_PRUNE_SIZE:
+            self._chat_slots = {
+                key: slot for key, slot in self._chat_slots.items() if slot > now
+            }
+
+        slot: float = max(now, self._chat_slots.get(chat_id, 0.0))
+        self._chat_slots[chat_id] = slot + self.per_chat_interval
+        return slot - now
@@ -3,9 +3,18 @@ from collections.abc import AsyncIterable
 from dishka import Provider, Scope, from_context, provide
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.services.admin_notifier import AdminNotifier, AdminNotifierImpl
 from src.application.services.auth import AuthServiceImpl, BaseAuthService
+from src.application.services.bot_catalog import (
+    BotCatalogService,
+    BotCatalogServiceImpl,
+)
 from src.application.services.code import CheckCodeService, SendCodeService
 from src.application.services.jwt import JWTService, JWTServiceImpl
+from src.application.services.rental_events import (
+    RentalEventScheduler,
+    RentalEventSchedulerImpl,
+)
 from src.application.use_cases.admin.bot.change_status_bot import (
     ActivateBotUseCase,
     DeactivateBotUseCase,
@@ -14,6 +23,7 @@ from src.application.use_cases.admin.bot.create_bot import CreateNewBotUseCase
 from src.application.use_cases.admin.bot.delete_bot import DeleteBotUseCase
 from src.application.use_cases.admin.bot.get_all_bots_with_rentals import (
     GetAllBotsWithRentalsUseCase,
+    GetBotRentalsUseCase,
 )
 from src.application.use_cases.admin.bot.update_bot import UpdateBotUseCase
 from src.application.use_cases.admin.users.block_user import BlockUserUseCase
@@ -25,6 +35,7 @@ from src.application.use_cases.admin.users.get_users import (
 )
 from src.application.use_cases.admin.users.unblock_user import UnblockUserUseCase
 from src.application.use_cases.admin.users.update_role import UpdateUserRoleUseCase
+from src.application.use_cases.admin.users.withdraw_money import WithdrawMoneyForUser
 from src.application.use_cases.user.auth import (
     LoginUserUseCase,
     RefreshTokenUseCase,
@@ -39,11 +50,31 @@ from src.application.use_cases.user.bot.stop_bot import StopBotRentalUseCase
 from src.application.use_cases.user.get_user_referrals import GetUserReferralsUseCase
 from src.application.use_cases.user.get_user_rentals import GetUserRentalsUseCase
 from src.config import Config
+from src.domain.common.exception import DomainErrorException
 from src.domain.jwt.exception import TokenAbsentException
 from src.domain.user.entity import UserEntity
-from src.infrastructure.cache.base import BaseCacheService
-from src.infrastructure.cache.redis import RedisCacheService
-from src.infrastructure.database.postgresql import new_session_maker
+from src.domain.user.exception import UserNotFoundException
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import (
+    BaseBotCatalogCache,
+    BaseCacheService,
+    BaseIdempotencyStore,
+    BaseRateLimiter,
+    BaseUserCacheService,
+)
+from src.infrastructure.cache.catalog import TwoTierBotCatalogCache
+from src.infrastructure.cache.idempotency import RedisIdempotencyStore
+from src.infrastructure.cache.rate_limit import RedisSlidingWindowRateLimiter
+from src.infrastructure.cache.redis import RedisCacheService, new_redis_pool
+from src.infrastructure.cache.user import TwoTierUserCacheService
+from src.infrastructure.database.postgresql import (
+    new_replica_session_maker,
+    new_session_maker,
+)
+from src.infrastructure.database.routing import ReadReplicaRouter, ReadSession
+from src.infrastructure.monitoring.sampler import SystemMetricsSampler
+from src.infrastructure.repositories.audit.base import BaseAuditEventRepository
+from src.infrastructure.repositories.audit.redis import RedisAuditEventRepository
 from src.infrastructure.repositories.bot.base import BaseBotRepository
 from src.infrastructure.repositories.bot.sqlalchemy import SQLAlchemyBotRepository
 from src.infrastructure.repositories.referral.base import BaseReferralRepository
@@ -69,6 +100,16 @@ class AppProvider(Provider):
     def get_session_maker(self, config: Config) -> async_sessionmaker[AsyncSession]:
         return new_session_maker(config.postgres)
 
+    @provide(scope=Scope.APP)
+    def get_read_replica_router(
+        self, config: Config, cache_service: BaseCacheService
+    ) -> ReadReplicaRouter:
+        return ReadReplicaRouter(
+            _cache_service=cache_service,
+            _replica_session_maker=new_replica_session_maker(config.postgres),
+            pin_seconds=config.postgres.read_your_writes_seconds,
+        )
+
     @provide(scope=Scope.REQUEST)
     async def get_session(
         self, session_maker: async_sessionmaker[AsyncSession]
@@ -76,6 +117,44 @@ class AppProvider(Provider):
         async with session_maker() as session:
             yield session
 
+    @provide(scope=Scope.REQUEST)
+    async def get_read_session(
+        self,
+        session: AsyncSession,
+        router: ReadReplicaRouter,
+        request: Request,
+        jwt_service: JWTService,
+    ) -> AsyncIterable[ReadSession]:
+        # Читаем с primary, если недавно менялись данные вызывающего или
+        # пользователя из пути: админ смотрит того, кого только что изменил.
+        if not router.enabled or await router.should_use_primary(
+            self._request_telegram_id(request, jwt_service),
+            self._path_telegram_id(request),
+        ):
+            yield session
+            return
+
+        async with router.replica_session() as replica_session:
+            yield replica_session
+
+    @staticmethod
+    def _request_telegram_id(request: Request, jwt_service: JWTService) -> int | None:
+        token: str | None = request.cookies.get('access_token')
+        if not token:
+            return None
+        try:
+            subject: str | None = jwt_service.verify_access_token(token=token).get(
+                'sub'
+            )
+        except DomainErrorException:
+            return None
+        return int(subject) if subject else None
+
+    @staticmethod
+    def _path_telegram_id(request: Request) -> int | None:
+        telegram_id: str | None = request.path_params.get('telegram_id')
+        return int(telegram_id) if telegram_id and telegram_id.isdigit() else None
+
     # REPOSITORIES
     @provide(scope=Scope.REQUEST)
     def get_user_repository(self, session: AsyncSession) -> BaseUserRepository:
@@ -159,40 +238,76 @@ class AppProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_all_users_use_case(
         self,
-        user_repository: BaseUserRepository,
+        read_session: ReadSession,
+        admin_notifier: AdminNotifier,
     ) -> GetAllUsersUseCase:
-        return GetAllUsersUseCase(_user_repository=user_repository)
+        return GetAllUsersUseCase(
+            _user_repository=SQLAlchemyUserRepository(_session=read_session),
+            _admin_notifier=admin_notifier,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_users_by_telegram_id_use_case(
         self,
-        user_repository: BaseUserRepository,
+        read_session: ReadSession,
+        admin_notifier: AdminNotifier,
     ) -> GetUserByTelegramId:
-        return GetUserByTelegramId(_user_repository=user_repository)
+        return GetUserByTelegramId(
+            _user_repository=SQLAlchemyUserRepository(_session=read_session),
+            _admin_notifier=admin_notifier,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_delete_user_use_case(
         self,
         user_repository: BaseUserRepository,
+        user_cache: BaseUserCacheService,
+        admin_notifier: AdminNotifier,
+        session: AsyncSession,
+        replica_router: ReadReplicaRouter,
     ) -> DeleteUserUseCase:
-        return DeleteUserUseCase(_user_repository=user_repository)
+        return DeleteUserUseCase(
+            _user_repository=user_repository,
+            _user_cache=user_cache,
+            _admin_notifier=admin_notifier,
+            _session=session,
+            _replica_router=replica_router,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_update_user_role_use_case(
         self,
         user_repository: BaseUserRepository,
+        user_cache: BaseUserCacheService,
+        admin_notifier: AdminNotifier,
+        session: AsyncSession,
+        replica_router: ReadReplicaRouter,
     ) -> UpdateUserRoleUseCase:
-        return UpdateUserRoleUseCase(_user_repository=user_repository)
+        return UpdateUserRoleUseCase(
+            _user_repository=user_repository,
+            _user_cache=user_cache,
+            _admin_notifier=admin_notifier,
+            _session=session,
+            _replica_router=replica_router,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_block_user_use_case(
         self,
         user_repository: BaseUserRepository,
         blocked_user_repository: BaseBlockedUserRepository,
+        user_cache: BaseUserCacheService,
+        admin_notifier: AdminNotifier,
+        session: AsyncSession,
+        replica_router: ReadReplicaRouter,
     ) -> BlockUserUseCase:
         return BlockUserUseCase(
             _user_repository=user_repository,
             _blocked_user_repository=blocked_user_repository,
+            _user_cache=user_cache,
+            _admin_notifier=admin_notifier,
+            _session=session,
+            _replica_router=replica_router,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -200,74 +315,127 @@ class AppProvider(Provider):
         self,
         user_repository: BaseUserRepository,
         blocked_user_repository: BaseBlockedUserRepository,
+        user_cache: BaseUserCacheService,
+        admin_notifier: AdminNotifier,
+        session: AsyncSession,
+        replica_router: ReadReplicaRouter,
     ) -> UnblockUserUseCase:
         return UnblockUserUseCase(
             _user_repository=user_repository,
             _blocked_user_repository=blocked_user_repository,
+            _user_cache=user_cache,
+            _admin_notifier=admin_notifier,
+            _session=session,
+            _replica_router=replica_router,
         )
 
     @provide(scope=Scope.REQUEST)
     def get_create_bot_use_case(
         self,
         bot_repository: BaseBotRepository,
+        bot_catalog: BotCatalogService,
+        admin_notifier: AdminNotifier,
     ) -> CreateNewBotUseCase:
-        return CreateNewBotUseCase(_bot_repository=bot_repository)
+        return CreateNewBotUseCase(
+            _bot_repository=bot_repository,
+            _bot_catalog=bot_catalog,
+            _admin_notifier=admin_notifier,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_all_bots_use_case(
         self,
-        bot_repository: BaseBotRepository,
+        bot_catalog: BotCatalogService,
     ) -> GetAllBotsUseCase:
-        return GetAllBotsUseCase(_bot_repository=bot_repository)
+        return GetAllBotsUseCase(_bot_catalog=bot_catalog)
 
     @provide(scope=Scope.REQUEST)
     def get_all_bots_with_rentals(
         self,
-        bot_repository: BaseBotRepository,
+        read_session: ReadSession,
     ) -> GetAllBotsWithRentalsUseCase:
-        return GetAllBotsWithRentalsUseCase(_bot_repository=bot_repository)
+        return GetAllBotsWithRentalsUseCase(
+            _bot_repository=SQLAlchemyBotRepository(_session=read_session)
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_bot_rentals_use_case(
+        self,
+        read_session: ReadSession,
+    ) -> GetBotRentalsUseCase:
+        return GetBotRentalsUseCase(
+            _bot_repository=SQLAlchemyBotRepository(_session=read_session)
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_delete_bot_use_case(
         self,
         bot_repository: BaseBotRepository,
+        bot_catalog: BotCatalogService,
+        admin_notifier: AdminNotifier,
     ) -> DeleteBotUseCase:
-        return DeleteBotUseCase(_bot_repository=bot_repository)
+        return DeleteBotUseCase(
+            _bot_repository=bot_repository,
+            _bot_catalog=bot_catalog,
+            _admin_notifier=admin_notifier,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_update_bot_use_case(
         self,
         bot_repository: BaseBotRepository,
+        bot_catalog: BotCatalogService,
+        admin_notifier: AdminNotifier,
     ) -> UpdateBotUseCase:
-        return UpdateBotUseCase(_bot_repository=bot_repository)
+        return UpdateBotUseCase(
+            _bot_repository=bot_repository,
+            _bot_catalog=bot_catalog,
+            _admin_notifier=admin_notifier,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_activate_bot_use_case(
         self,
         bot_repository: BaseBotRepository,
+        bot_catalog: BotCatalogService,
+        admin_notifier: AdminNotifier,
     ) -> ActivateBotUseCase:
-        return ActivateBotUseCase(_bot_repository=bot_repository)
+        return ActivateBotUseCase(
+            _bot_repository=bot_repository,
+            _bot_catalog=bot_catalog,
+            _admin_notifier=admin_notifier,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_deactivate_bot_use_case(
         self,
         bot_repository: BaseBotRepository,
+        bot_catalog: BotCatalogService,
+        admin_notifier: AdminNotifier,
     ) -> DeactivateBotUseCase:
-        return DeactivateBotUseCase(_bot_repository=bot_repository)
+        return DeactivateBotUseCase(
+            _bot_repository=bot_repository,
+            _bot_catalog=bot_catalog,
+            _admin_notifier=admin_notifier,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_all_referrals_use_case(
         self,
-        referral_repository: BaseReferralRepository,
+        read_session: ReadSession,
     ) -> GetUserReferralsUseCase:
-        return GetUserReferralsUseCase(_referral_repository=referral_repository)
+        return GetUserReferralsUseCase(
+            _referral_repository=SQLAlchemyReferralRepository(_session=read_session)
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_all_rentals_use_case(
         self,
-        rental_repository: BaseRentalRepository,
+        read_session: ReadSession,
     ) -> GetUserRentalsUseCase:
-        return GetUserRentalsUseCase(_rental_repository=rental_repository)
+        return GetUserRentalsUseCase(
+            _rental_repository=SQLAlchemyRentalRepository(_session=read_session)
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_rent_bot_use_case(
@@ -275,15 +443,19 @@ class AppProvider(Provider):
         bot_repository: BaseBotRepository,
         user_repository: BaseUserRepository,
         bot_rental_repository: BaseRentalRepository,
-        cache_service: BaseCacheService,
+        user_cache: BaseUserCacheService,
+        rental_events: RentalEventScheduler,
         session: AsyncSession,
+        replica_router: ReadReplicaRouter,
     ) -> RentBotUseCase:
         return RentBotUseCase(
             _bot_repository=bot_repository,
             _user_repository=user_repository,
             _bot_rental_repository=bot_rental_repository,
-            _cache_service=cache_service,
+            _user_cache=user_cache,
+            _rental_events=rental_events,
             _session=session,
+            _replica_router=replica_router,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -291,10 +463,12 @@ class AppProvider(Provider):
         self,
         rent_repository: BaseRentalRepository,
         session: AsyncSession,
+        replica_router: ReadReplicaRouter,
     ) -> StopBotRentalUseCase:
         return StopBotRentalUseCase(
             _rental_repository=rent_repository,
             _session=session,
+            _replica_router=replica_router,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -302,31 +476,133 @@ class AppProvider(Provider):
         self,
         rent_repository: BaseRentalRepository,
         session: AsyncSession,
+        replica_router: ReadReplicaRouter,
     ) -> StartBotRentalUseCase:
         return StartBotRentalUseCase(
             _rental_repository=rent_repository,
             _session=session,
+            _replica_router=replica_router,
         )
 
     @provide(scope=Scope.REQUEST)
     def get_deposit_money_for_user_use_case(
         self,
         user_repository: BaseUserRepository,
+        user_cache: BaseUserCacheService,
         session: AsyncSession,
+        admin_notifier: AdminNotifier,
+        replica_router: ReadReplicaRouter,
     ) -> DepositMoneyForUser:
         return DepositMoneyForUser(
             _session=session,
             _user_repository=user_repository,
+            _user_cache=user_cache,
+            _admin_notifier=admin_notifier,
+            _replica_router=replica_router,
         )
 
-    # SERVICES
     @provide(scope=Scope.REQUEST)
-    def get_cache_service(
+    def get_withdraw_money_for_user_use_case(
+        self,
+        user_repository: BaseUserRepository,
+        user_cache: BaseUserCacheService,
+        session: AsyncSession,
+        admin_notifier: AdminNotifier,
+        replica_router: ReadReplicaRouter,
+    ) -> WithdrawMoneyForUser:
+        return WithdrawMoneyForUser(
+            _session=session,
+            _user_repository=user_repository,
+            _user_cache=user_cache,
+            _admin_notifier=admin_notifier,
+            _replica_router=replica_router,
+        )
+
+    # SERVICES
+    @provide(scope=Scope.APP)
+    async def get_cache_service(
+        self,
+        config: Config,
+    ) -> AsyncIterable[BaseCacheService]:
+        cache_service = RedisCacheService(pool=new_redis_pool(config.redis))
+        yield cache_service
+        await cache_service.close()
+
+    @provide(scope=Scope.APP)
+    async def get_user_cache_service(
+        self,
+        cache_service: BaseCacheService,
+    ) -> AsyncIterable[BaseUserCacheService]:
+        user_cache = TwoTierUserCacheService(_cache_service=cache_service)
+        await user_cache.start()
+        yield user_cache
+        await user_cache.close()
+
+    @provide(scope=Scope.APP)
+    def get_rate_limiter(
+        self,
+        cache_service: BaseCacheService,
+    ) -> BaseRateLimiter:
+        return RedisSlidingWindowRateLimiter(_cache_service=cache_service)
+
+    @provide(scope=Scope.APP)
+    def get_idempotency_store(
+        self,
+        cache_service: BaseCacheService,
+    ) -> BaseIdempotencyStore:
+        return RedisIdempotencyStore(_cache_service=cache_service)
+
+    @provide(scope=Scope.APP)
+    def get_audit_event_repository(
+        self,
+        cache_service: BaseCacheService,
+    ) -> BaseAuditEventRepository:
+        return RedisAuditEventRepository(_cache_service=cache_service)
+
+    @provide(scope=Scope.APP)
+    def get_admin_notifier(
         self,
-    ) -> BaseCacheService:
-        return RedisCacheService()
+        config: Config,
+        audit_repository: BaseAuditEventRepository,
+    ) -> AdminNotifier:
+        return AdminNotifierImpl(
+            _audit_repository=audit_repository,
+            _window_seconds=config.admin_digest.window_seconds,
+            _max_events=config.admin_digest.max_events,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_rental_event_scheduler(self) -> RentalEventScheduler:
+        return RentalEventSchedulerImpl()
+
+    @provide(scope=Scope.APP)
+    def get_bot_catalog_cache(
+        self,
+        cache_service: BaseCacheService,
+    ) -> BaseBotCatalogCache:
+        return TwoTierBotCatalogCache(_cache_service=cache_service)
 
     @provide(scope=Scope.REQUEST)
+    def get_bot_catalog_service(
+        self,
+        bot_repository: BaseBotRepository,
+        catalog_cache: BaseBotCatalogCache,
+    ) -> BotCatalogService:
+        return BotCatalogServiceImpl(
+            _bot_repository=bot_repository, _catalog_cache=catalog_cache
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_system_metrics_sampler(
+        self,
+        config: Config,
+    ) -> AsyncIterable[SystemMetricsSampler]:
+        sampler = SystemMetricsSampler.from_config(config.monitoring)
+        await sampler.start()
+        yield sampler
+        await sampler.close()
+
+    @provide(scope=Scope.APP)
     def get_jwt_service(
         self,
         config: Config,
@@ -354,12 +630,12 @@ class AppProvider(Provider):
         self,
         user_repository: BaseUserRepository,
         jwt_service: JWTService,
-        cache_service: BaseCacheService,
+        user_cache: BaseUserCacheService,
     ) -> BaseAuthService:
         return AuthServiceImpl(
             _user_repository=user_repository,
             _jwt_service=jwt_service,
-            _cache_service=cache_service,
+            _user_cache=user_cache,
         )
 
     # current user
@@ -375,13 +651,26 @@ class AppProvider(Provider):
         self,
         auth_service: BaseAuthService,
         access_token: AccessTokenReponse,
-    ) -> UserEntity:
+    ) -> UserPrincipal:
         if not access_token:
             return None
 
-        user: UserEntity | None = await auth_service.get_current_user(
+        user: UserPrincipal | None = await auth_service.get_current_user(
             token=access_token.token
         )
         if not user:
             return None
         return user
+
+    @provide(scope=Scope.REQUEST)
+    async def get_current_user_aggregate(
+        self,
+        principal: UserPrincipal,
+        user_repository: BaseUserRepository,
+    ) -> UserEntity:
+        user: UserEntity | None = await user_repository.get_user_by_telegram_id(
+            telegram_id=principal.telegram_id.to_raw()
+        )
+        if not user:
+            raise UserNotFoundException()
+        return user
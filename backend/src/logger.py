@@ -1,14 +1,134 @@
+import atexit
 import logging
+import queue
+import random
+import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from os import environ as env
 
+import orjson
+from src.config import LoggingConfig
+
+# Стандартные атрибуты LogRecord: все остальное пришло через extra=
+# и попадает в JSON отдельными полями.
+RESERVED_RECORD_ATTRS: frozenset[str] = frozenset(
+    logging.LogRecord('', 0, '', 0, '', None, None).__dict__
+) | {'message', 'asctime', 'taskName'}
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict = {
+            'ts': datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_RECORD_ATTRS:
+                payload[key] = value
+
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload['stack_info'] = self.formatStack(record.stack_info)
+
+        return orjson.dumps(payload, default=str).decode()
+
+
+class SamplingFilter(logging.Filter):
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        # Более длинный префикс точнее, поэтому проверяется первым.
+        self._rates: list[tuple[str, float]] = sorted(
+            rates.items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+
+        for prefix, rate in self._rates:
+            if record.name == prefix or record.name.startswith(f'{prefix}.'):
+                return random.random() < rate
+
+        return True
+
+
+class LazyQueueHandler(QueueHandler):
+    # Стандартный QueueHandler форматирует сообщение в вызывающем потоке.
+    # Здесь форматирование и сериализация выполняются в потоке QueueListener,
+    # поэтому в args стоит передавать готовые значения, а не изменяемые объекты.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def parse_sampling(raw: str) -> dict[str, float]:
+    rates: dict[str, float] = {}
+
+    for item in raw.split(','):
+        if not item.strip():
+            continue
+        name, _, rate = item.partition('=')
+        rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+
+    return rates
+
+
+def setup_logger(
+    config: LoggingConfig | None = None, error_log_path: str | None = None
+) -> logging.Logger:
+    global _listener, _queue_handler
 
-def setup_logger():
     logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
+    if _listener is not None:
+        return logger
 
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(
-        logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    config = config or LoggingConfig(**env)
+    formatter: logging.Formatter = (
+        JsonFormatter()
+        if config.format == 'json'
+        else logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     )
 
-    logger.addHandler(console_handler)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [console_handler]
+
+    if error_log_path:
+        file_handler = logging.FileHandler(error_log_path, encoding='utf-8')
+        file_handler.setLevel(logging.ERROR)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = LazyQueueHandler(log_queue)
+    _queue_handler.addFilter(SamplingFilter(parse_sampling(config.sampling)))
+
+    logger.setLevel(config.level)
+    logger.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logger)
     return logger
+
+
+def shutdown_logger() -> None:
+    global _listener, _queue_handler
+
+    if _listener is None:
+        return
+
+    logging.getLogger().removeHandler(_queue_handler)
+    # stop() дожидается, пока поток выведет все записи из очереди.
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    _queue_handler = None
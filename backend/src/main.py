@@ -1,30 +1,40 @@
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
 from dishka import AsyncContainer, make_async_container
 from dishka.integrations import fastapi as fastapi_integration
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from prometheus_fastapi_instrumentator import Instrumentator
 from src.config import Config
 from src.domain.common.exception import DomainErrorException
-from src.infrastructure.taskiq.broker import broker
+from src.domain.user.exception import TooManyRequestsException
+from src.infrastructure.database.instrumentation import (
+    DB_QUERIES_PER_REQUEST,
+    count_queries,
+)
+from src.infrastructure.monitoring.sampler import SystemMetricsSampler
+from src.infrastructure.taskiq.broker import shutdown_brokers, startup_brokers
 from src.ioc import AppProvider
-from src.logger import setup_logger
+from src.logger import setup_logger, shutdown_logger
 from src.presentation.controllers.v1.setup_routers import setup_controllers
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     setup_logger()
-    await broker.startup()
+    await startup_brokers()
+    await app.state.dishka_container.get(SystemMetricsSampler)
     logger.info('Приложение запущено')
     yield
-    await broker.shutdown()
+    await shutdown_brokers()
+    await app.state.dishka_container.close()
     logger.info('Приложение выключено')
+    shutdown_logger()
 
 
 def create_app() -> FastAPI:
@@ -53,13 +63,31 @@ def create_app() -> FastAPI:
     setup_controllers(app=app)
     fastapi_integration.setup_dishka(container=container, app=app)
 
+    @app.middleware('http')
+    async def count_db_queries(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        with count_queries() as counter:
+            response = await call_next(request)
+
+        route = request.scope.get('route')
+        DB_QUERIES_PER_REQUEST.labels(handler=route.path if route else 'none').observe(
+            counter.count
+        )
+        return response
+
     @app.exception_handler(DomainErrorException)
     async def domain_error_exception_handler(
         request: Request, exc: DomainErrorException
-    ):
+    ) -> JSONResponse:
+        headers: dict[str, str] | None = None
+        if isinstance(exc, TooManyRequestsException):
+            headers = {'Retry-After': str(exc.retry_after)}
+
         return JSONResponse(
             status_code=getattr(exc, 'status_code', exc.status_code),
             content={'detail': exc.message},
+            headers=headers,
         )
 
     return app
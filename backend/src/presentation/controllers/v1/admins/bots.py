@@ -1,6 +1,8 @@
+from typing import Annotated
+
 from dishka.integrations.fastapi import FromDishka as Depends
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 from src.application.use_cases.admin.bot.change_status_bot import (
     ActivateBotUseCase,
     DeactivateBotUseCase,
@@ -9,14 +11,19 @@ from src.application.use_cases.admin.bot.create_bot import CreateNewBotUseCase
 from src.application.use_cases.admin.bot.delete_bot import DeleteBotUseCase
 from src.application.use_cases.admin.bot.get_all_bots_with_rentals import (
     GetAllBotsWithRentalsUseCase,
+    GetBotRentalsUseCase,
 )
 from src.application.use_cases.admin.bot.update_bot import UpdateBotUseCase
+from src.domain.bot.admin_view import BotRentalPage, BotWithRentals
 from src.domain.bot.entity import BotEntity
-from src.domain.user.entity import UserEntity
+from src.domain.user.principal import UserPrincipal
 from src.presentation.decorators.check_role import check_role
 from src.presentation.schemas.bot import (
     BotAdminOutSchema,
     BotOutSchema,
+    BotRentalPageSchema,
+    BotRentalsQuerySchema,
+    BotWithRentalsOutSchema,
     CreateBotSchema,
     UpdateBotSchema,
 )
@@ -48,7 +55,7 @@ router: APIRouter = APIRouter()
 @check_role(allowed_roles=['dev', 'admin'])
 async def create_bot(
     new_bot: CreateBotSchema,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[CreateNewBotUseCase],
 ) -> BotOutSchema:
     bot: BotEntity = await use_case.execute(bot=new_bot, admin=user)
@@ -57,10 +64,10 @@ async def create_bot(
 
 @router.get(
     '/rentals',
-    description='Эндпоинт для получения арендодателей бота',
+    description='Эндпоинт для получения ботов с первыми арендами каждого бота',
     status_code=status.HTTP_200_OK,
     responses={
-        status.HTTP_200_OK: {'model': list[BotAdminOutSchema]},
+        status.HTTP_200_OK: {'model': list[BotWithRentalsOutSchema]},
         status.HTTP_403_FORBIDDEN: {
             'description': 'User does not have permission to perform this action',
             'model': ErrorSchema,
@@ -70,11 +77,38 @@ async def create_bot(
 @inject
 @check_role(allowed_roles=['dev', 'admin'])
 async def get_all_bots_with_rentals(
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[GetAllBotsWithRentalsUseCase],
-) -> list[BotAdminOutSchema] | None:
-    result: list[BotEntity] | None = await use_case.execute()
-    return [BotAdminOutSchema.model_validate(bot.to_dict()) for bot in result]
+    rentals_limit: Annotated[int, Query(ge=1, le=200)] = 20,
+) -> list[BotWithRentalsOutSchema]:
+    bots: list[BotWithRentals] = await use_case.execute(rentals_limit=rentals_limit)
+    return [BotWithRentalsOutSchema.model_validate(bot) for bot in bots]
+
+
+@router.get(
+    '/{bot_id}/rentals',
+    description='Эндпоинт для получения аренд бота постранично',
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {'model': BotRentalPageSchema},
+        status.HTTP_403_FORBIDDEN: {
+            'description': 'User does not have permission to perform this action',
+            'model': ErrorSchema,
+        },
+    },
+)
+@inject
+@check_role(allowed_roles=['dev', 'admin'])
+async def get_bot_rentals(
+    bot_id: int,
+    query: Annotated[BotRentalsQuerySchema, Query()],
+    user: Depends[UserPrincipal],
+    use_case: Depends[GetBotRentalsUseCase],
+) -> BotRentalPageSchema:
+    page: BotRentalPage = await use_case.execute(
+        bot_id=bot_id, limit=query.limit, cursor=query.cursor
+    )
+    return BotRentalPageSchema.model_validate(page)
 
 
 @router.patch(
@@ -101,7 +135,7 @@ async def get_all_bots_with_rentals(
 async def update_bot(
     bot_id: int,
     update_schema: UpdateBotSchema,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[UpdateBotUseCase],
 ) -> BotAdminOutSchema:
     updated_bot: BotEntity = await use_case.execute(
@@ -134,7 +168,7 @@ async def update_bot(
 @check_role(allowed_roles=['dev', 'admin'])
 async def delete_bot(
     bot_id: int,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[DeleteBotUseCase],
 ) -> None:
     await use_case.execute(bot_id=bot_id, admin=user)
@@ -167,7 +201,7 @@ async def delete_bot(
 @check_role(allowed_roles=['dev', 'admin'])
 async def activate_bot(
     bot_id: int,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[ActivateBotUseCase],
 ) -> BotAdminOutSchema:
     bot: BotEntity = await use_case.execute(bot_id=bot_id, admin=user)
@@ -201,7 +235,7 @@ async def activate_bot(
 @check_role(allowed_roles=['dev', 'admin'])
 async def deactivate_bot(
     bot_id: int,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[DeactivateBotUseCase],
 ) -> BotAdminOutSchema:
     bot: BotEntity = await use_case.execute(bot_id=bot_id, admin=user)
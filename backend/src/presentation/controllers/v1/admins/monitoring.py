@@ -1,11 +1,15 @@
-import psutil
+from datetime import UTC, datetime
+
 from dishka.integrations.fastapi import FromDishka as Depends
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, status
-from src.const import MB
-from src.domain.user.entity import UserEntity
+from fastapi import APIRouter, HTTPException, status
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.monitoring.sampler import SystemMetricsSampler, SystemSample
 from src.presentation.decorators.check_role import check_role
-from src.presentation.schemas.monitoring import MonitoringOutSchema
+from src.presentation.schemas.monitoring import (
+    MonitoringOutSchema,
+    MonitoringWindowSchema,
+)
 
 router: APIRouter = APIRouter()
 
@@ -18,18 +22,32 @@ router: APIRouter = APIRouter()
 @inject
 @check_role(allowed_roles=['admin'])
 async def get_system_stats(
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
+    sampler: Depends[SystemMetricsSampler],
 ) -> MonitoringOutSchema:
-    cpu_percent = psutil.cpu_percent(interval=1)
-    memory = psutil.virtual_memory()
-    disk = psutil.disk_usage('/')
+    sample: SystemSample | None = sampler.latest()
+
+    if sample is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Метрики сервера еще не собраны',
+        )
 
     return MonitoringOutSchema(
-        cpu_usage_percent=cpu_percent,
-        memory_total_mb=round(memory.total / MB, 2),
-        memory_used_mb=round(memory.used / MB, 2),
-        memory_percent=memory.percent,
-        disk_total_mb=round(disk.total / MB, 2),
-        disk_used_mb=round(disk.used / MB, 2),
-        disk_percent=disk.percent,
+        cpu_usage_percent=sample.cpu_percent,
+        memory_total_mb=sample.memory_total_mb,
+        memory_used_mb=sample.memory_used_mb,
+        memory_percent=sample.memory_percent,
+        disk_total_mb=sample.disk_total_mb,
+        disk_used_mb=sample.disk_used_mb,
+        disk_percent=sample.disk_percent,
+        event_loop_lag_ms=sample.loop_lag_ms,
+        process_rss_mb=sample.process_rss_mb,
+        process_cpu_percent=sample.process_cpu_percent,
+        process_threads=sample.process_threads,
+        sampled_at=datetime.fromtimestamp(sample.timestamp, tz=UTC),
+        windows={
+            name: MonitoringWindowSchema.model_validate(summary)
+            for name, summary in sampler.summaries().items()
+        },
     )
@@ -1,6 +1,8 @@
+from typing import Annotated
+
 from dishka.integrations.fastapi import FromDishka as Depends
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, Request, status
 from src.application.use_cases.admin.users.block_user import BlockUserUseCase
 from src.application.use_cases.admin.users.delete_user import DeleteUserUseCase
 from src.application.use_cases.admin.users.deposit_money import DepositMoneyForUser
@@ -13,7 +15,11 @@ from src.application.use_cases.admin.users.update_role import UpdateUserRoleUseC
 from src.application.use_cases.admin.users.withdraw_money import WithdrawMoneyForUser
 from src.domain.user.blocked_user import BlockedUserEntity
 from src.domain.user.entity import UserEntity
+from src.domain.user.listing import UserPage
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseIdempotencyStore
 from src.presentation.decorators.check_role import check_role
+from src.presentation.decorators.idempotent import idempotent
 from src.presentation.schemas.error import ErrorSchema
 from src.presentation.schemas.success import SuccessResponse
 from src.presentation.schemas.user import (
@@ -22,6 +28,8 @@ from src.presentation.schemas.user import (
     UpdateUserRole,
     UserAdminViewSchema,
     UserBlockSchema,
+    UserListQuerySchema,
+    UserPageSchema,
 )
 
 router: APIRouter = APIRouter()
@@ -29,10 +37,10 @@ router: APIRouter = APIRouter()
 
 @router.get(
     '',
-    description='Эндпоинт для получения всех пользователей',
+    description='Эндпоинт для получения пользователей постранично',
     status_code=status.HTTP_200_OK,
     responses={
-        status.HTTP_200_OK: {'model': list[UserAdminViewSchema]},
+        status.HTTP_200_OK: {'model': UserPageSchema},
         status.HTTP_403_FORBIDDEN: {
             'description': 'User does not have permission to perform this action',
             'model': ErrorSchema,
@@ -42,11 +50,19 @@ router: APIRouter = APIRouter()
 @inject
 @check_role(allowed_roles=['admin', 'dev'])
 async def get_all_users(
+    query: Annotated[UserListQuerySchema, Query()],
     use_case: Depends[GetAllUsersUseCase],
-    user: Depends[UserEntity],
-) -> list[UserAdminViewSchema] | None:
-    users: list[UserEntity] = await use_case.execute(admin=user)
-    return [UserAdminViewSchema.model_validate(user.to_dict()) for user in users]
+    user: Depends[UserPrincipal],
+) -> UserPageSchema:
+    page: UserPage = await use_case.execute(
+        admin=user,
+        filters=query.to_filter(),
+        limit=query.limit,
+        cursor=query.cursor,
+        with_count=query.with_count,
+        relations=frozenset(query.include),
+    )
+    return UserPageSchema.model_validate(page)
 
 
 @router.get(
@@ -69,7 +85,7 @@ async def get_all_users(
 @check_role(allowed_roles=['admin', 'dev'])
 async def get_user_by_id(
     telegram_id: int,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[GetUserByTelegramId],
 ) -> UserAdminViewSchema | None:
     user: UserEntity | None = await use_case.execute(
@@ -100,7 +116,7 @@ async def get_user_by_id(
 @check_role(allowed_roles=['dev'])
 async def delete_user(
     telegram_id: int,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[DeleteUserUseCase],
 ) -> None:
     await use_case.execute(telegram_id=telegram_id, admin=user)
@@ -130,7 +146,7 @@ async def delete_user(
 async def update_user_role(
     telegram_id: int,
     new_role: UpdateUserRole,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[UpdateUserRoleUseCase],
 ) -> UserAdminViewSchema:
     user: UserEntity = await use_case.execute(
@@ -167,7 +183,7 @@ async def update_user_role(
 async def block_user(
     telegram_id: int,
     block_schema: UserBlockSchema,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[BlockUserUseCase],
 ) -> BlockedUserOutSchema:
     block: BlockedUserEntity = await use_case.execute(
@@ -199,7 +215,7 @@ async def block_user(
 @check_role(allowed_roles=['dev', 'admin'])
 async def unblock_user(
     telegram_id: int,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[UnblockUserUseCase],
 ) -> SuccessResponse:
     await use_case.execute(telegram_id=telegram_id, admin=user)
@@ -213,11 +229,18 @@ async def unblock_user(
 )
 @inject
 @check_role(allowed_roles=['dev', 'admin'])
+@idempotent(
+    scope='deposit',
+    response_model=SuccessResponse,
+    payload_params=('telegram_id', 'schema'),
+)
 async def deposit_money_for_user(
+    request: Request,
     telegram_id: int,
     schema: UpdateBalance,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[DepositMoneyForUser],
+    idempotency_store: Depends[BaseIdempotencyStore],
 ) -> SuccessResponse:
     await use_case.execute(telegram_id=telegram_id, admin=user, schema=schema)
     return SuccessResponse(message='Баланс пользователя изменен.')
@@ -230,11 +253,18 @@ async def deposit_money_for_user(
 )
 @inject
 @check_role(allowed_roles=['dev', 'admin'])
+@idempotent(
+    scope='withdraw',
+    response_model=SuccessResponse,
+    payload_params=('telegram_id', 'schema'),
+)
 async def withdraw_money_for_user(
+    request: Request,
     telegram_id: int,
     schema: UpdateBalance,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[WithdrawMoneyForUser],
+    idempotency_store: Depends[BaseIdempotencyStore],
 ) -> SuccessResponse:
     await use_case.execute(telegram_id=telegram_id, admin=user, schema=schema)
     return SuccessResponse(message='Баланс пользователя изменен.')
@@ -9,6 +9,8 @@ from src.application.use_cases.user.auth import (
     SendCodeUseCase,
     VerifyCodeUseCase,
 )
+from src.infrastructure.cache.base import BaseRateLimiter, RateLimit
+from src.presentation.decorators.rate_limit import rate_limit
 from src.presentation.schemas.error import ErrorSchema
 from src.presentation.schemas.success import SuccessResponse
 from src.presentation.schemas.user import CheckCodeSchema, SendCodeSchema, UserOutSchema
@@ -16,6 +18,12 @@ from src.presentation.schemas.user import CheckCodeSchema, SendCodeSchema, UserO
 logger = logging.getLogger(__name__)
 router: APIRouter = APIRouter()
 
+SEND_CODE_PER_IP: RateLimit = RateLimit(limit=10, window_seconds=600)
+SEND_CODE_PER_TELEGRAM_ID: RateLimit = RateLimit(limit=3, window_seconds=600)
+VERIFY_CODE_PER_IP: RateLimit = RateLimit(limit=30, window_seconds=300)
+VERIFY_CODE_PER_TELEGRAM_ID: RateLimit = RateLimit(limit=5, window_seconds=300)
+REFRESH_TOKEN_PER_IP: RateLimit = RateLimit(limit=30, window_seconds=60)
+
 
 @router.post(
     '/send-code',
@@ -34,9 +42,17 @@ router: APIRouter = APIRouter()
     },
 )
 @inject
+@rate_limit(
+    scope='send-code',
+    per_ip=SEND_CODE_PER_IP,
+    per_telegram_id=SEND_CODE_PER_TELEGRAM_ID,
+    telegram_id_from='user_schema',
+)
 async def send_code(
+    request: Request,
     user_schema: SendCodeSchema,
     use_case: Depends[SendCodeUseCase],
+    rate_limiter: Depends[BaseRateLimiter],
 ) -> SuccessResponse:
     await use_case.execute(
         telegram_id=user_schema.telegram_id, ref_id=user_schema.ref_id
@@ -54,12 +70,24 @@ async def send_code(
             'model': ErrorSchema,
             'description': 'Invalid code',
         },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            'model': ErrorSchema,
+            'description': 'Too many attempts',
+        },
     },
 )
 @inject
+@rate_limit(
+    scope='verify-code',
+    per_ip=VERIFY_CODE_PER_IP,
+    per_telegram_id=VERIFY_CODE_PER_TELEGRAM_ID,
+    telegram_id_from='code_schema',
+)
 async def verify_code(
+    request: Request,
     code_schema: CheckCodeSchema,
     use_case: Depends[VerifyCodeUseCase],
+    rate_limiter: Depends[BaseRateLimiter],
     response: Response,
 ) -> UserOutSchema:
     user, access_token, refresh_token = await use_case.execute(schema=code_schema)
@@ -86,13 +114,19 @@ async def verify_code(
             'model': ErrorSchema,
             'description': 'Refresh token отсутствует или недействителен',
         },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            'model': ErrorSchema,
+            'description': 'Too many requests',
+        },
     },
 )
 @inject
+@rate_limit(scope='refresh-token', per_ip=REFRESH_TOKEN_PER_IP)
 async def refresh_token(
     response: Response,
     request: Request,
     use_case: Depends[RefreshTokenUseCase],
+    rate_limiter: Depends[BaseRateLimiter],
 ) -> SuccessResponse:
     token: str | None = request.cookies.get('refresh_token')
     if token is None:
@@ -1,22 +1,45 @@
 from dishka.integrations.fastapi import FromDishka as Depends
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 from src.application.use_cases.user.bot.get_all_bots import GetAllBotsUseCase
-from src.domain.user.entity import UserEntity
+from src.domain.bot.catalog import BotCatalog
+from src.domain.user.principal import UserPrincipal
 from src.presentation.schemas.bot import BotOutSchema
 
 router: APIRouter = APIRouter()
 
 
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    candidates: list[str] = [
+        candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')
+    ]
+    return '*' in candidates or etag in candidates
+
+
 @router.get(
     '',
     description='Эндпоинт для получения всех ботов',
     status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {'model': list[BotOutSchema]},
+        status.HTTP_304_NOT_MODIFIED: {'description': 'Каталог не изменился'},
+    },
 )
 @inject
 async def get_all_bots(
-    user: Depends[UserEntity],
+    request: Request,
+    user: Depends[UserPrincipal],
     use_case: Depends[GetAllBotsUseCase],
-) -> list[BotOutSchema] | None:
-    res = await use_case.execute()
-    return [BotOutSchema.model_validate(bot.to_dict()) for bot in res]
+) -> Response:
+    catalog: BotCatalog = await use_case.execute()
+    headers: dict[str, str] = {'ETag': catalog.etag, 'Cache-Control': 'no-cache'}
+
+    if etag_matches(request.headers.get('if-none-match'), catalog.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=catalog.body, media_type='application/json', headers=headers
+    )
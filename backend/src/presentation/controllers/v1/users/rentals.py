@@ -1,11 +1,13 @@
 from dishka.integrations.fastapi import FromDishka as Depends
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from src.application.use_cases.user.bot.rent_bot import RentBotUseCase
 from src.application.use_cases.user.bot.start_bot import StartBotRentalUseCase
 from src.application.use_cases.user.bot.stop_bot import StopBotRentalUseCase
 from src.domain.bot.entity import BotRentalEntity
-from src.domain.user.entity import UserEntity
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import BaseIdempotencyStore
+from src.presentation.decorators.idempotent import idempotent
 from src.presentation.schemas.bot import BotRentalOutSchema, CreateBotRentSchema
 from src.presentation.schemas.error import ErrorSchema
 from src.presentation.schemas.success import SuccessResponse
@@ -38,14 +40,21 @@ router: APIRouter = APIRouter()
     },
 )
 @inject
+@idempotent(
+    scope='rent',
+    response_model=BotRentalOutSchema,
+    payload_params=('bot_id', 'new_rent'),
+)
 async def rent_bot(
+    request: Request,
     bot_id: int,
     new_rent: CreateBotRentSchema,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[RentBotUseCase],
+    idempotency_store: Depends[BaseIdempotencyStore],
 ) -> BotRentalOutSchema:
     res: BotRentalEntity = await use_case.execute(
-        bot_id=bot_id, user=user, schema=new_rent
+        bot_id=bot_id, principal=user, schema=new_rent
     )
     return BotRentalOutSchema.model_validate(res)
 
@@ -77,7 +86,7 @@ async def rent_bot(
 @inject
 async def stop_active_rental(
     rental_id: int,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[StopBotRentalUseCase],
 ) -> SuccessResponse:
     await use_case.execute(rental_id=rental_id, user=user)
@@ -111,7 +120,7 @@ async def stop_active_rental(
 @inject
 async def start_active_rental(
     rental_id: int,
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[StartBotRentalUseCase],
 ) -> SuccessResponse:
     await use_case.execute(rental_id=rental_id, user=user)
@@ -6,6 +6,7 @@ from src.application.use_cases.user.get_user_rentals import GetUserRentalsUseCas
 from src.domain.bot.entity import BotRentalEntity
 from src.domain.referral.entity import ReferralEntity
 from src.domain.user.entity import UserEntity
+from src.domain.user.principal import UserPrincipal
 from src.presentation.schemas.error import ErrorSchema
 from src.presentation.schemas.user import (
     BlockedUserOutSchema,
@@ -78,7 +79,7 @@ async def get_my_block(
 )
 @inject
 async def get_my_referrals(
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[GetUserReferralsUseCase],
 ) -> list[ReferralOutSchema]:
     referrals: list[ReferralEntity] = await use_case.execute(referrer_id=user.id)
@@ -104,7 +105,7 @@ async def get_my_referrals(
 )
 @inject
 async def get_my_rentals(
-    user: Depends[UserEntity],
+    user: Depends[UserPrincipal],
     use_case: Depends[GetUserRentalsUseCase],
 ) -> list[BotRentalOutSchema]:
     rentals: list[BotRentalEntity] = await use_case.execute(user_id=user.id)
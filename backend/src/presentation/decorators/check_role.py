@@ -1,14 +1,14 @@
 from functools import wraps
 
-from src.domain.user.entity import UserEntity
 from src.domain.user.exception import PermissionDeniedException
+from src.domain.user.principal import UserPrincipal
 
 
 def check_role(allowed_roles: list[str]):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            user: UserEntity | None = kwargs.get('user')
+            user: UserPrincipal | None = kwargs.get('user')
 
             if not user or user.role not in allowed_roles:
                 raise PermissionDeniedException()
@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+import orjson
+from fastapi import Request
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from src.domain.common.exception import (
+    IdempotencyKeyReusedException,
+    RequestInProgressException,
+)
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.cache.base import (
+    BaseIdempotencyStore,
+    IdempotencyRecord,
+    IdempotencyStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec('P')
+T = TypeVar('T', bound=BaseModel)
+
+IDEMPOTENCY_HEADER: str = 'Idempotency-Key'
+MAX_IDEMPOTENCY_KEY_LENGTH: int = 128
+WAIT_INTERVAL_SECONDS: float = 0.05
+WAIT_TIMEOUT_SECONDS: float = 30.0
+COMPLETE_ATTEMPTS: int = 5
+COMPLETE_RETRY_SECONDS: float = 0.5
+
+
+def request_fingerprint(kwargs: dict, payload_params: tuple[str, ...]) -> str:
+    payload: dict = {
+        name: kwargs[name].model_dump(mode='json')
+        if isinstance(kwargs[name], BaseModel)
+        else kwargs[name]
+        for name in payload_params
+    }
+    return hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+
+async def save_response(store: BaseIdempotencyStore, key: str, response: str) -> None:
+    # Операция уже закоммичена. Пока ключ in_progress, повторы ждут, но по
+    # истечении блокировки ключ исчезнет и повтор выполнит операцию второй раз,
+    # поэтому результат дописываем с повторами, а не теряем на первой ошибке.
+    for attempt in range(1, COMPLETE_ATTEMPTS + 1):
+        try:
+            await store.complete(key, response)
+            return
+        except RedisError as e:
+            logger.warning(
+                'Не удалось сохранить результат %s (попытка %s): %s', key, attempt, e
+            )
+        if attempt < COMPLETE_ATTEMPTS:
+            await asyncio.sleep(COMPLETE_RETRY_SECONDS * attempt)
+
+    logger.error(
+        'Результат %s не сохранен: повтор с этим ключом после истечения '
+        'блокировки выполнит операцию заново',
+        key,
+    )
+
+
+def idempotent(
+    scope: str, response_model: type[BaseModel], payload_params: tuple[str, ...]
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    required: tuple[str, ...] = (
+        'request',
+        'user',
+        'idempotency_store',
+        *payload_params,
+    )
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        parameters = inspect.signature(func).parameters
+        missing: list[str] = [name for name in required if name not in parameters]
+        if missing:
+            raise TypeError(
+                f'@idempotent({scope!r}): у {func.__qualname__} нет параметров '
+                f'{", ".join(missing)}'
+            )
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            request: Request = kwargs['request']
+            idempotency_key: str | None = request.headers.get(IDEMPOTENCY_HEADER)
+
+            if not idempotency_key or len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+                return await func(*args, **kwargs)
+
+            store: BaseIdempotencyStore = kwargs['idempotency_store']
+            user: UserPrincipal = kwargs['user']
+            key: str = (
+                f'idempotency:{scope}:{user.telegram_id.to_raw()}:{idempotency_key}'
+            )
+            fingerprint: str = request_fingerprint(kwargs, payload_params)
+            deadline: float = time.monotonic() + WAIT_TIMEOUT_SECONDS
+
+            try:
+                # Повтор ждет первый запрос, а не выполняет операцию второй раз.
+                while True:
+                    record: IdempotencyRecord = await store.begin(key, fingerprint)
+
+                    if record.status == IdempotencyStatus.ACQUIRED:
+                        break
+                    if record.status == IdempotencyStatus.DONE:
+                        return response_model.model_validate_json(record.response)
+                    if record.status == IdempotencyStatus.MISMATCH:
+                        raise IdempotencyKeyReusedException()
+                    if time.monotonic() >= deadline:
+                        raise RequestInProgressException()
+
+                    await asyncio.sleep(WAIT_INTERVAL_SECONDS)
+            except RedisError as e:
+                logger.warning('Хранилище идемпотентности недоступно: %s', e)
+                return await func(*args, **kwargs)
+
+            try:
+                response: T = await func(*args, **kwargs)
+            except BaseException:
+                # Ошибку не кэшируем: операция не выполнена, повтор можно пустить.
+                await store.abandon(key)
+                raise
+
+            await save_response(store, key, response.model_dump_json())
+            return response
+
+        return wrapper
+
+    return decorator
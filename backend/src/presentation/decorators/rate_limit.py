@@ -0,0 +1,64 @@
+import inspect
+import math
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+from fastapi import Request
+from src.domain.user.exception import TooManyRequestsException
+from src.infrastructure.cache.base import BaseRateLimiter, RateLimit
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+
+def rate_limit(
+    scope: str,
+    per_ip: RateLimit | None = None,
+    per_telegram_id: RateLimit | None = None,
+    telegram_id_from: str | None = None,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    if (per_telegram_id is None) != (telegram_id_from is None):
+        raise TypeError(
+            f'@rate_limit({scope!r}): per_telegram_id и telegram_id_from '
+            'задаются вместе'
+        )
+
+    required: list[str] = ['request', 'rate_limiter']
+    if telegram_id_from is not None:
+        required.append(telegram_id_from)
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        # Проверяем при импорте, а не на первом запросе: иначе забытый параметр
+        # обернется KeyError и 500 уже в продакшене.
+        parameters = inspect.signature(func).parameters
+        missing: list[str] = [name for name in required if name not in parameters]
+        if missing:
+            raise TypeError(
+                f'@rate_limit({scope!r}): у {func.__qualname__} нет параметров '
+                f'{", ".join(missing)}'
+            )
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            request: Request = kwargs['request']
+            rate_limiter: BaseRateLimiter = kwargs['rate_limiter']
+            limits: list[tuple[str, RateLimit]] = []
+
+            if per_ip is not None:
+                client_ip: str = request.client.host if request.client else 'unknown'
+                limits.append((f'rate-limit:{scope}:ip:{client_ip}', per_ip))
+
+            if per_telegram_id is not None and telegram_id_from is not None:
+                telegram_id: int = kwargs[telegram_id_from].telegram_id
+                limits.append((f'rate-limit:{scope}:tg:{telegram_id}', per_telegram_id))
+
+            retry_after: float = await rate_limiter.hit(limits)
+            if retry_after > 0:
+                raise TooManyRequestsException(retry_after=math.ceil(retry_after))
+
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
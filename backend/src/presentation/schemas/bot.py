@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CreateBotSchema(BaseModel):
@@ -43,6 +43,22 @@ class BotAdminOutSchema(BotOutSchema):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BotWithRentalsOutSchema(BotAdminOutSchema):
+    rentals_next_cursor: int | None = None
+
+
+class BotRentalPageSchema(BaseModel):
+    items: list[BotRentalOutSchema]
+    next_cursor: int | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BotRentalsQuerySchema(BaseModel):
+    cursor: int | None = Field(default=None, ge=0)
+    limit: int = Field(default=50, ge=1, le=200)
+
+
 class CreateBotRentSchema(BaseModel):
     token: str
     months: Literal[1, 3, 6, 12]
@@ -1,6 +1,23 @@
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict
 
 
+class MetricSummarySchema(BaseModel):
+    min: float
+    avg: float
+    max: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MonitoringWindowSchema(BaseModel):
+    samples: int
+    metrics: dict[str, MetricSummarySchema]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class MonitoringOutSchema(BaseModel):
     cpu_usage_percent: float
     memory_total_mb: float
@@ -9,5 +26,11 @@ class MonitoringOutSchema(BaseModel):
     disk_total_mb: float
     disk_used_mb: float
     disk_percent: float
+    event_loop_lag_ms: float
+    process_rss_mb: float
+    process_cpu_percent: float
+    process_threads: int
+    sampled_at: datetime
+    windows: dict[str, MonitoringWindowSchema]
 
     model_config = ConfigDict(from_attributes=True)
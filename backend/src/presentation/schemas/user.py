@@ -1,7 +1,9 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from src.domain.user.entity import Role
+from src.domain.user.listing import UserListFilter, UserRelation
+from src.domain.user.value_object import TelegramId
 
 
 class CheckCodeSchema(BaseModel):
@@ -67,6 +69,62 @@ class UserAdminViewSchema(UserOutSchema):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserListQuerySchema(BaseModel):
+    cursor: int | None = Field(default=None, ge=0)
+    limit: int = Field(default=50, ge=1, le=200)
+    with_count: bool = False
+    include: list[UserRelation] = Field(default_factory=list)
+    role: Role | None = None
+    is_blocked: bool | None = None
+    is_deleted: bool | None = None
+    balance_min: int | None = None
+    balance_max: int | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+    def to_filter(self) -> UserListFilter:
+        return UserListFilter(
+            role=self.role,
+            is_blocked=self.is_blocked,
+            is_deleted=self.is_deleted,
+            balance_min=self.balance_min,
+            balance_max=self.balance_max,
+            created_from=self.created_from,
+            created_to=self.created_to,
+        )
+
+
+class UserSummarySchema(BaseModel):
+    id: int
+    created_at: datetime
+    telegram_id: int
+    role: Role
+    balance: int
+    is_deleted: bool
+    is_blocked: bool
+    blocked_until: datetime | None
+    referrer_id: int | None
+    total_bonus_received: int
+    blocks: list[BlockedUserOutSchema] | None = None
+    rentals: list[BotRentalOutSchema] | None = None
+    referrals: list[ReferralOutSchema] | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator('telegram_id', mode='before')
+    @classmethod
+    def unwrap_telegram_id(cls, value: object) -> object:
+        return value.to_raw() if isinstance(value, TelegramId) else value
+
+
+class UserPageSchema(BaseModel):
+    items: list[UserSummarySchema]
+    next_cursor: int | None
+    total: int | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class UpdateUserRole(BaseModel):
     role: Role
 
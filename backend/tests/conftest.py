@@ -0,0 +1,220 @@
+import argparse
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+import httpx
+import pytest
+from benchmarks.load_test import (
+    FIRST_USER_TELEGRAM_ID,
+    BenchmarkProvider,
+    RecordingBroker,
+    recreate_database,
+    seed,
+)
+from dishka import AsyncContainer, make_async_container
+from fakeredis import FakeServer
+from fastapi import FastAPI
+from pydantic import ValidationError
+from sqlalchemy import Connection, event, text
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from src.config import Config
+from src.infrastructure.database.postgresql import new_session_maker
+from src.infrastructure.taskiq.broker import BROKERS
+from src.ioc import AppProvider
+from src.main import create_app
+from taskiq import InMemoryBroker
+from taskiq.message import BrokerMessage
+
+SEED_USERS: int = 200
+SEED_BOTS: int = 10
+SEED_RENTALS_PER_USER: int = 2
+# Объем, при котором планировщик выбирает индекс, а не полный проход по таблице.
+BULK_USERS: int = 100_000
+
+BULK_SEED: tuple[str, ...] = (
+    f"""
+    INSERT INTO users (telegram_id, is_deleted, balance, role, referrer_id,
+                       total_bonus_received, created_at, updated_at)
+    SELECT {FIRST_USER_TELEGRAM_ID + SEED_USERS} + n, false, 1000, 'user', NULL,
+           0, now(), now()
+    FROM generate_series(0, {BULK_USERS - 1}) AS n
+    """,
+    """
+    INSERT INTO bot_rentals (user_id, bot_id, token, rented_until, is_active,
+                             created_at, updated_at)
+    SELECT u.id, b.id, 'bulk-' || u.id, now() + (u.id % 60) * interval '1 day',
+           u.id % 4 = 0, now(), now()
+    FROM users u
+    CROSS JOIN LATERAL (
+        SELECT id FROM bots ORDER BY id OFFSET u.id % (SELECT count(*) FROM bots)
+        LIMIT 1
+    ) b
+    WHERE u.role = 'user'
+    """,
+    """
+    INSERT INTO telegram_users (telegram_id, created_at, updated_at)
+    SELECT telegram_id, now(), now() FROM users
+    """,
+    """
+    INSERT INTO blocked_users (user_id, blocked_until, reason, blocked_by,
+                               created_at, updated_at)
+    SELECT u.id, now() + (u.id % 3 - 1) * interval '1 day', 'seed', a.id,
+           now(), now()
+    FROM users u, (SELECT id FROM users WHERE role = 'admin') a
+    WHERE u.id % 10 = 0
+    """,
+    """
+    INSERT INTO referrals (referrer_id, referral_id, invited_at, telegram_id,
+                           total_bonus, created_at, updated_at)
+    SELECT r.id, u.id, now(), u.telegram_id, 0, now(), now()
+    FROM users u JOIN users r ON r.id = u.id / 10
+    WHERE u.id % 10 <> 0 AND r.role = 'user'
+    """,
+)
+
+
+@pytest.fixture(scope='session')
+def anyio_backend() -> str:
+    return 'asyncio'
+
+
+@pytest.fixture(scope='session')
+def config() -> Config:
+    try:
+        return Config()
+    except ValidationError:
+        pytest.skip('Окружение приложения не настроено')
+
+
+@pytest.fixture
+def redis_server() -> FakeServer:
+    return FakeServer()
+
+
+class CapturingBroker(InMemoryBroker):
+    # В отличие от RecordingBroker сохраняет сами сообщения: тесты проверяют
+    # метки и аргументы отправленных задач.
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[BrokerMessage] = []
+
+    async def kick(self, message: BrokerMessage) -> None:
+        self.sent.append(message)
+
+
+@pytest.fixture
+def recording_broker() -> Iterator[RecordingBroker]:
+    # Задачи только учитываются, как в бенчмарке: RabbitMQ в тестах нет.
+    recorder = RecordingBroker()
+    tasks = [task for item in BROKERS for task in item.get_all_tasks().values()]
+    brokers = [task.broker for task in tasks]
+    for task in tasks:
+        task.broker = recorder
+    yield recorder
+    for task, broker in zip(tasks, brokers, strict=True):
+        task.broker = broker
+
+
+@asynccontextmanager
+async def open_api_client(
+    config: Config, redis_server: FakeServer
+) -> AsyncIterator[httpx.AsyncClient]:
+    # Приложение целиком, но Redis подменен на fakeredis, как в бенчмарке.
+    app: FastAPI = create_app()
+    await app.state.dishka_container.close()
+    container: AsyncContainer = make_async_container(
+        AppProvider(), BenchmarkProvider(redis_server), context={Config: config}
+    )
+    app.state.dishka_container = container
+
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url='http://test'
+        ) as client:
+            yield client
+    finally:
+        await container.close()
+
+
+@pytest.fixture
+async def api_client(
+    config: Config, redis_server: FakeServer
+) -> AsyncIterator[httpx.AsyncClient]:
+    async with open_api_client(config, redis_server) as client:
+        yield client
+
+
+@pytest.fixture(scope='session')
+async def postgres_config(config: Config) -> Config:
+    # Тесты работают в отдельной базе рядом с POSTGRES_DB и пропускаются,
+    # если Postgres недоступен.
+    database: str = f'{config.postgres.database}_test'
+    try:
+        await recreate_database(config, database)
+    except OSError:
+        pytest.skip('Postgres недоступен')
+
+    return config.model_copy(
+        update={'postgres': config.postgres.model_copy(update={'database': database})}
+    )
+
+
+@pytest.fixture(scope='session')
+async def seeded_config(postgres_config: Config) -> Config:
+    await seed(
+        postgres_config,
+        argparse.Namespace(
+            users=SEED_USERS,
+            bots=SEED_BOTS,
+            rentals_per_user=SEED_RENTALS_PER_USER,
+        ),
+    )
+
+    session_maker = new_session_maker(postgres_config.postgres)
+    engine: AsyncEngine = session_maker.kw['bind']
+    async with engine.begin() as connection:
+        # Массовая вставка дольше statement_timeout приложения.
+        await connection.execute(text('SET LOCAL statement_timeout = 0'))
+        for statement in BULK_SEED:
+            await connection.execute(text(statement))
+    async with engine.connect() as connection:
+        await connection.execution_options(isolation_level='AUTOCOMMIT')
+        await connection.execute(text('ANALYZE'))
+    await engine.dispose()
+
+    return postgres_config
+
+
+@pytest.fixture
+async def session_maker(
+    seeded_config: Config,
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    session_maker = new_session_maker(seeded_config.postgres)
+    yield session_maker
+    await session_maker.kw['bind'].dispose()
+
+
+@contextmanager
+def record_statements(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> Iterator[list[tuple[str, Any]]]:
+    statements: list[tuple[str, Any]] = []
+    sync_engine = session_maker.kw['bind'].sync_engine
+
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: tuple | None,
+        context: ExecutionContext | None,
+        many: bool,
+    ) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, 'before_cursor_execute', before_cursor_execute)
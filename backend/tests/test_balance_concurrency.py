@@ -0,0 +1,151 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.use_cases.admin.users.withdraw_money import WithdrawMoneyForUser
+from src.application.use_cases.user.bot.rent_bot import RentBotUseCase
+from src.domain.balance.exception import InsufficientFundsError
+from src.domain.bot.entity import BotEntity
+from src.domain.user.entity import UserEntity
+from src.domain.user.principal import UserPrincipal
+from src.infrastructure.database.models.bots import Bot
+from src.infrastructure.database.models.user import User
+from src.infrastructure.repositories.bot.sqlalchemy import SQLAlchemyBotRepository
+from src.infrastructure.repositories.rental.sqlalchemy import (
+    SQLAlchemyRentalRepository,
+)
+from src.infrastructure.repositories.user.sqlalchemy import SQLAlchemyUserRepository
+from src.presentation.schemas.bot import CreateBotRentSchema
+from src.presentation.schemas.user import UpdateBalance
+
+pytestmark = pytest.mark.anyio
+
+TELEGRAM_ID: int = 900_000_000
+PRICE: int = 100
+AFFORDABLE: int = 100
+OPERATIONS: int = 400
+
+
+@dataclass
+class NoopUserCache:
+    async def invalidate(self, telegram_id: int) -> None: ...
+
+
+@dataclass
+class NoopRentalEvents:
+    async def schedule(self, rental_id: int, rented_until: datetime) -> None: ...
+
+
+@dataclass
+class NoopReplicaRouter:
+    async def pin_primary(self, *telegram_ids: int) -> None: ...
+
+
+@dataclass
+class NoopAdminNotifier:
+    async def notify(self, text: str) -> None: ...
+
+
+async def rent(
+    session_maker: async_sessionmaker[AsyncSession],
+    principal: UserPrincipal,
+    bot_id: int,
+    n: int,
+) -> None:
+    async with session_maker() as session:
+        await RentBotUseCase(
+            _bot_repository=SQLAlchemyBotRepository(_session=session),
+            _user_repository=SQLAlchemyUserRepository(_session=session),
+            _bot_rental_repository=SQLAlchemyRentalRepository(_session=session),
+            _user_cache=NoopUserCache(),
+            _rental_events=NoopRentalEvents(),
+            _session=session,
+            _replica_router=NoopReplicaRouter(),
+        ).execute(
+            bot_id=bot_id,
+            principal=principal,
+            schema=CreateBotRentSchema(token=f'{n}:concurrency', months=1),
+        )
+
+
+async def withdraw(
+    session_maker: async_sessionmaker[AsyncSession], admin: UserPrincipal
+) -> None:
+    async with session_maker() as session:
+        await WithdrawMoneyForUser(
+            _session=session,
+            _user_repository=SQLAlchemyUserRepository(_session=session),
+            _user_cache=NoopUserCache(),
+            _admin_notifier=NoopAdminNotifier(),
+            _replica_router=NoopReplicaRouter(),
+        ).execute(
+            telegram_id=TELEGRAM_ID, admin=admin, schema=UpdateBalance(amount=PRICE)
+        )
+
+
+async def read_balance(session_maker: async_sessionmaker[AsyncSession]) -> int:
+    async with session_maker() as session:
+        return (
+            await session.execute(
+                select(User.balance).where(User.telegram_id == TELEGRAM_ID)
+            )
+        ).scalar_one()
+
+
+async def test_parallel_charges_never_overdraw(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_maker() as session:
+        user: UserEntity = UserEntity.create_user(telegram_id=TELEGRAM_ID)
+        user.deposit(amount=PRICE * AFFORDABLE)
+        session.add(User.from_entity(user))
+
+        bot = Bot.from_entity(
+            BotEntity.create_bot(
+                name='Concurrency bot', description='Тест баланса', price=PRICE
+            )
+        )
+        session.add(bot)
+        await session.commit()
+
+        # Списание от имени администратора проверяет только сумму, поэтому
+        # подойдет и сам пользователь.
+        principal: UserPrincipal = await SQLAlchemyUserRepository(
+            _session=session
+        ).get_principal_by_telegram_id(TELEGRAM_ID)
+
+    balances: list[int] = []
+    done = asyncio.Event()
+
+    async def watch_balance() -> None:
+        while not done.is_set():
+            balances.append(await read_balance(session_maker))
+            await asyncio.sleep(0.01)
+
+    watcher = asyncio.create_task(watch_balance())
+    try:
+        results = await asyncio.gather(
+            *(
+                rent(session_maker, principal, bot.id, n)
+                if n % 2
+                else withdraw(session_maker, principal)
+                for n in range(OPERATIONS)
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        done.set()
+        await watcher
+
+    unexpected = [
+        result
+        for result in results
+        if result is not None and not isinstance(result, InsufficientFundsError)
+    ]
+    assert not unexpected
+    assert sum(result is None for result in results) == AFFORDABLE
+    assert min(balances) >= 0
+    assert await read_balance(session_maker) == 0
@@ -0,0 +1,72 @@
+import re
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.use_cases.admin.bot.get_all_bots_with_rentals import (
+    GetAllBotsWithRentalsUseCase,
+    GetBotRentalsUseCase,
+)
+from src.domain.bot.admin_view import BotRentalPage, BotWithRentals
+from src.infrastructure.database.models.bots import BotRental
+from src.infrastructure.repositories.bot.sqlalchemy import SQLAlchemyBotRepository
+
+from tests.conftest import record_statements
+
+pytestmark = pytest.mark.anyio
+
+USERS_TABLE = re.compile(r'\busers\b')
+
+
+@pytest.mark.parametrize('rentals_limit', [1, 20, 200])
+async def test_bots_with_rentals_take_two_statements(
+    rentals_limit: int, session_maker: async_sessionmaker[AsyncSession]
+) -> None:
+    with record_statements(session_maker) as statements:
+        async with session_maker() as session:
+            bots: list[BotWithRentals] = await GetAllBotsWithRentalsUseCase(
+                _bot_repository=SQLAlchemyBotRepository(_session=session)
+            ).execute(rentals_limit=rentals_limit)
+
+    assert bots
+    assert len(statements) == 2
+    assert not [
+        statement for statement, _ in statements if USERS_TABLE.search(statement)
+    ]
+    for bot in bots:
+        assert len(bot.rentals) <= rentals_limit
+        if bot.rentals_next_cursor is not None:
+            assert len(bot.rentals) == rentals_limit
+            assert bot.rentals_next_cursor == bot.rentals[-1].id
+
+
+async def test_bot_rentals_pages_take_one_statement_each(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_maker() as session:
+        bots: list[BotWithRentals] = await GetAllBotsWithRentalsUseCase(
+            _bot_repository=SQLAlchemyBotRepository(_session=session)
+        ).execute(rentals_limit=1)
+        bot: BotWithRentals = next(bot for bot in bots if bot.rentals_next_cursor)
+        total: int = (
+            await session.execute(
+                select(func.count(BotRental.id)).where(BotRental.bot_id == bot.id)
+            )
+        ).scalar_one()
+
+    seen: list[int] = [rental.id for rental in bot.rentals]
+    cursor: int | None = bot.rentals_next_cursor
+
+    while cursor is not None:
+        with record_statements(session_maker) as statements:
+            async with session_maker() as session:
+                page: BotRentalPage = await GetBotRentalsUseCase(
+                    _bot_repository=SQLAlchemyBotRepository(_session=session)
+                ).execute(bot_id=bot.id, limit=200, cursor=cursor)
+
+        assert len(statements) == 1
+        assert not USERS_TABLE.search(statements[0][0])
+        seen.extend(rental.id for rental in page.items)
+        cursor = page.next_cursor
+
+    assert len(seen) == len(set(seen)) == total
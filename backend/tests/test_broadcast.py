@@ -0,0 +1,118 @@
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.domain.broadcast.entity import BroadcastEntity
+from src.infrastructure.cache.redis import InstrumentedConnectionPool, RedisCacheService
+from src.infrastructure.database.models.telegram_users import TelegramUser
+from src.infrastructure.repositories.broadcast.redis import RedisBroadcastRepository
+from src.infrastructure.repositories.telegram.sqlalchemy import (
+    SQLAlchemyTelegramRepository,
+)
+from src.infrastructure.taskiq import tasks
+from src.infrastructure.taskiq.tasks import BROADCAST_RETRY_SECONDS, run_broadcast
+
+from tests.conftest import CapturingBroker
+
+pytestmark = pytest.mark.anyio
+
+RECIPIENTS: int = 450
+
+
+class RecordingSender:
+    def __init__(self) -> None:
+        self.chat_ids: list[int] = []
+
+    async def copy_message(
+        self, chat_id: int, from_chat_id: int, message_id: int
+    ) -> bool:
+        self.chat_ids.append(chat_id)
+        return True
+
+
+class FlakyTelegramRepository(SQLAlchemyTelegramRepository):
+    # Третья выборка получателей падает, как при сбое соединения с Postgres.
+    calls: int = 0
+
+    async def get_recipients_batch(
+        self, after_id: int, limit: int
+    ) -> list[tuple[int, int]]:
+        FlakyTelegramRepository.calls += 1
+        if FlakyTelegramRepository.calls == 3:
+            raise ConnectionResetError('Соединение с Postgres разорвано')
+        return await super().get_recipients_batch(after_id=after_id, limit=limit)
+
+
+@pytest.fixture
+async def cache_service(redis_server: FakeServer) -> AsyncIterator[RedisCacheService]:
+    cache_service = RedisCacheService(
+        pool=InstrumentedConnectionPool(
+            connection_class=FakeConnection,
+            server=redis_server,
+            decode_responses=True,
+        )
+    )
+    yield cache_service
+    await cache_service.close()
+
+
+@pytest.fixture
+def broker(monkeypatch: pytest.MonkeyPatch) -> CapturingBroker:
+    broker = CapturingBroker()
+    monkeypatch.setattr(run_broadcast, 'broker', broker)
+    monkeypatch.setattr(tasks, 'SQLAlchemyTelegramRepository', FlakyTelegramRepository)
+    monkeypatch.setattr(FlakyTelegramRepository, 'calls', 0)
+    return broker
+
+
+async def test_failed_chunk_is_retried_until_broadcast_finishes(
+    session_maker: async_sessionmaker[AsyncSession],
+    cache_service: RedisCacheService,
+    broker: CapturingBroker,
+) -> None:
+    async with session_maker() as session:
+        last_id: int = await session.scalar(select(func.max(TelegramUser.id)))
+        expected: list[int] = list(
+            await session.scalars(
+                select(TelegramUser.telegram_id)
+                .where(TelegramUser.id > last_id - RECIPIENTS)
+                .order_by(TelegramUser.id)
+            )
+        )
+
+    repository = RedisBroadcastRepository(_cache_service=cache_service)
+    # Курсор у конца таблицы, чтобы не рассылать всем получателям из сида.
+    broadcast: BroadcastEntity = await repository.add(
+        BroadcastEntity(
+            from_chat_id=1, message_id=1, cursor=last_id - RECIPIENTS, total=RECIPIENTS
+        )
+    )
+    sender = RecordingSender()
+    context = SimpleNamespace(
+        state=SimpleNamespace(
+            session_maker=session_maker,
+            cache_service=cache_service,
+            telegram_sender=sender,
+        )
+    )
+
+    await run_broadcast.original_func(broadcast_id=broadcast.id, context=context)
+
+    (retry,) = broker.sent
+    assert float(retry.labels['delay']) == BROADCAST_RETRY_SECONDS
+    kwargs: dict = broker.formatter.loads(retry.message).kwargs
+    assert kwargs == {'broadcast_id': broadcast.id, 'attempt': 1}
+
+    # Задержку RabbitMQ не воспроизводим: повтор выполняется сразу.
+    broker.sent.clear()
+    await run_broadcast.original_func(**kwargs, context=context)
+
+    finished: BroadcastEntity = await repository.get(broadcast_id=broadcast.id)
+    assert finished.is_finished
+    assert broker.sent == []
+    assert sender.chat_ids == expected
+    assert finished.sent == len(expected)
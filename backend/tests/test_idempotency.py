@@ -0,0 +1,162 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
+from fastapi import Request
+from pydantic import BaseModel
+from redis.exceptions import ConnectionError as RedisConnectionError
+from src.domain.user.principal import UserPrincipal
+from src.domain.user.value_object import TelegramId
+from src.infrastructure.cache.base import BaseIdempotencyStore
+from src.infrastructure.cache.idempotency import RedisIdempotencyStore
+from src.infrastructure.cache.redis import InstrumentedConnectionPool, RedisCacheService
+from src.presentation.decorators import idempotent as idempotent_module
+from src.presentation.decorators.idempotent import (
+    COMPLETE_ATTEMPTS,
+    IDEMPOTENCY_HEADER,
+    idempotent,
+)
+
+pytestmark = pytest.mark.anyio
+
+USER = UserPrincipal(id=1, telegram_id=TelegramId(1_000_000))
+
+
+class Amount(BaseModel):
+    amount: int
+
+
+class Balance(BaseModel):
+    balance: int
+
+
+@dataclass
+class FlakyIdempotencyStore(RedisIdempotencyStore):
+    complete_failures: int = 0
+
+    async def complete(self, key: str, response: str) -> None:
+        if self.complete_failures > 0:
+            self.complete_failures -= 1
+            raise RedisConnectionError('Redis недоступен')
+        await super().complete(key, response)
+
+
+@pytest.fixture
+async def cache_service(redis_server: FakeServer) -> AsyncIterator[RedisCacheService]:
+    cache_service = RedisCacheService(
+        pool=InstrumentedConnectionPool(
+            connection_class=FakeConnection,
+            server=redis_server,
+            decode_responses=True,
+        )
+    )
+    yield cache_service
+    await cache_service.close()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(idempotent_module, 'COMPLETE_RETRY_SECONDS', 0.0)
+
+
+def make_request(key: str) -> Request:
+    return Request(
+        {
+            'type': 'http',
+            'method': 'PATCH',
+            'path': '/',
+            'headers': [(IDEMPOTENCY_HEADER.lower().encode(), key.encode())],
+        }
+    )
+
+
+def make_endpoint(calls: list[int]) -> Callable[..., Awaitable[Balance]]:
+    @idempotent(scope='test', response_model=Balance, payload_params=('schema',))
+    async def endpoint(
+        request: Request,
+        schema: Amount,
+        user: UserPrincipal,
+        idempotency_store: BaseIdempotencyStore,
+    ) -> Balance:
+        calls.append(schema.amount)
+        return Balance(balance=sum(calls))
+
+    return endpoint
+
+
+async def test_retry_returns_saved_response(cache_service: RedisCacheService) -> None:
+    store = RedisIdempotencyStore(_cache_service=cache_service)
+    calls: list[int] = []
+    endpoint = make_endpoint(calls)
+
+    for _ in range(3):
+        response: Balance = await endpoint(
+            request=make_request('k1'),
+            schema=Amount(amount=10),
+            user=USER,
+            idempotency_store=store,
+        )
+        assert response == Balance(balance=10)
+
+    assert calls == [10]
+
+
+async def test_failed_complete_is_retried_and_not_rerun(
+    cache_service: RedisCacheService,
+) -> None:
+    store = FlakyIdempotencyStore(
+        _cache_service=cache_service, complete_failures=COMPLETE_ATTEMPTS - 1
+    )
+    calls: list[int] = []
+    endpoint = make_endpoint(calls)
+
+    first: Balance = await endpoint(
+        request=make_request('k2'),
+        schema=Amount(amount=10),
+        user=USER,
+        idempotency_store=store,
+    )
+    retry: Balance = await endpoint(
+        request=make_request('k2'),
+        schema=Amount(amount=10),
+        user=USER,
+        idempotency_store=store,
+    )
+
+    assert first == retry == Balance(balance=10)
+    assert calls == [10]
+
+
+async def test_unsaved_response_keeps_key_in_progress(
+    cache_service: RedisCacheService, caplog: pytest.LogCaptureFixture
+) -> None:
+    store = FlakyIdempotencyStore(
+        _cache_service=cache_service, complete_failures=COMPLETE_ATTEMPTS
+    )
+    calls: list[int] = []
+    endpoint = make_endpoint(calls)
+
+    # Операция закоммичена, поэтому клиент получает ответ, а не ошибку Redis.
+    response: Balance = await endpoint(
+        request=make_request('k3'),
+        schema=Amount(amount=10),
+        user=USER,
+        idempotency_store=store,
+    )
+
+    assert response == Balance(balance=10)
+    assert 'не сохранен' in caplog.text
+    assert await cache_service.client.hget('idempotency:test:1000000:k3', 'status') == (
+        'in_progress'
+    )
+
+
+def test_missing_parameters_fail_at_decoration() -> None:
+    async def endpoint(request: Request, user: UserPrincipal) -> Balance: ...
+
+    with pytest.raises(TypeError, match='idempotency_store, schema'):
+        idempotent(scope='test', response_model=Balance, payload_params=('schema',))(
+            endpoint
+        )
@@ -0,0 +1,191 @@
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+import asyncpg
+import orjson
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.config import Config
+from src.const import MOSCOW_TZ
+from src.domain.user.entity import Role
+from src.domain.user.listing import UserListFilter, UserRelation
+from src.infrastructure.database.models.bots import Bot
+from src.infrastructure.database.models.user import User
+from src.infrastructure.repositories.bot.sqlalchemy import SQLAlchemyBotRepository
+from src.infrastructure.repositories.referral.sqlalchemy import (
+    SQLAlchemyReferralRepository,
+)
+from src.infrastructure.repositories.rental.sqlalchemy import (
+    SQLAlchemyRentalRepository,
+)
+from src.infrastructure.repositories.telegram.sqlalchemy import (
+    SQLAlchemyTelegramRepository,
+)
+from src.infrastructure.repositories.user.blocked_user import BlockedUserRepository
+from src.infrastructure.repositories.user.sqlalchemy import SQLAlchemyUserRepository
+
+from tests.conftest import BULK_USERS, record_statements
+
+pytestmark = pytest.mark.anyio
+
+LARGE_TABLES: frozenset[str] = frozenset(
+    {'users', 'bot_rentals', 'blocked_users', 'telegram_users', 'referrals'}
+)
+
+
+@dataclass(frozen=True)
+class Target:
+    user_id: int
+    telegram_id: int
+    bot_id: int
+    rental_id: int
+
+
+QueryCase = Callable[[AsyncSession, Target], Awaitable[Any]]
+
+# Горячие запросы репозиториев: каждый должен находить строки по индексу.
+# Полные выгрузки (get_all_*, count_*) и вставки сюда не входят.
+QUERY_CASES: dict[str, QueryCase] = {
+    'user.get_principal_by_telegram_id': lambda s, t: SQLAlchemyUserRepository(
+        _session=s
+    ).get_principal_by_telegram_id(t.telegram_id),
+    'user.get_user_by_telegram_id': lambda s, t: SQLAlchemyUserRepository(
+        _session=s
+    ).get_user_by_telegram_id(t.telegram_id),
+    'user.get_full_user_info_for_admin': lambda s, t: SQLAlchemyUserRepository(
+        _session=s
+    ).get_full_user_info_for_admin(t.telegram_id),
+    'user.get_user_with_rentals': lambda s, t: SQLAlchemyUserRepository(
+        _session=s
+    ).get_user_with_rentals(t.user_id),
+    'user.get_users_with_relations': lambda s, t: SQLAlchemyUserRepository(
+        _session=s
+    ).get_users_with_relations([t.user_id], frozenset(UserRelation)),
+    'user.get_user_summaries': lambda s, t: SQLAlchemyUserRepository(
+        _session=s
+    ).get_user_summaries(UserListFilter(role=Role.USER), limit=50, after_id=t.user_id),
+    'user.change_balance': lambda s, t: SQLAlchemyUserRepository(
+        _session=s
+    ).change_balance(t.telegram_id, -1),
+    'rental.get_by_id': lambda s, t: SQLAlchemyRentalRepository(_session=s).get_by_id(
+        t.rental_id
+    ),
+    'rental.get_all_by_user_id': lambda s, t: SQLAlchemyRentalRepository(
+        _session=s
+    ).get_all_by_user_id(t.user_id),
+    'rental.deactivate_expired': lambda s, t: SQLAlchemyRentalRepository(
+        _session=s
+    ).deactivate_expired(datetime.now(tz=MOSCOW_TZ), limit=100),
+    'rental.get_expiring': lambda s, t: SQLAlchemyRentalRepository(
+        _session=s
+    ).get_expiring(
+        datetime.now(tz=MOSCOW_TZ),
+        datetime.now(tz=MOSCOW_TZ) + timedelta(days=1),
+        after_id=0,
+        limit=100,
+    ),
+    'rental.deactivate_expired_by_id': lambda s, t: SQLAlchemyRentalRepository(
+        _session=s
+    ).deactivate_expired_by_id(t.rental_id, datetime.now(tz=MOSCOW_TZ)),
+    'rental.get_expiring_by_id': lambda s, t: SQLAlchemyRentalRepository(
+        _session=s
+    ).get_expiring_by_id(t.rental_id),
+    'bot.get_bot_rentals': lambda s, t: SQLAlchemyBotRepository(
+        _session=s
+    ).get_bot_rentals(t.bot_id, limit=50, after_id=t.rental_id),
+    'blocked.get_active_block_by_user_id': lambda s, t: BlockedUserRepository(
+        _session=s
+    ).get_active_block_by_user_id(t.user_id),
+    'blocked.get_all_by_user_id': lambda s, t: BlockedUserRepository(
+        _session=s
+    ).get_all_by_user_id(t.user_id),
+    'telegram.get_recipients_batch': lambda s, t: SQLAlchemyTelegramRepository(
+        _session=s
+    ).get_recipients_batch(after_id=BULK_USERS // 2, limit=100),
+    'referral.get_referrals_by_referrer': lambda s, t: SQLAlchemyReferralRepository(
+        _session=s
+    ).get_referrals_by_referrer(t.user_id),
+}
+
+
+def iter_plan_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get('Plans', []):
+        yield from iter_plan_nodes(child)
+
+
+@pytest.fixture
+async def target(session_maker: async_sessionmaker[AsyncSession]) -> Target:
+    async with session_maker() as session:
+        user = (
+            await session.execute(
+                select(User.id, User.telegram_id)
+                .where(User.role == Role.USER, User.id % 10 == 0)
+                .order_by(User.id)
+                .offset(BULK_USERS // 20)
+                .limit(1)
+            )
+        ).one()
+        bot_id: int = (
+            await session.execute(select(Bot.id).order_by(Bot.id).limit(1))
+        ).scalar_one()
+
+    async with session_maker() as session:
+        rentals = await SQLAlchemyRentalRepository(_session=session).get_all_by_user_id(
+            user.id
+        )
+
+    return Target(
+        user_id=user.id,
+        telegram_id=user.telegram_id,
+        bot_id=bot_id,
+        rental_id=rentals[0].id,
+    )
+
+
+@pytest.mark.parametrize('case', QUERY_CASES)
+async def test_query_uses_index(
+    case: str,
+    seeded_config: Config,
+    session_maker: async_sessionmaker[AsyncSession],
+    target: Target,
+) -> None:
+    with record_statements(session_maker) as statements:
+        async with session_maker() as session:
+            # Изменяющие запросы откатываются при закрытии сессии.
+            await QUERY_CASES[case](session, target)
+
+    planned = [
+        (statement, parameters)
+        for statement, parameters in statements
+        if statement.lstrip().split(None, 1)[0].upper() in {'SELECT', 'UPDATE', 'WITH'}
+    ]
+    assert planned, f'{case} не выполнил ни одного запроса'
+
+    postgres = seeded_config.postgres
+    connection = await asyncpg.connect(
+        host=postgres.host,
+        port=postgres.port,
+        user=postgres.login,
+        password=postgres.password,
+        database=postgres.database,
+    )
+    try:
+        for statement, parameters in planned:
+            plan = orjson.loads(
+                await connection.fetchval(
+                    f'EXPLAIN (FORMAT JSON) {statement}', *(parameters or ())
+                )
+            )
+            seq_scans: list[str] = [
+                node['Relation Name']
+                for node in iter_plan_nodes(plan[0]['Plan'])
+                if node['Node Type'] == 'Seq Scan'
+                and node['Relation Name'] in LARGE_TABLES
+            ]
+            assert not seq_scans, f'{case}: Seq Scan по {seq_scans}\n{statement}'
+    finally:
+        await connection.close()
@@ -0,0 +1,53 @@
+import httpx
+import pytest
+from fakeredis import FakeServer
+from fastapi import Request
+from src.infrastructure.cache.base import BaseRateLimiter, RateLimit
+from src.presentation.controllers.v1.users.auth import REFRESH_TOKEN_PER_IP
+from src.presentation.decorators.rate_limit import rate_limit
+
+pytestmark = pytest.mark.anyio
+
+REFRESH_TOKEN_URL: str = '/api/v1/refresh-token'
+
+
+async def test_limit_exceeded_returns_429_with_retry_after(
+    api_client: httpx.AsyncClient,
+) -> None:
+    for _ in range(REFRESH_TOKEN_PER_IP.limit):
+        response = await api_client.post(REFRESH_TOKEN_URL)
+        assert response.status_code == 401
+
+    response = await api_client.post(REFRESH_TOKEN_URL)
+
+    assert response.status_code == 429
+    retry_after = int(response.headers['Retry-After'])
+    assert 0 < retry_after <= REFRESH_TOKEN_PER_IP.window_seconds
+
+
+async def test_redis_failure_lets_requests_through(
+    api_client: httpx.AsyncClient, redis_server: FakeServer
+) -> None:
+    redis_server.connected = False
+
+    for _ in range(REFRESH_TOKEN_PER_IP.limit + 5):
+        response = await api_client.post(REFRESH_TOKEN_URL)
+        assert response.status_code == 401
+
+
+def test_missing_parameters_fail_at_decoration() -> None:
+    async def endpoint(request: Request) -> None: ...
+
+    with pytest.raises(TypeError, match='rate_limiter'):
+        rate_limit(scope='test', per_ip=RateLimit(limit=1, window_seconds=1))(endpoint)
+
+
+def test_telegram_id_source_is_required() -> None:
+    async def endpoint(request: Request, rate_limiter: BaseRateLimiter) -> None: ...
+
+    with pytest.raises(TypeError, match='schema'):
+        rate_limit(
+            scope='test',
+            per_telegram_id=RateLimit(limit=1, window_seconds=1),
+            telegram_id_from='schema',
+        )(endpoint)
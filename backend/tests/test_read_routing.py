@@ -0,0 +1,226 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from benchmarks.load_test import (
+    ADMIN_TELEGRAM_ID,
+    FIRST_USER_TELEGRAM_ID,
+    RecordingBroker,
+    recreate_database,
+)
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
+from sqlalchemy import URL, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from src.application.services.jwt import JWTServiceImpl
+from src.application.use_cases.system.expire_rentals import ExpireRentalUseCase
+from src.config import Config, PostgresConfig
+from src.const import MOSCOW_TZ
+from src.infrastructure.cache.redis import InstrumentedConnectionPool, RedisCacheService
+from src.infrastructure.cache.user import TwoTierUserCacheService
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.bots import BotRental
+from src.infrastructure.database.models.user import User
+from src.infrastructure.database.postgresql import new_session_maker
+from src.infrastructure.database.routing import ReadReplicaRouter
+from src.infrastructure.repositories.rental.sqlalchemy import (
+    SQLAlchemyRentalRepository,
+)
+
+from tests.conftest import open_api_client
+
+pytestmark = pytest.mark.anyio
+
+PIN_SECONDS: int = 1
+
+
+def database_url(postgres: PostgresConfig, database: str) -> URL:
+    return URL.create(
+        'postgresql+asyncpg',
+        username=postgres.login,
+        password=postgres.password,
+        host=postgres.host,
+        port=postgres.port,
+        database=database,
+    )
+
+
+@pytest.fixture(scope='session')
+async def replica_config(seeded_config: Config) -> Config:
+    # Пустая база с той же схемой изображает отставшую реплику: прочитанное
+    # с нее видно по отсутствию данных, которые есть на primary.
+    postgres: PostgresConfig = seeded_config.postgres
+    database: str = f'{postgres.database}_replica'
+    await recreate_database(seeded_config, database)
+
+    replica_url: URL = database_url(postgres, database)
+    session_maker = new_session_maker(postgres, database_uri=replica_url)
+    engine: AsyncEngine = session_maker.kw['bind']
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+    return seeded_config.model_copy(
+        update={
+            'postgres': postgres.model_copy(
+                update={
+                    'replica_dsn': replica_url.render_as_string(hide_password=False),
+                    'read_your_writes_seconds': PIN_SECONDS,
+                }
+            )
+        }
+    )
+
+
+@pytest.fixture
+async def client(
+    replica_config: Config,
+    redis_server: FakeServer,
+    recording_broker: RecordingBroker,
+) -> AsyncIterator[httpx.AsyncClient]:
+    async with open_api_client(replica_config, redis_server) as client:
+        yield client
+
+
+@pytest.fixture
+async def worker_cache(redis_server: FakeServer) -> AsyncIterator[RedisCacheService]:
+    cache_service = RedisCacheService(
+        pool=InstrumentedConnectionPool(
+            connection_class=FakeConnection,
+            server=redis_server,
+            decode_responses=True,
+        )
+    )
+    yield cache_service
+    await cache_service.close()
+
+
+@pytest.fixture
+def worker_router(
+    replica_config: Config, worker_cache: RedisCacheService
+) -> ReadReplicaRouter:
+    # Как в воркере taskiq: сессии реплики не нужны, только закрепление.
+    return ReadReplicaRouter(
+        _cache_service=worker_cache,
+        _replica_session_maker=None,
+        pin_seconds=replica_config.postgres.read_your_writes_seconds,
+    )
+
+
+def cookie(config: Config, telegram_id: int) -> dict[str, str]:
+    token, _ = JWTServiceImpl(config=config).create_tokens(
+        data={'sub': str(telegram_id)}
+    )
+    return {'Cookie': f'access_token={token}'}
+
+
+async def active_rental_ids(
+    session_maker: async_sessionmaker[AsyncSession], telegram_id: int
+) -> list[int]:
+    async with session_maker() as session:
+        result = await session.scalars(
+            select(BotRental.id)
+            .join(User, User.id == BotRental.user_id)
+            .where(User.telegram_id == telegram_id, BotRental.is_active)
+            .order_by(BotRental.id)
+        )
+        return list(result.all())
+
+
+async def profile_rentals(
+    client: httpx.AsyncClient, config: Config, telegram_id: int
+) -> list[dict]:
+    response = await client.get(
+        '/api/v1/users/profile/rentals', headers=cookie(config, telegram_id)
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_reads_go_to_replica_without_writes(
+    client: httpx.AsyncClient, replica_config: Config
+) -> None:
+    telegram_id: int = FIRST_USER_TELEGRAM_ID + 10
+
+    assert await profile_rentals(client, replica_config, telegram_id) == []
+
+
+async def test_user_write_pins_only_that_user(
+    client: httpx.AsyncClient,
+    replica_config: Config,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    writer: int = FIRST_USER_TELEGRAM_ID + 11
+    reader: int = FIRST_USER_TELEGRAM_ID + 12
+    rental_id, *_ = await active_rental_ids(session_maker, writer)
+
+    response = await client.post(
+        f'/api/v1/rentals/{rental_id}/stop', headers=cookie(replica_config, writer)
+    )
+    assert response.status_code == 200, response.text
+
+    rentals: list[dict] = await profile_rentals(client, replica_config, writer)
+    assert rental_id in {rental['id'] for rental in rentals}
+    assert await profile_rentals(client, replica_config, reader) == []
+
+    # После окончания закрепления чтение снова уходит на реплику.
+    await asyncio.sleep(PIN_SECONDS + 0.5)
+    assert await profile_rentals(client, replica_config, writer) == []
+
+
+async def test_admin_write_pins_target_user(
+    client: httpx.AsyncClient, replica_config: Config
+) -> None:
+    telegram_id: int = FIRST_USER_TELEGRAM_ID + 13
+    admin: dict[str, str] = cookie(replica_config, ADMIN_TELEGRAM_ID)
+
+    response = await client.patch(
+        f'/api/v1/users/{telegram_id}/wallet/deposit',
+        json={'amount': 10},
+        headers=admin,
+    )
+    assert response.status_code == 200, response.text
+
+    # Пользователь видит свое пополнение, хотя запрос делал администратор.
+    assert await profile_rentals(client, replica_config, telegram_id) != []
+
+    response = await client.get(f'/api/v1/users/{telegram_id}', headers=admin)
+    assert response.status_code == 200, response.text
+
+
+async def test_task_write_pins_affected_user(
+    client: httpx.AsyncClient,
+    replica_config: Config,
+    session_maker: async_sessionmaker[AsyncSession],
+    worker_cache: RedisCacheService,
+    worker_router: ReadReplicaRouter,
+) -> None:
+    telegram_id: int = FIRST_USER_TELEGRAM_ID + 14
+    other: int = FIRST_USER_TELEGRAM_ID + 15
+    rental_id, *_ = await active_rental_ids(session_maker, telegram_id)
+
+    async with session_maker() as session:
+        await session.execute(
+            update(BotRental)
+            .where(BotRental.id == rental_id)
+            .values(rented_until=datetime.now(tz=MOSCOW_TZ) - timedelta(minutes=1))
+        )
+        await session.commit()
+
+    async with session_maker() as session:
+        use_case = ExpireRentalUseCase(
+            _rental_repository=SQLAlchemyRentalRepository(_session=session),
+            _user_cache=TwoTierUserCacheService(_cache_service=worker_cache),
+            _session=session,
+            _replica_router=worker_router,
+        )
+        assert await use_case.execute(rental_id=rental_id)
+
+    # Запрос администратора по пользователю из пути тоже читает с primary.
+    admin: dict[str, str] = cookie(replica_config, ADMIN_TELEGRAM_ID)
+    response = await client.get(f'/api/v1/users/{telegram_id}', headers=admin)
+    assert response.status_code == 200, response.text
+    response = await client.get(f'/api/v1/users/{other}', headers=admin)
+    assert response.status_code == 404, response.text
@@ -0,0 +1,247 @@
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+import pytest
+from benchmarks.load_test import FIRST_USER_TELEGRAM_ID
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.use_cases.system.expire_rentals import (
+    ExpireRentalUseCase,
+    RemindExpiringRentalUseCase,
+)
+from src.const import MOSCOW_TZ
+from src.infrastructure.cache.redis import InstrumentedConnectionPool, RedisCacheService
+from src.infrastructure.cache.user import TwoTierUserCacheService
+from src.infrastructure.database.models.bots import BotRental
+from src.infrastructure.database.models.user import User
+from src.infrastructure.database.routing import ReadReplicaRouter
+from src.infrastructure.repositories.rental.sqlalchemy import (
+    SQLAlchemyRentalRepository,
+)
+from src.infrastructure.taskiq.delay import (
+    MAX_DELAY_SECONDS,
+    kick_at,
+    reschedule_if_early,
+)
+from taskiq.message import BrokerMessage
+
+from tests.conftest import CapturingBroker
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingSender:
+    def __init__(self) -> None:
+        self.messages: list[tuple[int, str]] = []
+
+    async def send_message(self, chat_id: int, text: str) -> bool:
+        self.messages.append((chat_id, text))
+        return True
+
+
+broker = CapturingBroker()
+
+
+@broker.task
+async def probe(rental_id: int, eta: str) -> None: ...
+
+
+@pytest.fixture(autouse=True)
+def clear_sent() -> None:
+    broker.sent.clear()
+
+
+@pytest.fixture
+async def cache_service(redis_server: FakeServer) -> AsyncIterator[RedisCacheService]:
+    cache_service = RedisCacheService(
+        pool=InstrumentedConnectionPool(
+            connection_class=FakeConnection,
+            server=redis_server,
+            decode_responses=True,
+        )
+    )
+    yield cache_service
+    await cache_service.close()
+
+
+def delay_label(message: BrokerMessage) -> float | None:
+    delay: str | None = message.labels.get('delay')
+    return None if delay is None else float(delay)
+
+
+def kicked_kwargs(message: BrokerMessage) -> dict:
+    return broker.formatter.loads(message.message).kwargs
+
+
+async def test_far_eta_is_capped_to_one_hop() -> None:
+    eta: datetime = datetime.now(tz=MOSCOW_TZ) + timedelta(days=90)
+
+    await kick_at(probe, eta, rental_id=1)
+
+    (message,) = broker.sent
+    assert delay_label(message) == MAX_DELAY_SECONDS
+    # Задача получает исходный срок и при раннем срабатывании уйдет на новый круг.
+    assert kicked_kwargs(message) == {'rental_id': 1, 'eta': eta.isoformat()}
+
+
+async def test_near_eta_is_delayed_exactly() -> None:
+    eta: datetime = datetime.now(tz=MOSCOW_TZ) + timedelta(hours=1)
+
+    await kick_at(probe, eta, rental_id=1)
+
+    (message,) = broker.sent
+    assert delay_label(message) == pytest.approx(60 * 60, abs=5)
+
+
+async def test_due_eta_is_sent_without_delay() -> None:
+    await kick_at(probe, datetime.now(tz=MOSCOW_TZ), rental_id=1)
+
+    (message,) = broker.sent
+    assert delay_label(message) is None
+
+
+async def test_delay_does_not_leak_into_next_kick() -> None:
+    now: datetime = datetime.now(tz=MOSCOW_TZ)
+
+    await kick_at(probe, now + timedelta(hours=1), rental_id=1)
+    await kick_at(probe, now, rental_id=2)
+
+    delayed, due = broker.sent
+    assert delay_label(delayed) is not None
+    assert delay_label(due) is None
+    assert 'delay' not in probe.labels
+
+
+async def test_early_task_is_rescheduled() -> None:
+    eta: datetime = datetime.now(tz=MOSCOW_TZ) + timedelta(days=40)
+
+    assert await reschedule_if_early(probe, eta.isoformat(), rental_id=1)
+
+    (message,) = broker.sent
+    assert delay_label(message) == MAX_DELAY_SECONDS
+    assert kicked_kwargs(message) == {'rental_id': 1, 'eta': eta.isoformat()}
+
+
+async def test_due_task_is_not_rescheduled() -> None:
+    eta: datetime = datetime.now(tz=MOSCOW_TZ) - timedelta(seconds=1)
+
+    assert not await reschedule_if_early(probe, eta.isoformat(), rental_id=1)
+    assert broker.sent == []
+
+
+async def rental_of(
+    session_maker: async_sessionmaker[AsyncSession], telegram_id: int
+) -> BotRental:
+    async with session_maker() as session:
+        rental: BotRental = await session.scalar(
+            select(BotRental)
+            .join(User, User.id == BotRental.user_id)
+            .where(User.telegram_id == telegram_id)
+            .order_by(BotRental.id)
+            .limit(1)
+        )
+        return rental
+
+
+async def set_rental(
+    session_maker: async_sessionmaker[AsyncSession],
+    rental_id: int,
+    rented_until: datetime,
+    is_active: bool,
+) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            update(BotRental)
+            .where(BotRental.id == rental_id)
+            .values(rented_until=rented_until, is_active=is_active)
+        )
+        await session.commit()
+
+
+async def expire(
+    session_maker: async_sessionmaker[AsyncSession],
+    cache_service: RedisCacheService,
+    rental_id: int,
+) -> bool:
+    async with session_maker() as session:
+        return await ExpireRentalUseCase(
+            _rental_repository=SQLAlchemyRentalRepository(_session=session),
+            _user_cache=TwoTierUserCacheService(_cache_service=cache_service),
+            _session=session,
+            _replica_router=ReadReplicaRouter(
+                _cache_service=cache_service,
+                _replica_session_maker=None,
+                pin_seconds=1,
+            ),
+        ).execute(rental_id=rental_id)
+
+
+async def remind(
+    session_maker: async_sessionmaker[AsyncSession],
+    cache_service: RedisCacheService,
+    sender: RecordingSender,
+    rental_id: int,
+    rented_until: datetime,
+) -> bool:
+    async with session_maker() as session:
+        return await RemindExpiringRentalUseCase(
+            _rental_repository=SQLAlchemyRentalRepository(_session=session),
+            _cache_service=cache_service,
+            _sender=sender,
+        ).execute(rental_id=rental_id, rented_until=rented_until)
+
+
+async def test_expire_skips_stopped_and_extended_rentals(
+    session_maker: async_sessionmaker[AsyncSession], cache_service: RedisCacheService
+) -> None:
+    rental: BotRental = await rental_of(session_maker, FIRST_USER_TELEGRAM_ID + 20)
+    now: datetime = datetime.now(tz=MOSCOW_TZ)
+
+    # Аренду остановили до срабатывания задачи.
+    await set_rental(session_maker, rental.id, now - timedelta(minutes=1), False)
+    assert not await expire(session_maker, cache_service, rental.id)
+
+    # Аренду продлили: задача старого срока не должна ее выключить.
+    await set_rental(session_maker, rental.id, now + timedelta(days=30), True)
+    assert not await expire(session_maker, cache_service, rental.id)
+    assert (await rental_of(session_maker, FIRST_USER_TELEGRAM_ID + 20)).is_active
+
+    await set_rental(session_maker, rental.id, now - timedelta(minutes=1), True)
+    assert await expire(session_maker, cache_service, rental.id)
+    assert not (await rental_of(session_maker, FIRST_USER_TELEGRAM_ID + 20)).is_active
+
+
+async def test_remind_skips_stopped_and_extended_rentals(
+    session_maker: async_sessionmaker[AsyncSession], cache_service: RedisCacheService
+) -> None:
+    telegram_id: int = FIRST_USER_TELEGRAM_ID + 21
+    rental: BotRental = await rental_of(session_maker, telegram_id)
+    rented_until: datetime = (datetime.now(tz=MOSCOW_TZ) + timedelta(days=3)).replace(
+        microsecond=0
+    )
+    sender = RecordingSender()
+
+    await set_rental(session_maker, rental.id, rented_until, False)
+    assert not await remind(
+        session_maker, cache_service, sender, rental.id, rented_until
+    )
+
+    # Напоминание запланировано на прежний срок, а аренду уже продлили.
+    await set_rental(session_maker, rental.id, rented_until, True)
+    assert not await remind(
+        session_maker,
+        cache_service,
+        sender,
+        rental.id,
+        rented_until - timedelta(days=30),
+    )
+    assert sender.messages == []
+
+    # Повторная доставка того же сообщения не шлет напоминание второй раз.
+    assert await remind(session_maker, cache_service, sender, rental.id, rented_until)
+    assert not await remind(
+        session_maker, cache_service, sender, rental.id, rented_until
+    )
+    assert [chat_id for chat_id, _ in sender.messages] == [telegram_id]